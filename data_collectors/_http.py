@@ -0,0 +1,42 @@
+"""
+HTTP session shared by every collector.
+
+One requests.Session per process keeps TCP/TLS connections to the data APIs
+(FRED, Treasury, BLS, multpl, ...) alive between collectors, instead of each
+collector instance opening its own pool.
+"""
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Connections kept per host; sized for the concurrent FRED series fetches
+POOL_SIZE = 32
+
+# Transport-level retries for transient upstream status codes. Connection and
+# read errors are not retried here: make_request retries those with its own
+# backoff. Once these status retries are exhausted the adapter raises RetryError,
+# which make_request does not retry again, so the two levels never multiply.
+RETRY_TOTAL = 3
+RETRY_BACKOFF_FACTOR = 0.3
+RETRY_STATUS_CODES = (429, 502, 503, 504)
+
+
+def _build_session() -> requests.Session:
+    """Create the pooled session with retrying HTTPS adapter."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=POOL_SIZE,
+        pool_maxsize=POOL_SIZE,
+        max_retries=Retry(
+            total=RETRY_TOTAL,
+            connect=0,
+            read=0,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            status_forcelist=RETRY_STATUS_CODES
+        )
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+SESSION = _build_session()
@@ -0,0 +1,274 @@
+"""
+Yield-to-maturity solvers, optionally compiled with numba.
+
+Both the pre-tax and after-tax yields are found with Newton-Raphson on the
+closed-form annuity price, using its analytic derivative, with Brent's method
+over a fixed bracket as a fallback when Newton fails. The functions run as
+plain Python by default: importing numba alone costs more start-up time than
+the few dozen bonds per scrape take to solve. Set YTM_USE_NUMBA=1 (with the
+numba extra installed) to compile them instead, for large batches.
+"""
+import math
+import os
+import numpy as np
+
+# Opt-in numba compilation of the solvers; numba is only imported when set
+YTM_USE_NUMBA = os.environ.get("YTM_USE_NUMBA", "").lower() in ("1", "true", "yes")
+
+NUMBA_AVAILABLE = False
+if YTM_USE_NUMBA:
+    try:
+        from numba import njit
+        NUMBA_AVAILABLE = True
+    except ImportError:
+        pass
+
+if not NUMBA_AVAILABLE:
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function as plain Python when numba is not used."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Newton-Raphson settings for the YTM solver
+YTM_MAX_ITERATIONS = 50
+YTM_TOLERANCE = 1e-10
+
+# Brent's method fallback: YTM bracket (same as the -50%..100% sanity range) and limits
+YTM_BRACKET_LOWER = -0.5
+YTM_BRACKET_UPPER = 1.0
+BRENT_MAX_ITERATIONS = 100
+BRENT_RTOL = 4 * 2.220446049250313e-16  # 4 * machine epsilon, as in scipy's brentq
+
+
+@njit(cache=True)
+def _newton_ytm(dirty_price, face_value, coupon_payment, total_periods, payments_per_year, initial_guess):
+    """
+    Newton-Raphson on price(ytm) - dirty_price for a level-coupon bond.
+
+    Returns NaN if the iteration leaves the valid domain or does not converge.
+    """
+    ytm = initial_guess
+
+    # Invariant across iterations: limit of the annuity formula as the rate tends to zero
+    zero_rate_price = coupon_payment * total_periods + face_value
+    zero_rate_slope = -(coupon_payment * total_periods * (total_periods + 1.0) / 2.0 + face_value * total_periods)
+
+    for _ in range(YTM_MAX_ITERATIONS):
+        periodic_rate = ytm / payments_per_year
+
+        # Avoid numerical issues with very negative rates
+        if periodic_rate <= -0.99:
+            return math.nan
+
+        growth = 1.0 + periodic_rate
+        discount = growth ** -total_periods
+
+        if abs(periodic_rate) < 1e-12:
+            price = zero_rate_price
+            slope = zero_rate_slope
+        else:
+            discount_slope = -total_periods * discount / growth
+            price = coupon_payment * (1.0 - discount) / periodic_rate + face_value * discount
+            slope = (coupon_payment * (-discount_slope * periodic_rate - (1.0 - discount)) / (periodic_rate * periodic_rate)
+                     + face_value * discount_slope)
+
+        if slope == 0.0:
+            return math.nan
+
+        # Chain rule: d(price)/d(ytm) = d(price)/d(periodic_rate) / payments_per_year
+        step = (price - dirty_price) / (slope / payments_per_year)
+        ytm -= step
+        if abs(step) < YTM_TOLERANCE:
+            return ytm
+
+    return math.nan
+
+
+@njit(cache=True)
+def _bond_price(face_value, coupon_payment, total_periods, payments_per_year, ytm):
+    """Closed-form price of a level-coupon bond at the given yield."""
+    periodic_rate = ytm / payments_per_year
+    if abs(periodic_rate) < 1e-12:
+        return coupon_payment * total_periods + face_value
+
+    discount = (1.0 + periodic_rate) ** -total_periods
+    return coupon_payment * (1.0 - discount) / periodic_rate + face_value * discount
+
+
+@njit(cache=True)
+def _brent_ytm(dirty_price, face_value, coupon_payment, total_periods, payments_per_year):
+    """
+    Brent's method on price(ytm) - dirty_price over [YTM_BRACKET_LOWER, YTM_BRACKET_UPPER].
+
+    Port of scipy's brentq: slower than Newton but cannot diverge, so it is used
+    when Newton fails. Returns NaN if the bracket does not contain a root.
+    """
+    xpre = YTM_BRACKET_LOWER
+    xcur = YTM_BRACKET_UPPER
+    fpre = _bond_price(face_value, coupon_payment, total_periods, payments_per_year, xpre) - dirty_price
+    fcur = _bond_price(face_value, coupon_payment, total_periods, payments_per_year, xcur) - dirty_price
+
+    if fpre == 0.0:
+        return xpre
+    if fcur == 0.0:
+        return xcur
+    if (fpre > 0.0) == (fcur > 0.0):
+        return math.nan
+
+    xblk = 0.0
+    fblk = 0.0
+    spre = 0.0
+    scur = 0.0
+
+    for _ in range(BRENT_MAX_ITERATIONS):
+        if fpre != 0.0 and fcur != 0.0 and (fpre < 0.0) != (fcur < 0.0):
+            xblk = xpre
+            fblk = fpre
+            spre = scur = xcur - xpre
+
+        if abs(fblk) < abs(fcur):
+            xpre, xcur, xblk = xcur, xblk, xcur
+            fpre, fcur, fblk = fcur, fblk, fcur
+
+        delta = (YTM_TOLERANCE + BRENT_RTOL * abs(xcur)) / 2.0
+        sbis = (xblk - xcur) / 2.0
+        if fcur == 0.0 or abs(sbis) < delta:
+            return xcur
+
+        if abs(spre) > delta and abs(fcur) < abs(fpre):
+            if xpre == xblk:
+                # Secant step
+                stry = -fcur * (xcur - xpre) / (fcur - fpre)
+            else:
+                # Inverse quadratic interpolation
+                dpre = (fpre - fcur) / (xpre - xcur)
+                dblk = (fblk - fcur) / (xblk - xcur)
+                stry = -fcur * (fblk * dblk - fpre * dpre) / (dblk * dpre * (fblk - fpre))
+
+            if 2.0 * abs(stry) < min(abs(spre), 3.0 * abs(sbis) - delta):
+                spre = scur
+                scur = stry
+            else:
+                # Interpolation rejected, bisect
+                spre = sbis
+                scur = sbis
+        else:
+            spre = sbis
+            scur = sbis
+
+        xpre = xcur
+        fpre = fcur
+        if abs(scur) > delta:
+            xcur += scur
+        else:
+            xcur += delta if sbis > 0.0 else -delta
+
+        fcur = _bond_price(face_value, coupon_payment, total_periods, payments_per_year, xcur) - dirty_price
+
+    return math.nan
+
+
+@njit(cache=True)
+def _solve(dirty_price, face_value, coupon_payment, total_periods, payments_per_year, initial_guess):
+    """Newton-Raphson from the initial guess, falling back to bracketed Brent if it fails."""
+    ytm = _newton_ytm(dirty_price, face_value, coupon_payment, total_periods, payments_per_year, initial_guess)
+    if math.isnan(ytm):
+        ytm = _brent_ytm(dirty_price, face_value, coupon_payment, total_periods, payments_per_year)
+    return ytm
+
+
+@njit(cache=True)
+def solve_ytm(dirty_price, face_value, coupon_rate, years_to_maturity, payments_per_year):
+    """
+    Pre-tax YTM from the dirty price, with fractional periods to maturity.
+
+    Seeded with the approximate YTM; returns NaN if there is essentially no
+    time remaining or no root is found.
+    """
+    total_periods = years_to_maturity * payments_per_year  # Keep as float, don't round to int
+    if total_periods <= 0.01:  # Less than ~3.6 days remaining
+        return math.nan
+
+    coupon_payment = (coupon_rate * face_value) / payments_per_year
+
+    # Use approximate YTM as initial guess
+    initial_guess = (coupon_rate + (face_value - dirty_price) / years_to_maturity) / ((face_value + dirty_price) / 2)
+
+    return _solve(dirty_price, face_value, coupon_payment, total_periods, payments_per_year, initial_guess)
+
+
+@njit(cache=True)
+def solve_after_tax_ytm(dirty_price, face_value, coupon_rate, years_to_maturity, tax_rate_on_coupons,
+                        payments_per_year):
+    """
+    After-tax YTM where coupons are taxed and capital gains are tax-free.
+
+    Counts whole coupon periods only and is seeded with the coupon rate (5% for
+    zero-coupon bonds). Returns NaN if no root is found.
+    """
+    coupon_payment = (coupon_rate * face_value) / payments_per_year
+    after_tax_coupon = coupon_payment * (1.0 - tax_rate_on_coupons)
+    total_periods = float(int(years_to_maturity * payments_per_year))
+
+    initial_guess = coupon_rate if coupon_rate > 0 else 0.05
+
+    return _solve(dirty_price, face_value, after_tax_coupon, total_periods, payments_per_year, initial_guess)
+
+
+@njit(cache=True)
+def solve_ytm_batch(dirty_prices, face_values, coupon_rates, years_to_maturity, tax_rate_on_coupons,
+                    payments_per_year):
+    """
+    Solve pre-tax and after-tax YTM for arrays of bonds in one compiled call.
+
+    Same results as calling solve_ytm and solve_after_tax_ytm per bond, but the
+    coupon payment and period count are derived once per bond for both solves.
+
+    Returns:
+        tuple: (ytm, after_tax_ytm) float arrays, NaN where the solve failed
+    """
+    n = dirty_prices.shape[0]
+    ytms = np.empty(n)
+    after_tax_ytms = np.empty(n)
+    after_tax_factor = 1.0 - tax_rate_on_coupons
+
+    for i in range(n):
+        # Per-bond terms are computed once and shared by the pre-tax and after-tax solves
+        dirty_price = dirty_prices[i]
+        face_value = face_values[i]
+        coupon_rate = coupon_rates[i]
+        years = years_to_maturity[i]
+        coupon_payment = (coupon_rate * face_value) / payments_per_year
+        total_periods = years * payments_per_year
+
+        if total_periods <= 0.01:  # Less than ~3.6 days remaining
+            ytms[i] = math.nan
+        else:
+            initial_guess = (coupon_rate + (face_value - dirty_price) / years) / ((face_value + dirty_price) / 2)
+            ytms[i] = _solve(dirty_price, face_value, coupon_payment, total_periods,
+                             payments_per_year, initial_guess)
+
+        after_tax_ytms[i] = _solve(dirty_price, face_value, coupon_payment * after_tax_factor,
+                                   float(int(total_periods)), payments_per_year,
+                                   coupon_rate if coupon_rate > 0 else 0.05)
+
+    return ytms, after_tax_ytms
+
+
+@njit(cache=True)
+def solve_pre_tax_ytm_batch(dirty_prices, face_values, coupon_rates, years_to_maturity, payments_per_year):
+    """
+    Solve pre-tax YTM only for arrays of bonds in one compiled call.
+
+    For callers with no after-tax yield to report, so each bond is solved once.
+
+    Returns:
+        float array: ytm per bond, NaN where the solve failed
+    """
+    n = dirty_prices.shape[0]
+    ytms = np.empty(n)
+    for i in range(n):
+        ytms[i] = solve_ytm(dirty_prices[i], face_values[i], coupon_rates[i], years_to_maturity[i],
+                            payments_per_year)
+    return ytms
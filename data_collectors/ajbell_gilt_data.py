@@ -2,7 +2,7 @@
 AJ Bell gilt market data collector for real-time broker prices.
 
 This module requires additional dependencies:
-- scipy>=1.11.0 (for YTM calculations)
+- numba>=0.58.0 (optional, JIT-compiles the YTM solver)
 - selenium>=4.15.0 (for web scraping) 
 - webdriver-manager>=4.0.0 (for Chrome driver management)
 
@@ -11,6 +11,7 @@ Calculates accrued interest, dirty prices, YTM, and after-tax YTM from clean pri
 """
 import time
 import re
+import math
 import platform
 import os
 from datetime import datetime
@@ -27,12 +28,33 @@ try:
 except ImportError:
     ChromeDriverManager = None
 
-try:
-    from scipy.optimize import fsolve
-except ImportError:
-    fsolve = None
-
 from .base import BaseCollector
+from ._ytm_kernel import solve_ytm, solve_after_tax_ytm
+
+# Patterns used per scraped row, compiled once at import
+_NUM_RE = re.compile(r'(\d+\.?\d*)')
+_YEAR_RE = re.compile(r'20\d{2}')
+_GB_ISIN_SEARCH_RE = re.compile(r'GB[A-Z0-9]{10}')
+_GB_ISIN_RE = re.compile(r'^GB[A-Z0-9]{10}$')
+_CURRENCY_SYMBOLS_RE = re.compile(r'[£$€,]')
+
+# Fetches th/td texts for every table row in a single execute_script call
+TABLE_TEXT_SCRIPT = """
+return Array.from(arguments[0].querySelectorAll('tr'), row => [
+    Array.from(row.querySelectorAll('th'), cell => cell.innerText),
+    Array.from(row.querySelectorAll('td'), cell => cell.innerText)
+]);
+"""
+
+
+def _read_table_text(table_element) -> List[tuple]:
+    """
+    Read the text of every row of a table in one WebDriver round-trip.
+    
+    Returns:
+        list: (header cell texts, data cell texts) per <tr>, in document order
+    """
+    return table_element.parent.execute_script(TABLE_TEXT_SCRIPT, table_element)
 
 
 class AJBellGiltCollector(BaseCollector):
@@ -258,10 +280,10 @@ class AJBellGiltCollector(BaseCollector):
             return None
         
         # Remove currency symbols and common formatting
-        clean_text = re.sub(r'[£$€,]', '', price_text.strip())
+        clean_text = _CURRENCY_SYMBOLS_RE.sub('', price_text.strip())
         
         # Extract numeric value
-        price_match = re.search(r'(\d+\.?\d*)', clean_text)
+        price_match = _NUM_RE.search(clean_text)
         if price_match:
             try:
                 return float(price_match.group(1))
@@ -276,7 +298,7 @@ class AJBellGiltCollector(BaseCollector):
         
         # Remove % symbol and extract number
         clean_text = percent_text.replace('%', '').strip()
-        percent_match = re.search(r'(\d+\.?\d*)', clean_text)
+        percent_match = _NUM_RE.search(clean_text)
         if percent_match:
             try:
                 return float(percent_match.group(1)) / 100  # Convert to decimal
@@ -304,7 +326,7 @@ class AJBellGiltCollector(BaseCollector):
                 continue
         
         # Try to extract just year and estimate mid-year
-        year_match = re.search(r'20\d{2}', date_text)
+        year_match = _YEAR_RE.search(date_text)
         if year_match:
             year = int(year_match.group(0))
             return datetime(year, 7, 15)  # Mid-year estimate
@@ -376,16 +398,16 @@ class AJBellGiltCollector(BaseCollector):
     def _parse_gilt_table(self, table_element) -> List[Dict[str, Any]]:
         """Parse the AJ Bell gilt price table."""
         try:
-            rows = table_element.find_elements(By.TAG_NAME, "tr")
+            rows = _read_table_text(table_element)
             if len(rows) < 2:  # Need header + at least one data row
                 return []
             
             # Get headers
-            header_row = rows[0]
-            headers = [cell.text.strip().lower() for cell in header_row.find_elements(By.TAG_NAME, "th")]
+            header_th, header_td = rows[0]
+            headers = [text.strip().lower() for text in header_th]
             
             if not headers:
-                headers = [cell.text.strip().lower() for cell in header_row.find_elements(By.TAG_NAME, "td")]
+                headers = [text.strip().lower() for text in header_td]
             
             self.logger.info(f"AJ Bell table headers: {headers}")
             self.logger.info(f"Found {len(rows)} total rows (including header)")
@@ -397,18 +419,16 @@ class AJBellGiltCollector(BaseCollector):
             maturity_col = self._find_column_index(headers, ['maturity', 'expiry', 'date'])
             
             gilt_data = []
-            for i, row in enumerate(rows[1:]):  # Skip header
+            for i, (_, cells) in enumerate(rows[1:]):  # Skip header
                 try:
-                    cells = row.find_elements(By.TAG_NAME, "td")
-                    
                     if len(cells) < 4:  # Need minimum columns
                         continue
                     
                     # Extract data with error handling
-                    bond_name_full = cells[name_col].text.strip() if name_col is not None and name_col < len(cells) else ""
-                    price_text = cells[price_col].text.strip() if price_col is not None and price_col < len(cells) else ""
-                    coupon_text = cells[coupon_col].text.strip() if coupon_col is not None and coupon_col < len(cells) else ""
-                    maturity_text = cells[maturity_col].text.strip() if maturity_col is not None and maturity_col < len(cells) else ""
+                    bond_name_full = cells[name_col].strip() if name_col is not None and name_col < len(cells) else ""
+                    price_text = cells[price_col].strip() if price_col is not None and price_col < len(cells) else ""
+                    coupon_text = cells[coupon_col].strip() if coupon_col is not None and coupon_col < len(cells) else ""
+                    maturity_text = cells[maturity_col].strip() if maturity_col is not None and maturity_col < len(cells) else ""
                     
                     # Extract clean bond name (before ISIN codes)
                     if '|' in bond_name_full:
@@ -436,7 +456,7 @@ class AJBellGiltCollector(BaseCollector):
                     self.logger.debug(f"Parsing bond_name_full: '{bond_name_full}'")
                     
                     # Look for ISIN pattern (GB followed by 10 alphanumeric)
-                    isin_match = re.search(r'GB[A-Z0-9]{10}', bond_name_full)
+                    isin_match = _GB_ISIN_SEARCH_RE.search(bond_name_full)
                     if isin_match:
                         isin = isin_match.group(0)
                         self.logger.debug(f"Found ISIN: '{isin}'")
@@ -451,7 +471,7 @@ class AJBellGiltCollector(BaseCollector):
                     elif len(parts) >= 2:
                         # Fallback: if only 2 parts, check if second part is ISIN or short code
                         second_part = parts[1].strip()
-                        if re.match(r'^GB[A-Z0-9]{10}$', second_part):
+                        if _GB_ISIN_RE.match(second_part):
                             short_code = None  # Second part is ISIN, no short code available
                             self.logger.debug(f"2nd part is ISIN, no short_code available: '{second_part}'")
                         else:
@@ -554,8 +574,7 @@ class AJBellGiltCollector(BaseCollector):
                 except Exception as e:
                     # Try to get bond name for better error identification
                     try:
-                        cells = row.find_elements(By.TAG_NAME, "td")
-                        bond_name_full = cells[name_col].text.strip() if name_col is not None and name_col < len(cells) else "Unknown"
+                        bond_name_full = cells[name_col].strip() if name_col is not None and name_col < len(cells) else "Unknown"
                         self.logger.warning(f"Error parsing AJ Bell row {i+1} ({bond_name_full}): {e}")
                     except:
                         self.logger.warning(f"Error parsing AJ Bell row {i+1}: {e}")
@@ -655,11 +674,6 @@ class AJBellGiltCollector(BaseCollector):
                                payments_per_year: int = 2, bond_name: str = "Unknown", 
                                isin: str = None, short_code: str = None) -> Optional[float]:
         """Calculate YTM using dirty price."""
-        if fsolve is None:
-            self.logger.warning("scipy not available - cannot calculate YTM")
-            return None
-            
-        coupon_payment = (coupon_rate * face_value) / payments_per_year
         total_periods = years_to_maturity * payments_per_year  # Keep as float, don't round to int
         
         # Handle edge case where bond has essentially no time remaining
@@ -668,28 +682,14 @@ class AJBellGiltCollector(BaseCollector):
             self.logger.warning(f"Bond {bond_id} has minimal time remaining (years_to_maturity: {years_to_maturity})")
             return None
         
-        def bond_price_equation(ytm):
-            if ytm == 0:
-                return coupon_payment * total_periods + face_value - dirty_price
-            
-            periodic_rate = ytm / payments_per_year
-            
-            # Avoid numerical issues with very negative rates
-            if periodic_rate <= -0.99:
-                return float('inf')
-            
-            try:
-                present_value_coupons = coupon_payment * (1 - (1 + periodic_rate) ** -total_periods) / periodic_rate
-                present_value_face = face_value / (1 + periodic_rate) ** total_periods
-                return present_value_coupons + present_value_face - dirty_price
-            except (OverflowError, ZeroDivisionError):
-                return float('inf')
-        
-        # Use approximate YTM as initial guess
-        initial_guess = (coupon_rate + (face_value - dirty_price) / years_to_maturity) / ((face_value + dirty_price) / 2)
-        
         try:
-            ytm_solution = fsolve(bond_price_equation, initial_guess, xtol=1e-8)[0]
+            ytm_solution = solve_ytm(float(dirty_price), float(face_value), float(coupon_rate),
+                                     float(years_to_maturity), payments_per_year)
+            
+            if math.isnan(ytm_solution):
+                bond_id = f"{bond_name} (ISIN: {isin}, Code: {short_code})" if isin or short_code else bond_name
+                self.logger.warning(f"YTM calculation did not converge for {bond_id}")
+                return None
             
             # Sanity check: YTM should be reasonable (between -50% and 100%)
             if -0.5 <= ytm_solution <= 1.0:
@@ -714,30 +714,15 @@ class AJBellGiltCollector(BaseCollector):
         - Coupon payments are taxed at tax_rate_on_coupons
         - Capital gains are tax-free (typical for UK gilts)
         """
-        if fsolve is None:
-            self.logger.warning("scipy not available - cannot calculate after-tax YTM")
-            return None
-            
-        coupon_payment = (coupon_rate * face_value) / payments_per_year
-        after_tax_coupon = coupon_payment * (1 - tax_rate_on_coupons)
-        total_periods = int(years_to_maturity * payments_per_year)
-        
-        def after_tax_bond_equation(ytm):
-            if ytm == 0:
-                return after_tax_coupon * total_periods + face_value - dirty_price
-            
-            periodic_rate = ytm / payments_per_year
-            # Present value of after-tax coupons
-            present_value_coupons = after_tax_coupon * (1 - (1 + periodic_rate) ** -total_periods) / periodic_rate
-            # Present value of face value (no tax on capital gains)
-            present_value_face = face_value / (1 + periodic_rate) ** total_periods
-            
-            return present_value_coupons + present_value_face - dirty_price
-        
-        initial_guess = coupon_rate if coupon_rate > 0 else 0.05
-        
         try:
-            ytm_solution = fsolve(after_tax_bond_equation, initial_guess)[0]
+            ytm_solution = solve_after_tax_ytm(float(dirty_price), float(face_value), float(coupon_rate),
+                                               float(years_to_maturity), float(tax_rate_on_coupons),
+                                               payments_per_year)
+            
+            if math.isnan(ytm_solution):
+                bond_id = f"{bond_name} (ISIN: {isin}, Code: {short_code})" if isin or short_code else bond_name
+                self.logger.warning(f"After-tax YTM calculation did not converge for {bond_id}")
+                return None
             
             # Sanity check: After-tax YTM should be reasonable (between -50% and 100%)
             if -0.5 <= ytm_solution <= 1.0:
@@ -1,24 +1,117 @@
+import csv
+import io
 import os
+import stat
 import logging
 import requests
 import time
-import psycopg2
+import threading
+import orjson
+from operator import itemgetter
+from psycopg2.pool import PoolError, ThreadedConnectionPool
 from typing import Dict, Any, Optional, Tuple, List
 from datetime import datetime, date, timedelta
+from ._http import SESSION
+
+# Per-user root of the collectors' on-disk HTTP caches (XDG_CACHE_HOME or ~/.cache)
+USER_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "marketinsights"
+)
+
+# Connections kept per database by the process-wide pool. Borrowers beyond
+# DB_POOL_MAX_CONN (concurrent collectors, upsert workers, the early MM23 connect)
+# wait up to DB_POOL_WAIT_TIMEOUT seconds for one to be returned rather than
+# failing; the timeout turns a borrower that never returns its connection into
+# an error instead of a hang
+DB_POOL_MIN_CONN = 1
+DB_POOL_MAX_CONN = 8
+DB_POOL_WAIT_TIMEOUT = 300
+
+_DB_POOLS: Dict[Tuple[int, str], Tuple[ThreadedConnectionPool, threading.BoundedSemaphore]] = {}
+_DB_POOLS_LOCK = threading.Lock()
+
+# SQL column types per (database_url, table), read from the catalog on a table's
+# first bulk upsert and re-read only when a record has a column not seen before
+_COLUMN_TYPES: Dict[Tuple[str, str], Dict[str, str]] = {}
+
+
+def _get_db_pool(database_url: str) -> Tuple[ThreadedConnectionPool, threading.BoundedSemaphore]:
+    """Get the connection pool for database_url and its borrowing slots, creating them on first use.
+    
+    Pools are keyed by process id as well, so a forked worker never reuses
+    sockets opened by its parent. ThreadedConnectionPool raises PoolError once
+    every connection is out, so borrowers take one of DB_POOL_MAX_CONN slots
+    first and block there until a connection is free.
+    """
+    key = (os.getpid(), database_url)
+    with _DB_POOLS_LOCK:
+        entry = _DB_POOLS.get(key)
+        if entry is None:
+            entry = (ThreadedConnectionPool(DB_POOL_MIN_CONN, DB_POOL_MAX_CONN, database_url),
+                     threading.BoundedSemaphore(DB_POOL_MAX_CONN))
+            _DB_POOLS[key] = entry
+        return entry
+
+
+def _changed_clause(table: str, update_columns: List[str]) -> str:
+    """Build the ON CONFLICT ... WHERE condition that only matches rows whose values changed.
+    
+    Upserts skip rewriting identical rows, so idempotent re-runs don't generate
+    WAL and index churn for unchanged data.
+    """
+    return (
+        f"({', '.join(f'{table}.{col}' for col in update_columns)}) IS DISTINCT FROM "
+        f"({', '.join(f'EXCLUDED.{col}' for col in update_columns)})"
+    )
+
+
+class _PooledConnection:
+    """A psycopg2 connection borrowed from a pool; close() returns it and its slot to the pool."""
+    
+    def __init__(self, pool: ThreadedConnectionPool, slots: threading.BoundedSemaphore, conn):
+        self._pool = pool
+        self._slots = slots
+        self._conn = conn
+    
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+    
+    def close(self):
+        # The pool rolls back any open transaction and discards broken connections
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            try:
+                self._pool.putconn(conn)
+            finally:
+                self._slots.release()
+
 
 class BaseCollector:
     def __init__(self, database_url=None):
         self.database_url = database_url
-        self.session = requests.Session()
+        self.session = SESSION  # Shared connection pool across all collectors
         self.logger = logging.getLogger(self.__class__.__name__)
         
     def get_db_connection(self):
-        """Get database connection ONLY if database_url was explicitly provided."""
+        """Get database connection ONLY if database_url was explicitly provided.
+        
+        The connection comes from a process-wide pool shared by every collector;
+        close() hands it back to the pool instead of disconnecting.
+        """
         if self.database_url is None:
             return None  # No database operations if URL not provided
         
         try:
-            return psycopg2.connect(self.database_url)
+            pool, slots = _get_db_pool(self.database_url)
+            if not slots.acquire(timeout=DB_POOL_WAIT_TIMEOUT):
+                raise PoolError(f"No database connection free after {DB_POOL_WAIT_TIMEOUT}s "
+                                f"({DB_POOL_MAX_CONN} in use)")
+            try:
+                return _PooledConnection(pool, slots, pool.getconn())
+            except BaseException:
+                slots.release()
+                raise
         except Exception as e:
             self.logger.error(f"Failed to connect to database: {str(e)}")
             raise
@@ -34,8 +127,13 @@ class BaseCollector:
                 else:
                     response = self.session.get(url, params=params, timeout=30)
                 response.raise_for_status()
-                return response.json()
-            except requests.exceptions.RequestException as e:
+                # orjson parses the raw bytes several times faster than response.json()
+                return orjson.loads(response.content)
+            except requests.exceptions.RetryError as e:
+                # The session adapter has already retried this status (429/5xx) with backoff
+                self.logger.error(f"Request failed after transport retries for URL: {url}: {str(e)}")
+                raise
+            except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
                 self.logger.warning(f"Request attempt {attempt + 1} failed: {str(e)}")
                 if attempt < retries - 1:
                     time.sleep(backoff_factor * (2 ** attempt))
@@ -65,14 +163,18 @@ class BaseCollector:
             columns_str = ', '.join(columns)
             
             # Create UPDATE clause for ON CONFLICT
-            update_clause = ', '.join([f"{col} = EXCLUDED.{col}" for col in columns if col not in conflict_columns])
+            update_columns = [col for col in columns if col not in conflict_columns]
+            update_clause = ', '.join([f"{col} = EXCLUDED.{col}" for col in update_columns])
             conflict_str = ', '.join(conflict_columns)
             
+            changed_clause = _changed_clause(table, update_columns)
+            
             sql = f"""
             INSERT INTO {table} ({columns_str}, updated_at)
             VALUES ({placeholders}, CURRENT_TIMESTAMP)
             ON CONFLICT ({conflict_str}) DO UPDATE SET
             {update_clause}, updated_at = CURRENT_TIMESTAMP
+            WHERE {changed_clause}
             """
             
             with conn.cursor() as cur:
@@ -125,42 +227,39 @@ class BaseCollector:
             columns_str = ', '.join(columns)
             
             # Create UPDATE clause for ON CONFLICT
-            update_clause = ', '.join([f"{col} = EXCLUDED.{col}" for col in columns if col not in conflict_columns])
+            update_columns = [col for col in columns if col not in conflict_columns]
+            update_clause = ', '.join([f"{col} = EXCLUDED.{col}" for col in update_columns])
             conflict_str = ', '.join(conflict_columns)
             
-            # Create placeholders for VALUES clause
-            placeholders = ', '.join(['%s'] * len(columns))
+            changed_clause = _changed_clause(table, update_columns)
             
-            # Process data in batches
-            for i in range(0, len(data_list), batch_size):
-                batch = data_list[i:i + batch_size]
-                
-                # Prepare values for batch
-                values_list = []
-                for record in batch:
-                    values_list.append(tuple(record[col] for col in columns))
-                
-                # Create VALUES clause for multiple records
-                values_placeholders = ', '.join([f"({placeholders})" for _ in range(len(batch))])
+            with conn.cursor() as cur:
+                # Each column is sent as one array typed like the target column, so the
+                # statement has the same shape whatever the batch size
+                column_types = self._get_column_types(cur, table, columns)
+                missing = [col for col in columns if col not in column_types]
+                if missing:
+                    raise ValueError(f"Columns {missing} not found in {table}")
+                arrays_str = ', '.join(f"%s::{column_types[col]}[]" for col in columns)
                 
+                # updated_at is set server-side
                 sql = f"""
                 INSERT INTO {table} ({columns_str}, updated_at)
-                VALUES {values_placeholders.replace(placeholders, placeholders + ', CURRENT_TIMESTAMP')}
+                SELECT *, CURRENT_TIMESTAMP FROM unnest({arrays_str})
                 ON CONFLICT ({conflict_str}) DO UPDATE SET
                 {update_clause}, updated_at = CURRENT_TIMESTAMP
+                WHERE {changed_clause}
                 """
                 
-                # Flatten values for execute
-                flat_values = []
-                for record in batch:
-                    flat_values.extend(record[col] for col in columns)
-                
-                with conn.cursor() as cur:
-                    cur.execute(sql, flat_values)
-                    conn.commit()
+                # One INSERT ... SELECT per batch, all inside a single transaction
+                for i in range(0, len(data_list), batch_size):
+                    batch = data_list[i:i + batch_size]
+                    cur.execute(sql, [[record[col] for record in batch] for col in columns])
                     
-                total_processed += len(batch)
-                self.logger.debug(f"Processed batch of {len(batch)} records for {table}")
+                    total_processed += len(batch)
+                    self.logger.debug(f"Processed batch of {len(batch)} records for {table}")
+            
+            conn.commit()
                 
             self.logger.info(f"Successfully bulk upserted {total_processed} records to {table}")
             return total_processed
@@ -174,6 +273,85 @@ class BaseCollector:
             if conn:
                 conn.close()
             
+    def bulk_copy_data(self, table: str, data_list: List[Dict[str, Any]]) -> int:
+        """Bulk load data into an empty PostgreSQL table with COPY if database_url provided.
+        
+        For cold-start backfills, where no row can conflict, COPY FROM STDIN is much
+        faster than batched INSERT ... ON CONFLICT. Use bulk_upsert_data whenever the
+        table may already hold any of the rows.
+        
+        Args:
+            table: Table name
+            data_list: List of dictionaries with data to load
+            
+        Returns:
+            Number of successfully loaded records
+        """
+        if self.database_url is None:
+            self.logger.info(f"No database URL provided - skipping storage of {len(data_list)} records to {table}")
+            return len(data_list)  # Return count but skip storage
+        
+        if not data_list:
+            self.logger.info(f"No data provided for bulk copy to {table}")
+            return 0
+            
+        conn = None
+        
+        try:
+            conn = self.get_db_connection()
+            
+            # Get column structure from first record; created_at/updated_at use their defaults
+            columns = list(data_list[0].keys())
+            
+            # csv writes None as an unquoted empty field, which COPY loads as NULL. Rows are
+            # pulled out by itemgetter so the whole serialization loop runs in C.
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            if len(columns) == 1:
+                writer.writerows((record[columns[0]],) for record in data_list)
+            else:
+                writer.writerows(map(itemgetter(*columns), data_list))
+            buffer.seek(0)
+            
+            with conn.cursor() as cur:
+                cur.copy_expert(
+                    f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT CSV)",
+                    buffer
+                )
+            
+            conn.commit()
+                
+            self.logger.info(f"Successfully bulk copied {len(data_list)} records to {table}")
+            return len(data_list)
+            
+        except Exception as e:
+            self.logger.error(f"Failed to bulk copy data to {table}: {str(e)}")
+            if conn:
+                conn.rollback()
+            raise  # Re-raise the exception to fail the task
+        finally:
+            if conn:
+                conn.close()
+            
+    def _get_column_types(self, cur, table: str, columns: List[str]) -> Dict[str, str]:
+        """Map each column of table to its SQL type, e.g. {'yield_rate': 'numeric(8,4)'}.
+        
+        Served from the module cache unless one of columns is missing from it, so
+        only a table's first bulk upsert (or one after a schema change) pays for
+        the catalog query.
+        """
+        key = (self.database_url, table)
+        column_types = _COLUMN_TYPES.get(key)
+        if column_types is None or any(col not in column_types for col in columns):
+            cur.execute("""
+                SELECT attname, format_type(atttypid, atttypmod)
+                FROM pg_attribute
+                WHERE attrelid = %s::regclass AND attnum > 0 AND NOT attisdropped
+            """, (table,))
+            column_types = dict(cur.fetchall())
+            _COLUMN_TYPES[key] = column_types
+        return column_types
+    
     def get_env_var(self, var_name: str, required: bool = True) -> Optional[str]:
         """Get environment variable with optional requirement check."""
         value = os.getenv(var_name)
@@ -181,6 +359,27 @@ class BaseCollector:
             raise ValueError(f"Required environment variable {var_name} not set")
         return value
     
+    def _private_cache_dir(self, cache_dir: str) -> bool:
+        """
+        Create cache_dir owner-only (0700) if missing, and check that it is a real
+        directory owned by this user that nobody else can read or write.
+        
+        A cache directory failing the check is not used: another user could otherwise
+        plant the entries the collector loads, or symlink its temporary files.
+        """
+        try:
+            os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+            st = os.lstat(cache_dir)
+        except OSError as e:
+            self.logger.warning(f"Cache directory {cache_dir} unavailable: {str(e)}")
+            return False
+        
+        owned = not hasattr(os, "getuid") or st.st_uid == os.getuid()
+        if not stat.S_ISDIR(st.st_mode) or not owned or st.st_mode & 0o077:
+            self.logger.warning(f"Not using cache {cache_dir}: not a private directory owned by this user")
+            return False
+        return True
+    
     def get_last_record_date(self, table: str, date_column: str = 'date') -> Optional[date]:
         """Get the date of the most recent record in the specified table."""
         if self.database_url is None:
@@ -202,6 +401,32 @@ class BaseCollector:
             if conn:
                 conn.close()
     
+    def get_last_dates(self, tables: List[str], date_column: str = 'date') -> Dict[str, Optional[date]]:
+        """
+        Get the most recent record date for several tables in one query.
+        
+        Returns a dict of table -> last date (None for empty tables), which can be
+        passed to get_date_range_for_collection to skip its own MAX() query.
+        """
+        if self.database_url is None or not tables:
+            return {table: None for table in tables}
+        
+        conn = None
+        try:
+            conn = self.get_db_connection()
+            with conn.cursor() as cur:
+                sql = " UNION ALL ".join(
+                    f"SELECT %s, MAX({date_column}) FROM {table}" for table in tables
+                )
+                cur.execute(sql, tuple(tables))
+                return {table: last_date for table, last_date in cur.fetchall()}
+        except Exception as e:
+            self.logger.error(f"Database query failed for {', '.join(tables)}: {str(e)}")
+            raise RuntimeError(f"Database query failed for {', '.join(tables)}: {e}") from e
+        finally:
+            if conn:
+                conn.close()
+    
     def table_exists(self, table: str) -> bool:
         """Check if table exists in the database."""
         if self.database_url is None:
@@ -249,18 +474,24 @@ class BaseCollector:
                 conn.close()
     
     def get_date_range_for_collection(self, table: str, date_column: str = 'date', 
-                                    default_lookback_days: int = 365) -> Tuple[Optional[date], Optional[date]]:
+                                    default_lookback_days: int = 365,
+                                    last_dates: Dict[str, Optional[date]] = None) -> Tuple[Optional[date], Optional[date]]:
         """
         Determine the date range to collect data for based on existing records.
         Returns (start_date, end_date) tuple.
         
         For empty tables: returns (start_date for historical data, today)
         For existing tables: returns (last_record_date + 1 day, today)
+        
+        If last_dates (from get_last_dates) covers the table, no query is made.
         """
         end_date = datetime.now().date()
         
         # Check if we have existing data
-        last_date = self.get_last_record_date(table, date_column)
+        if last_dates is not None and table in last_dates:
+            last_date = last_dates[table]
+        else:
+            last_date = self.get_last_record_date(table, date_column)
         
         if last_date is None:
             # No existing data - fetch ALL available historical data (no time limit)
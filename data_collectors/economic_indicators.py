@@ -3,10 +3,29 @@ import time
 import pandas as pd
 import io
 import urllib.parse
-from datetime import datetime, timedelta
-from typing import Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Dict, Any, List, Iterator, Optional, Tuple
 from .base import BaseCollector
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# FRED returns at most this many observations per request; larger series are paged with offset
+FRED_MAX_LIMIT = 100000
+
+# Long backfills are split into windows of this many days, fetched in parallel
+FRED_WINDOW_DAYS = 365
+FRED_WINDOW_WORKERS = 4
+
+# Month numbers of the abbreviations in ONS "Aug-15" time ids
+_ONS_MONTH_NUMBERS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+}
+
 class BLSCollector(BaseCollector):
     def __init__(self, database_url=None):
         super().__init__(database_url)
@@ -79,14 +98,117 @@ class FREDCollector(BaseCollector):
     def __init__(self, database_url=None):
         super().__init__(database_url)
         self.base_url = "https://api.stlouisfed.org/fred/series/observations"
+        self.series_url = "https://api.stlouisfed.org/fred/series"
         self.api_key = self.get_env_var("FRED_API_KEY")
         
-    def get_series_data(self, series_id: str, limit: int = 100000, 
+    def get_series_data(self, series_id: str, limit: int = FRED_MAX_LIMIT, 
                        observation_start: str = None, observation_end: str = None) -> List[Dict]:
         """
         Get FRED time series data with bulk fetching support.
         Uses higher default limit for bulk operations and date range filtering.
+        At the default (maximum) limit, series longer than one response are paged.
+        """
+        params = self._series_params(series_id, limit, observation_start, observation_end)
+        
+        try:
+            data = self.make_request(self.base_url, params)
+            if not data or "observations" not in data:
+                return []
+            observations = data["observations"]
+            
+            # A full page at the API maximum may be truncated: fetch the rest by offset
+            while (limit >= FRED_MAX_LIMIT and len(data["observations"]) >= FRED_MAX_LIMIT
+                   and len(observations) < data.get("count", 0)):
+                params["offset"] = len(observations)
+                data = self.make_request(self.base_url, params)
+                if not data or not data.get("observations"):
+                    break
+                observations.extend(data["observations"])
+            
+            self.logger.info(f"Retrieved {len(observations)} observations for {series_id}")
+            return observations
+        except Exception as e:
+            self.logger.error(f"Failed to fetch FRED data for series {series_id}: {str(e)}")
+            return []
+    
+    def iter_series_data(self, series_id: str, observation_start: str = None,
+                         observation_end: str = None) -> Iterator[Dict]:
         """
+        Stream FRED observations one at a time without holding the whole JSON response.
+        
+        Parses the response incrementally with ijson as it arrives. If ijson is not
+        installed, or the stream fails before any observation is read, falls back to
+        get_series_data (which retries). A stream that fails part-way re-raises, so
+        the observations already yielded are never stored as if they were the whole
+        range (a cold-start COPY would otherwise leave the table permanently short).
+        """
+        if ijson is not None:
+            params = self._series_params(series_id, FRED_MAX_LIMIT, observation_start, observation_end)
+            count = 0
+            try:
+                with self.session.get(self.base_url, params=params, timeout=30, stream=True) as response:
+                    response.raise_for_status()
+                    response.raw.decode_content = True  # Undo gzip transfer encoding
+                    for item in ijson.items(response.raw, 'observations.item'):
+                        count += 1
+                        yield item
+                self.logger.info(f"Streamed {count} observations for {series_id}")
+                return
+            except Exception as e:
+                if count:
+                    self.logger.error(f"FRED stream for series {series_id} failed after {count} observations: {str(e)}")
+                    raise
+                self.logger.warning(f"FRED stream for series {series_id} failed, fetching in one request: {str(e)}")
+        
+        yield from self.get_series_data(
+            series_id, observation_start=observation_start, observation_end=observation_end
+        )
+    
+    def get_series_observation_start(self, series_id: str) -> Optional[date]:
+        """Get the date of a series' first observation from the FRED series metadata."""
+        params = {"series_id": series_id, "api_key": self.api_key, "file_type": "json"}
+        try:
+            data = self.make_request(self.series_url, params)
+            return datetime.strptime(data["seriess"][0]["observation_start"], "%Y-%m-%d").date()
+        except Exception as e:
+            self.logger.warning(f"Could not get observation start for FRED series {series_id}: {str(e)}")
+            return None
+    
+    def get_series_data_windowed(self, series_id: str, start_date: date, end_date: date,
+                                 window_days: int = FRED_WINDOW_DAYS,
+                                 max_workers: int = FRED_WINDOW_WORKERS) -> List[Dict]:
+        """
+        Fetch a long date range as disjoint windows requested in parallel.
+        
+        Observations are returned in date order. Unlike get_series_data, a window
+        that still fails after retries raises, so a backfill is never stored with a
+        gap that the next incremental run would skip over.
+        """
+        windows: List[Tuple[date, date]] = []
+        window_start = start_date
+        while window_start <= end_date:
+            window_end = min(window_start + timedelta(days=window_days - 1), end_date)
+            windows.append((window_start, window_end))
+            window_start = window_end + timedelta(days=1)
+        
+        def fetch_window(window: Tuple[date, date]) -> List[Dict]:
+            params = self._series_params(
+                series_id, FRED_MAX_LIMIT, window[0].strftime("%Y-%m-%d"), window[1].strftime("%Y-%m-%d")
+            )
+            data = self.make_request(self.base_url, params)
+            return data.get("observations", []) if data else []
+        
+        # map() keeps window order, so the combined list stays sorted by date
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            chunks = list(executor.map(fetch_window, windows))
+        
+        observations = [obs for chunk in chunks for obs in chunk]
+        self.logger.info(f"Retrieved {len(observations)} observations for {series_id} in {len(windows)} windows")
+        return observations
+    
+    def _series_params(self, series_id: str, limit: int, observation_start: str = None,
+                       observation_end: str = None) -> Dict[str, Any]:
+        """Build the FRED observations query parameters."""
         params = {
             "series_id": series_id,
             "api_key": self.api_key,
@@ -99,17 +221,7 @@ class FREDCollector(BaseCollector):
             params["observation_start"] = observation_start
         if observation_end:
             params["observation_end"] = observation_end
-        
-        try:
-            data = self.make_request(self.base_url, params)
-            if data and "observations" in data:
-                observations = data["observations"]
-                self.logger.info(f"Retrieved {len(observations)} observations for {series_id}")
-                return observations
-            return []
-        except Exception as e:
-            self.logger.error(f"Failed to fetch FRED data for series {series_id}: {str(e)}")
-            return []
+        return params
 
 class BEACollector(BaseCollector):
     def __init__(self, database_url=None):
@@ -1032,12 +1144,8 @@ def collect_uk_cpi(database_url=None):
                             else:
                                 full_year = 1900 + year_int  # 30-99 -> 1930-1999
                             # Convert month abbreviation to number
-                            month_map = {
-                                'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
-                                'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
-                            }
-                            if month_abbr in month_map:
-                                obs_date = datetime(full_year, month_map[month_abbr], 1).date()
+                            if month_abbr in _ONS_MONTH_NUMBERS:
+                                obs_date = datetime(full_year, _ONS_MONTH_NUMBERS[month_abbr], 1).date()
                         elif len(time_str) == 7 and "-" in time_str:  # YYYY-MM
                             obs_date = datetime.strptime(time_str + "-01", "%Y-%m-%d").date()
                         elif len(time_str) == 10:  # YYYY-MM-DD
@@ -1793,6 +1901,7 @@ class BoEYieldCurveCollector(BaseCollector):
     def download_and_extract_zip(self, zip_filename, temp_dir='./temp_yield_data'):
         """Download and extract BoE yield curve ZIP file."""
         import requests
+        import shutil
         import zipfile
         import os
         import tempfile
@@ -1822,10 +1931,11 @@ class BoEYieldCurveCollector(BaseCollector):
             response = requests.get(url, headers=headers, stream=True, timeout=60)
             response.raise_for_status()
             
+            # Copy the body to disk in 1 MB blocks, undoing gzip transfer encoding
+            response.raw.decode_content = True
             zip_path = os.path.join(temp_dir, zip_filename)
             with open(zip_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+                shutil.copyfileobj(response.raw, f, length=1024 * 1024)
             
             # Extract ZIP file
             extracted_files = []
@@ -1880,9 +1990,9 @@ class BoEYieldCurveCollector(BaseCollector):
             # Safe mode - always return None to collect all historical data
             return None, end_date
         
+        conn = None
         try:
-            import psycopg2
-            conn = psycopg2.connect(self.database_url)
+            conn = self.get_db_connection()
             cursor = conn.cursor()
             
             # Check for existing data for this specific yield type
@@ -1893,7 +2003,6 @@ class BoEYieldCurveCollector(BaseCollector):
             
             result = cursor.fetchone()
             cursor.close()
-            conn.close()
             
             if result and result[0]:
                 # Data exists for this yield type, collect from next day
@@ -1912,6 +2021,9 @@ class BoEYieldCurveCollector(BaseCollector):
             from datetime import timedelta
             start_date = end_date - timedelta(days=365)
             return start_date, end_date
+        finally:
+            if conn:
+                conn.close()
 
     def collect_all_yield_types(self, yield_types, include_historical=True):
         """
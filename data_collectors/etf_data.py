@@ -370,9 +370,9 @@ class VanguardETFCollector(BaseCollector):
         df = etf_data['price_data']
         etf_ticker = df['ETF_Ticker'].iloc[0]
         
+        conn = None
         try:
-            import psycopg2
-            conn = psycopg2.connect(self.database_url)
+            conn = self.get_db_connection()
             
             with conn.cursor() as cur:
                 # Insert both NAV and market price into etf_nav_history
@@ -511,9 +511,9 @@ class SSGAETFCollector(BaseCollector):
         df = etf_data['nav_data']
         etf_ticker = df['ETF_Ticker'].iloc[0]
         
+        conn = None
         try:
-            import psycopg2
-            conn = psycopg2.connect(self.database_url)
+            conn = self.get_db_connection()
             
             with conn.cursor() as cur:
                 # Insert NAV data into etf_nav_history (market_price will be NULL)
@@ -212,14 +212,7 @@ def collect_etf_prices(database_url=None, etf_tickers=None):
         if database_url:
             try:
                 # Check for existing data to determine collection strategy
-                import psycopg2
-                conn = psycopg2.connect(database_url)
-                cursor = conn.cursor()
-                cursor.execute("SELECT MAX(date) FROM etf_price_history LIMIT 1")
-                result = cursor.fetchone()
-                latest_date = result[0] if result else None
-                cursor.close()
-                conn.close()
+                latest_date = collector.get_last_record_date("etf_price_history")
                 
                 if latest_date is not None:
                     # Incremental update - get data from day after latest date
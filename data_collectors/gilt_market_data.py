@@ -2,7 +2,7 @@
 Gilt market data collector for real-time broker prices.
 
 This module requires additional dependencies:
-- scipy>=1.11.0 (for YTM calculations)
+- numba>=0.58.0 (optional, JIT-compiles the YTM solver)
 - selenium>=4.15.0 (for web scraping) 
 - webdriver-manager>=4.0.0 (for Chrome driver management)
 
@@ -10,22 +10,261 @@ Note: On ARM64 architectures, Chrome/ChromeDriver compatibility may be limited.
 """
 import time
 import re
+import math
 import platform
+import queue
+import atexit
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, Any, List, Optional
-from scipy.optimize import fsolve
+from typing import Dict, Any, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+import lxml.html
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 import os
 try:
     from webdriver_manager.chrome import ChromeDriverManager
 except ImportError:
     ChromeDriverManager = None
 from .base import BaseCollector
+from ._ytm_kernel import solve_ytm, solve_after_tax_ytm, solve_ytm_batch, solve_pre_tax_ytm_batch
+from .ajbell_gilt_data import _read_table_text
+
+logger = logging.getLogger(__name__)
+
+# Pooled Chrome sessions are quit and relaunched after this many scrapes
+DRIVER_RECYCLE_AFTER = 100
+
+# Selenium timeouts (seconds) for HL page loads and the price table appearing
+PAGE_LOAD_TIMEOUT = 15
+TABLE_WAIT_TIMEOUT = 10
+
+# Day-count basis for accrued interest and time to maturity
+DAYS_PER_YEAR = 365.25
+DAYS_PER_PERIOD_SEMI = DAYS_PER_YEAR / 2  # 182.625 days per semi-annual coupon period
+
+# Patterns used per scraped row, compiled once at import
+_NUM_RE = re.compile(r'(\d+\.?\d*)')
+_YEAR_RE = re.compile(r'(20\d{2})')
+_FOUR_DIGIT_YEAR_RE = re.compile(r'(\d{4})')
+_CURRENCY_RE = re.compile(r'\b(GBP|USD|EUR)\b')
+_ISIN_RE = re.compile(r'\b[A-Z]{2}[A-Z0-9]{10}\b')
+_ISIN_ANYWHERE_RE = re.compile(r'[A-Z]{2}[A-Z0-9]{10}')
+_GB_ISIN_RE = re.compile(r'^GB[A-Z0-9]{10}$')
+_SHORT_CODE_RE = re.compile(r'^[A-Z0-9]{6,10}$')
+_CURRENCY_SYMBOLS_RE = re.compile(r'[£$€,]')
+
+# Month-name lookup for HL maturity dates ("22 March 2026" / "22 Mar 2026")
+_MONTHS = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4, 'may': 5, 'june': 6,
+    'july': 7, 'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12,
+}
+_MONTHS.update({name[:3]: number for name, number in list(_MONTHS.items())})
+
+# Maturity date formats tried by GiltMarketCollector.parse_maturity_date after its fast path
+MATURITY_DATE_FORMATS = (
+    '%d/%m/%Y', '%d %b %Y', '%d %B %Y',
+    '%Y-%m-%d', '%b %Y', '%B %Y'
+)
+
+# Database column layouts for the HL bond price tables (column order = INSERT order)
+GILT_PRICE_COLUMNS = (
+    'bond_name', 'clean_price', 'accrued_interest', 'dirty_price', 'coupon_rate',
+    'maturity_date', 'years_to_maturity', 'ytm', 'after_tax_ytm',
+    'scraped_date',
+    'currency_code', 'isin', 'short_code', 'combined_id'
+)
+GILT_NUMERIC_COLUMNS = [
+    'clean_price', 'accrued_interest', 'dirty_price', 'coupon_rate', 'years_to_maturity',
+    'ytm', 'after_tax_ytm'
+]
+IL_GILT_PRICE_COLUMNS = (
+    'bond_name', 'clean_price', 'accrued_interest', 'dirty_price', 'coupon_rate',
+    'maturity_date', 'years_to_maturity', 'real_yield', 'after_tax_real_yield',
+    'scraped_date', 'inflation_assumption',
+    'currency_code', 'isin', 'short_code', 'combined_id'
+)
+IL_GILT_NUMERIC_COLUMNS = [
+    'clean_price', 'accrued_interest', 'dirty_price', 'coupon_rate', 'years_to_maturity',
+    'real_yield', 'after_tax_real_yield', 'inflation_assumption'
+]
+CORPORATE_BOND_PRICE_COLUMNS = (
+    'bond_name', 'company_name', 'clean_price', 'accrued_interest', 'dirty_price', 'coupon_rate',
+    'maturity_date', 'years_to_maturity', 'ytm', 'after_tax_ytm', 'credit_rating',
+    'scraped_date',
+    'currency_code', 'isin', 'short_code', 'combined_id'
+)
+CORPORATE_BOND_NUMERIC_COLUMNS = [
+    'clean_price', 'accrued_interest', 'dirty_price', 'coupon_rate', 'years_to_maturity',
+    'ytm', 'after_tax_ytm'
+]
+
+
+def _parse_hl_date(text: str) -> Optional[datetime]:
+    """
+    Fast parser for HL "<day> <MonthName> <year>" dates using a month lookup table.
+    
+    Returns None for anything else so callers can fall back to slower parsing.
+    """
+    parts = text.split()
+    if len(parts) != 3 or not parts[0].isdigit() or len(parts[2]) != 4 or not parts[2].isdigit():
+        return None
+    
+    month = _MONTHS.get(parts[1].lower())
+    if month is None:
+        return None
+    
+    try:
+        return datetime(int(parts[2]), month, int(parts[0]))
+    except ValueError:
+        return None
+
+
+def _element_text(element) -> str:
+    """
+    Approximate Selenium's rendered .text for an lxml element.
+    
+    Whitespace is collapsed within each line and blank lines are dropped; line
+    breaks come from <br> tags (see GiltMarketCollector._load_table_rows).
+    """
+    lines = (' '.join(line.split()) for line in element.text_content().split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+def _bond_records_to_db_format(records: List[Dict[str, Any]], columns: tuple,
+                               numeric_columns: List[str]) -> List[Dict[str, Any]]:
+    """
+    Convert scraped bond records to database-ready types in one vectorized pass.
+    
+    Only the given table columns are kept (in that order). Numeric columns are
+    coerced with pd.to_numeric, maturity datetimes are reduced to dates, and
+    missing values are mapped back to None so they are stored as NULL.
+    """
+    df = pd.DataFrame.from_records(records, columns=columns)
+    df['maturity_date'] = pd.to_datetime(df['maturity_date']).dt.date
+    df[numeric_columns] = df[numeric_columns].apply(pd.to_numeric, errors='coerce')
+    
+    # Cast to object so NaN/NaT can be replaced with None and floats come back as Python floats
+    df = df.astype(object).where(df.notna(), None)
+    return df.to_dict('records')
+
+
+def _upsert_bond_records(collector: BaseCollector, table: str, records: List[Dict[str, Any]],
+                         columns: tuple, numeric_columns: List[str]) -> int:
+    """
+    Convert scraped bond records and store them with one bulk upsert.
+    
+    A single bulk_upsert_data call keeps the write in one transaction, so a
+    failure never leaves part of a scrape stored.
+    
+    Returns:
+        Number of successfully processed records
+    """
+    db_records = _bond_records_to_db_format(records, columns, numeric_columns)
+    return collector.bulk_upsert_data(table, db_records, conflict_columns=['bond_name', 'scraped_date'])
+
+
+def _prepend_ld_library_path(paths: List[str]):
+    """Prepend library directories to LD_LIBRARY_PATH, skipping any already present."""
+    current = [p for p in os.environ.get('LD_LIBRARY_PATH', '').split(':') if p]
+    new_paths = [p for p in paths if p not in current]
+    if new_paths:
+        os.environ['LD_LIBRARY_PATH'] = ':'.join(new_paths + current)
+        logger.info(f"Set LD_LIBRARY_PATH: {os.environ['LD_LIBRARY_PATH']}")
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_chromedriver(arch: str, system: str) -> Tuple[str, Optional[str]]:
+    """
+    Locate ChromeDriver for both Pi and development environments, once per process.
+    
+    Failures raise RuntimeError and are not cached, so a later call retries.
+    
+    Returns:
+        tuple: (chromedriver path, Chromium binary to use or None for the default)
+    """
+    # Try Pi-specific paths first (ARM64 Linux)
+    if arch in ['aarch64', 'arm64'] and system == 'Linux':
+        # Check shared volume locations (init container installation)
+        shared_paths = [
+            '/shared/usr/bin/chromedriver',  # Most likely location from chromium-driver package
+            '/shared/usr/lib/chromium-browser/chromedriver',
+            '/shared/snap/chromium/current/usr/lib/chromium-browser/chromedriver'
+        ]
+        
+        for path in shared_paths:
+            if os.path.exists(path):
+                logger.info(f"Using Pi ChromeDriver from init container: {path}")
+                
+                # Set library path for copied shared libraries (only paths that exist)
+                shared_lib_paths = [
+                    '/shared/lib/aarch64-linux-gnu',
+                    '/shared/usr/lib/aarch64-linux-gnu', 
+                    '/shared/usr/lib',
+                    '/shared/lib'
+                ]
+                _prepend_ld_library_path([p for p in shared_lib_paths if os.path.exists(p)])
+                
+                # Also use chromium binary from the shared volume if available
+                chromium_binary = None
+                if os.path.exists('/shared/usr/bin/chromium'):
+                    chromium_binary = '/shared/usr/bin/chromium'
+                    logger.info("Using Chromium binary from shared volume")
+                return path, chromium_binary
+        
+        # Fallback to system paths
+        system_paths = [
+            '/usr/bin/chromedriver',  # Most likely system location
+            '/usr/lib/chromium-browser/chromedriver',
+            '/snap/chromium/current/usr/lib/chromium-browser/chromedriver'
+        ]
+        
+        for path in system_paths:
+            if os.path.exists(path):
+                logger.info(f"Using Pi ChromeDriver from system: {path}")
+                return path, None
+    
+    # Fallback to webdriver-manager for development environments
+    if ChromeDriverManager is not None:
+        try:
+            logger.info("Using ChromeDriver from webdriver-manager (development environment)")
+            return ChromeDriverManager().install(), None
+        except Exception as e:
+            logger.warning(f"webdriver-manager failed: {e}")
+    
+    # Final fallback - check common system paths
+    common_paths = [
+        '/usr/bin/chromedriver',
+        '/usr/local/bin/chromedriver',
+        '/opt/homebrew/bin/chromedriver',  # macOS with Homebrew
+    ]
+    
+    for path in common_paths:
+        if os.path.exists(path):
+            logger.info(f"Using system ChromeDriver at: {path}")
+            return path, None
+    
+    # No ChromeDriver found
+    if arch in ['aarch64', 'arm64'] and system == 'Linux':
+        raise RuntimeError("ChromeDriver not found - install with: apt install chromium-chromedriver")
+    else:
+        raise RuntimeError("ChromeDriver not found - install via webdriver-manager or system package manager")
+
+
+def _quit_driver(driver):
+    """Quit a Chrome session, ignoring errors from an already-dead browser."""
+    try:
+        driver.quit()
+    except Exception:
+        pass
 
 
 class GiltMarketCollector(BaseCollector):
@@ -34,10 +273,16 @@ class GiltMarketCollector(BaseCollector):
     Scrapes gilt prices and calculates yields, accrued interest, and after-tax metrics.
     """
     
+    # Idle (driver, use_count) kept alive between scrapes in this process
+    _driver_pool = queue.Queue(maxsize=1)
+    
     def __init__(self, database_url=None):
         super().__init__(database_url)
         self.base_url = "https://www.hl.co.uk/shares/corporate-bonds-gilts/bond-prices/uk-gilts"
         self.chrome_options = self._setup_chrome_options()
+        # Platform is fixed for the process; look it up once rather than per scrape
+        self._arch = platform.machine().lower()
+        self._system = platform.system()
     
     def _setup_chrome_options(self):
         """Configure Chrome options for Pi-friendly headless scraping."""
@@ -49,85 +294,64 @@ class GiltMarketCollector(BaseCollector):
         options.add_argument("--remote-debugging-port=9222")
         return options
     
-    def _get_chrome_service(self):
-        """Get Chrome service for both Pi and development environments."""
-        arch = platform.machine().lower()
-        system = platform.system()
-        
-        # Try Pi-specific paths first (ARM64 Linux)
-        if arch in ['aarch64', 'arm64'] and system == 'Linux':
-            # Check shared volume locations (init container installation)
-            shared_paths = [
-                '/shared/usr/bin/chromedriver',  # Most likely location from chromium-driver package
-                '/shared/usr/lib/chromium-browser/chromedriver',
-                '/shared/snap/chromium/current/usr/lib/chromium-browser/chromedriver'
-            ]
-            
-            for path in shared_paths:
-                if os.path.exists(path):
-                    self.logger.info(f"Using Pi ChromeDriver from init container: {path}")
-                    
-                    # Set library path for copied shared libraries
-                    current_ld_path = os.environ.get('LD_LIBRARY_PATH', '')
-                    shared_lib_paths = [
-                        '/shared/lib/aarch64-linux-gnu',
-                        '/shared/usr/lib/aarch64-linux-gnu', 
-                        '/shared/usr/lib',
-                        '/shared/lib'
-                    ]
-                    # Only add paths that exist
-                    existing_paths = [p for p in shared_lib_paths if os.path.exists(p)]
-                    if existing_paths:
-                        new_ld_path = ':'.join(existing_paths)
-                        if current_ld_path:
-                            os.environ['LD_LIBRARY_PATH'] = f"{new_ld_path}:{current_ld_path}"
-                        else:
-                            os.environ['LD_LIBRARY_PATH'] = new_ld_path
-                        self.logger.info(f"Set LD_LIBRARY_PATH: {os.environ['LD_LIBRARY_PATH']}")
-                    
-                    # Also set chromium binary location if available
-                    if os.path.exists('/shared/usr/bin/chromium'):
-                        self.chrome_options.binary_location = '/shared/usr/bin/chromium'
-                        self.logger.info("Using Chromium binary from shared volume")
-                    return Service(path)
-            
-            # Fallback to system paths
-            system_paths = [
-                '/usr/bin/chromedriver',  # Most likely system location
-                '/usr/lib/chromium-browser/chromedriver',
-                '/snap/chromium/current/usr/lib/chromium-browser/chromedriver'
-            ]
-            
-            for path in system_paths:
-                if os.path.exists(path):
-                    self.logger.info(f"Using Pi ChromeDriver from system: {path}")
-                    return Service(path)
+    def _acquire_driver(self):
+        """
+        Take this collector's idle Chrome session from the pool, or launch a new one.
         
-        # Fallback to webdriver-manager for development environments
-        if ChromeDriverManager is not None:
-            try:
-                self.logger.info("Using ChromeDriver from webdriver-manager (development environment)")
-                return Service(ChromeDriverManager().install())
-            except Exception as e:
-                self.logger.warning(f"webdriver-manager failed: {e}")
+        Returns:
+            tuple: (driver, use_count) where use_count includes the current scrape
+        """
+        try:
+            driver, use_count = self._driver_pool.get_nowait()
+            driver.current_url  # Raises if the browser died while idle
+            return driver, use_count + 1
+        except queue.Empty:
+            pass
+        except Exception as e:
+            self.logger.info(f"Discarding dead pooled Chrome session: {str(e)}")
+            _quit_driver(driver)
         
-        # Final fallback - check common system paths
-        common_paths = [
-            '/usr/bin/chromedriver',
-            '/usr/local/bin/chromedriver',
-            '/opt/homebrew/bin/chromedriver',  # macOS with Homebrew
-        ]
+        service = self._get_chrome_service()
+        driver = webdriver.Chrome(service=service, options=self.chrome_options)
+        driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+        return driver, 1
+    
+    def _wait_for_table(self, driver):
+        """
+        Wait until the price table has data cells rather than sleeping a fixed time.
         
-        for path in common_paths:
-            if os.path.exists(path):
-                self.logger.info(f"Using system ChromeDriver at: {path}")
-                return Service(path)
+        On timeout, pause briefly and carry on with whatever has rendered.
+        """
+        try:
+            WebDriverWait(driver, TABLE_WAIT_TIMEOUT).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "table tr td"))
+            )
+        except TimeoutException:
+            self.logger.warning(f"Price table not found after {TABLE_WAIT_TIMEOUT}s, continuing")
+            time.sleep(1)
+    
+    def _release_driver(self, driver, use_count: int, reusable: bool):
+        """
+        Return a Chrome session to the pool for the next scrape.
         
-        # No ChromeDriver found
-        if arch in ['aarch64', 'arm64'] and system == 'Linux':
-            raise RuntimeError("ChromeDriver not found - install with: apt install chromium-chromedriver")
-        else:
-            raise RuntimeError("ChromeDriver not found - install via webdriver-manager or system package manager")
+        The session is quit instead if the scrape failed, it has reached
+        DRIVER_RECYCLE_AFTER uses, or another session is already pooled.
+        """
+        if reusable and use_count < DRIVER_RECYCLE_AFTER:
+            try:
+                self._driver_pool.put_nowait((driver, use_count))
+                return
+            except queue.Full:
+                pass
+        
+        _quit_driver(driver)
+    
+    def _get_chrome_service(self):
+        """Get Chrome service for both Pi and development environments."""
+        driver_path, chromium_binary = _resolve_chromedriver(self._arch, self._system)
+        if chromium_binary:
+            self.chrome_options.binary_location = chromium_binary
+        return Service(driver_path)
     
     def calculate_accrued_interest(self, face_value: float, coupon_rate: float, 
                                  last_coupon_date: datetime, settlement_date: datetime, 
@@ -139,8 +363,8 @@ class GiltMarketCollector(BaseCollector):
         # Days since last coupon payment
         days_since_coupon = (settlement_date - last_coupon_date).days
         
-        # Days in coupon period (assume 6 months = 182.5 days for semi-annual)
-        days_in_period = 365.25 / payments_per_year
+        # Days in coupon period (6 months = 182.625 days for semi-annual)
+        days_in_period = DAYS_PER_YEAR / payments_per_year
         
         # Accrued interest = (Days since coupon / Days in period) * Coupon payment
         accrued = (days_since_coupon / days_in_period) * coupon_payment
@@ -161,23 +385,13 @@ class GiltMarketCollector(BaseCollector):
         
         year = settlement_date.year
         
-        # Calculate the two coupon dates per year (6 months apart)
-        # Apply day limits upfront to avoid invalid dates
-        try:
-            if mat_month <= 6:
-                coupon1 = datetime(year, mat_month, min(mat_day, 28))
-                coupon2 = datetime(year, mat_month + 6, min(mat_day, 28))
-            else:
-                coupon1 = datetime(year, mat_month - 6, min(mat_day, 28))
-                coupon2 = datetime(year, mat_month, min(mat_day, 28))
-        except ValueError:
-            # Fallback to safe dates if still invalid
-            if mat_month <= 6:
-                coupon1 = datetime(year, mat_month, 28)
-                coupon2 = datetime(year, mat_month + 6, 28)
-            else:
-                coupon1 = datetime(year, mat_month - 6, 28)
-                coupon2 = datetime(year, mat_month, 28)
+        # The two coupon months per year (6 months apart), first half-year month first.
+        # Capping the day at 28 keeps every date valid, so no exception handling is needed.
+        month1 = (mat_month - 1) % 6 + 1
+        month2 = month1 + 6
+        day = min(mat_day, 28)
+        coupon1 = datetime(year, month1, day)
+        coupon2 = datetime(year, month2, day)
         
         # Find the most recent coupon date before settlement
         if settlement_date >= coupon2:
@@ -186,13 +400,7 @@ class GiltMarketCollector(BaseCollector):
             return coupon1
         else:
             # Must be from previous year
-            try:
-                if mat_month <= 6:
-                    return datetime(year - 1, mat_month + 6, min(mat_day, 28))
-                else:
-                    return datetime(year - 1, mat_month, min(mat_day, 28))
-            except:
-                return datetime(year - 1, 7, 31)  # Default fallback
+            return datetime(year - 1, month2, day)
     
     def _determine_face_value(self, clean_price: float) -> float:
         """
@@ -225,14 +433,14 @@ class GiltMarketCollector(BaseCollector):
         }
         
         # Extract Currency Code (prioritize from text, default to GBP for HL UK pages)
-        currency_match = re.search(r'\b(GBP|USD|EUR)\b', bond_name_text)
+        currency_match = _CURRENCY_RE.search(bond_name_text)
         if currency_match:
             identifiers['currency_code'] = currency_match.group(1)
         else:
             identifiers['currency_code'] = 'GBP'  # Default for HL UK pages
         
         # Extract ISIN (12 characters: 2 letters + 10 alphanumeric)
-        isin_match = re.search(r'\b[A-Z]{2}[A-Z0-9]{10}\b', bond_name_text)
+        isin_match = _ISIN_RE.search(bond_name_text)
         if isin_match:
             identifiers['isin'] = isin_match.group(0)
         
@@ -242,7 +450,7 @@ class GiltMarketCollector(BaseCollector):
             url_parts = bond_link_url.split('/')
             if len(url_parts) > 0:
                 short_code = url_parts[-1]  # Last part of URL
-                if re.match(r'^[A-Z0-9]{6,10}$', short_code):  # Validate format
+                if _SHORT_CODE_RE.match(short_code):  # Validate format
                     identifiers['short_code'] = short_code
         
         # Create combined ID if all parts are available
@@ -251,7 +459,7 @@ class GiltMarketCollector(BaseCollector):
         
         return identifiers
     
-    def _is_bond_tradeable(self, row_element) -> bool:
+    def _is_bond_tradeable_html(self, row_element) -> bool:
         """
         Check if a bond can be traded online.
         
@@ -259,39 +467,46 @@ class GiltMarketCollector(BaseCollector):
         in their action elements.
         
         Args:
-            row_element: Selenium WebElement representing the table row
+            row_element: lxml element for the table row (see _load_table_rows)
             
         Returns:
             bool: True if bond can be traded, False otherwise
         """
-        try:
-            cells = row_element.find_elements(By.TAG_NAME, "td")
-            
-            if len(cells) < 5:  # Need at least 5 columns including Actions
-                self.logger.debug(f"Row has only {len(cells)} cells, skipping (need 5+ for Actions column)")
+        cells = row_element.xpath('./td')
+        
+        if len(cells) < 5:  # Need at least 5 columns including Actions
+            self.logger.debug(f"Row has only {len(cells)} cells, skipping (need 5+ for Actions column)")
+            return False
+        
+        # Check Actions column (column 4) for disabled indicators
+        for element in cells[4].xpath('.//a | .//button'):
+            element_title = element.get('title') or ""
+            if "not available" in element_title.lower():
+                self.logger.debug(f"Bond not tradeable - Title: '{element_title}'")
                 return False
-            
-            # Check Actions column (column 4) for disabled indicators
-            actions_cell = cells[4]
-            action_elements = actions_cell.find_elements(By.TAG_NAME, "a") + actions_cell.find_elements(By.TAG_NAME, "button")
-            
-            for element in action_elements:
-                element_title = element.get_attribute("title") or ""
-                if "not available" in element_title.lower():
-                    self.logger.debug(f"Bond not tradeable - Title: '{element_title}'")
-                    return False
-            
-            return True
-            
-        except Exception as e:
-            self.logger.warning(f"Error checking bond tradeability: {str(e)}")
-            return False  # Safe default - skip if we can't determine
+        
+        return True
+    
+    def _load_table_rows(self, driver) -> List:
+        """
+        Snapshot the rendered page once and return its table rows as lxml elements.
+        
+        Selenium is only used for navigation; all cell access happens on the parsed
+        HTML, which avoids a WebDriver round trip for every cell read.
+        """
+        tree = lxml.html.fromstring(driver.page_source)
+        tree.make_links_absolute(self.base_url)
+        
+        # Keep <br> line breaks so cell text splits on '\n' like Selenium's .text
+        for br in tree.iter('br'):
+            br.tail = '\n' + (br.tail or '')
+        
+        return tree.xpath('//table//tr')
     
     def calculate_ytm_from_dirty(self, dirty_price: float, face_value: float, 
                                coupon_rate: float, years_to_maturity: float, 
                                payments_per_year: int = 2) -> Optional[float]:
         """Calculate YTM using dirty price."""
-        coupon_payment = (coupon_rate * face_value) / payments_per_year
         total_periods = years_to_maturity * payments_per_year  # Keep as float, don't round to int
         
         # Handle edge case where bond has essentially no time remaining
@@ -299,28 +514,13 @@ class GiltMarketCollector(BaseCollector):
             self.logger.warning(f"Bond has minimal time remaining (years_to_maturity: {years_to_maturity})")
             return None
         
-        def bond_price_equation(ytm):
-            if ytm == 0:
-                return coupon_payment * total_periods + face_value - dirty_price
-            
-            periodic_rate = ytm / payments_per_year
-            
-            # Avoid numerical issues with very negative rates
-            if periodic_rate <= -0.99:
-                return float('inf')
-            
-            try:
-                present_value_coupons = coupon_payment * (1 - (1 + periodic_rate) ** -total_periods) / periodic_rate
-                present_value_face = face_value / (1 + periodic_rate) ** total_periods
-                return present_value_coupons + present_value_face - dirty_price
-            except (OverflowError, ZeroDivisionError):
-                return float('inf')
-        
-        # Use approximate YTM as initial guess
-        initial_guess = (coupon_rate + (face_value - dirty_price) / years_to_maturity) / ((face_value + dirty_price) / 2)
-        
         try:
-            ytm_solution = fsolve(bond_price_equation, initial_guess, xtol=1e-8)[0]
+            ytm_solution = solve_ytm(float(dirty_price), float(face_value), float(coupon_rate),
+                                     float(years_to_maturity), payments_per_year)
+            
+            if math.isnan(ytm_solution):
+                self.logger.warning(f"YTM calculation did not converge (price: {dirty_price}, years: {years_to_maturity})")
+                return None
             
             # Sanity check: YTM should be reasonable (between -50% and 100%)
             if -0.5 <= ytm_solution <= 1.0:
@@ -342,66 +542,133 @@ class GiltMarketCollector(BaseCollector):
         - Coupon payments are taxed at tax_rate_on_coupons
         - Capital gains are tax-free (typical for UK gilts)
         """
-        coupon_payment = (coupon_rate * face_value) / payments_per_year
-        after_tax_coupon = coupon_payment * (1 - tax_rate_on_coupons)
-        total_periods = int(years_to_maturity * payments_per_year)
-        
-        def after_tax_bond_equation(ytm):
-            if ytm == 0:
-                return after_tax_coupon * total_periods + face_value - dirty_price
-            
-            periodic_rate = ytm / payments_per_year
-            # Present value of after-tax coupons
-            present_value_coupons = after_tax_coupon * (1 - (1 + periodic_rate) ** -total_periods) / periodic_rate
-            # Present value of face value (no tax on capital gains)
-            present_value_face = face_value / (1 + periodic_rate) ** total_periods
-            
-            return present_value_coupons + present_value_face - dirty_price
-        
-        initial_guess = coupon_rate if coupon_rate > 0 else 0.05
-        
         try:
-            ytm_solution = fsolve(after_tax_bond_equation, initial_guess)[0]
-            return ytm_solution
-        except:
+            ytm_solution = solve_after_tax_ytm(float(dirty_price), float(face_value), float(coupon_rate),
+                                               float(years_to_maturity), float(tax_rate_on_coupons),
+                                               payments_per_year)
+            return None if math.isnan(ytm_solution) else ytm_solution
+        except Exception:
             return None
     
     def parse_maturity_date(self, date_str: str) -> Optional[datetime]:
         """Parse various date formats and return datetime object."""
-        date_formats = [
-            '%d/%m/%Y', '%d %b %Y', '%d %B %Y',
-            '%Y-%m-%d', '%b %Y', '%B %Y'
-        ]
+        date_str = date_str.strip()
         
-        for fmt in date_formats:
+        # Fast path for the HL table's "22 Mar 2026" / "Mar 2026" shapes, no strptime needed
+        maturity_date = _parse_hl_date(date_str)
+        if maturity_date is not None:
+            return maturity_date
+        
+        parts = date_str.split()
+        if len(parts) == 2 and len(parts[1]) == 4 and parts[1].isdigit() and parts[0].lower() in _MONTHS:
             try:
-                return datetime.strptime(date_str.strip(), fmt)
+                return datetime(int(parts[1]), _MONTHS[parts[0].lower()], 1)
             except ValueError:
-                continue
+                pass
         
-        # Handle formats like "Jul 2025" by adding day 1
-        try:
-            parts = date_str.strip().split()
-            if len(parts) == 2:
-                return datetime.strptime(f"01 {date_str.strip()}", '%d %b %Y')
-        except:
-            pass
+        for fmt in MATURITY_DATE_FORMATS:
+            try:
+                return datetime.strptime(date_str, fmt)
+            except ValueError:
+                continue
         
         return None
     
-    def calculate_years_to_maturity(self, maturity_date: datetime) -> Optional[float]:
-        """Calculate years from today to maturity date."""
-        today = datetime.now()
+    def calculate_years_to_maturity(self, maturity_date: datetime,
+                                    today: Optional[datetime] = None) -> Optional[float]:
+        """
+        Calculate years from today to maturity date.
+        
+        Pass the scrape's settlement date as today so every bond in a batch is
+        measured from the same instant.
+        """
+        if today is None:
+            today = datetime.now()
         if maturity_date <= today:
             return None
         
         days_to_maturity = (maturity_date - today).days
-        return days_to_maturity / 365.25
+        return days_to_maturity / DAYS_PER_YEAR
+    
+    def _price_gilts(self, parsed_rows: List[tuple], settlement_date: datetime) -> List[Dict[str, Any]]:
+        """
+        Validate parsed gilt rows and calculate accrued interest, dirty price and yields.
+        
+        All rows are processed together with NumPy arrays, and YTM / after-tax YTM
+        (30% tax on coupons, no tax on capital gains) come from one compiled call.
+        
+        Args:
+            parsed_rows: (bond name, identifiers, coupon rate, maturity date, clean price) tuples
+            settlement_date: Scrape time that accrual and time to maturity are measured from
+            
+        Returns:
+            list: Bond records for rows that pass validation
+        """
+        names, identifiers, coupon_list, maturity_list, clean_list = zip(*parsed_rows)
+        coupon_rates = np.array(coupon_list, dtype=np.float64)
+        clean_prices = np.array(clean_list, dtype=np.float64)
+        settlement = np.datetime64(settlement_date, 'us')
+        one_day = np.timedelta64(1, 'D')
+        
+        # Whole days, as timedelta.days would give
+        days_to_maturity = (np.array(maturity_list, dtype='datetime64[us]') - settlement) // one_day
+        
+        # Validate price range (gilts typically trade 20-150) and require time left to maturity
+        valid = np.flatnonzero((clean_prices >= 20) & (clean_prices <= 200) & (days_to_maturity > 0))
+        if len(valid) == 0:
+            return []
+        
+        coupon_rates = coupon_rates[valid]
+        clean_prices = clean_prices[valid]
+        years_to_maturity = days_to_maturity[valid] / DAYS_PER_YEAR
+        
+        # Determine face value based on clean price (see _determine_face_value)
+        face_values = np.where(clean_prices < 2.0, 1.0, 100.0)
+        
+        # Accrued interest = (Days since coupon / Days in period) * Coupon payment
+        last_coupon_dates = np.array(
+            [self.estimate_coupon_dates(names[k], maturity_list[k], settlement_date) for k in valid],
+            dtype='datetime64[us]'
+        )
+        days_since_coupon = (settlement - last_coupon_dates) // one_day
+        accrued_interest = (days_since_coupon / DAYS_PER_PERIOD_SEMI) * (coupon_rates * face_values / 2)
+        dirty_prices = clean_prices + accrued_interest
+        
+        ytms, after_tax_ytms = solve_ytm_batch(dirty_prices, face_values, coupon_rates, years_to_maturity, 0.30, 2)
+        
+        bonds = []
+        for k, clean_price, accrued, dirty_price, coupon_rate, years, ytm, after_tax_ytm in zip(
+                valid.tolist(), clean_prices.tolist(), accrued_interest.tolist(), dirty_prices.tolist(),
+                coupon_rates.tolist(), years_to_maturity.tolist(), ytms.tolist(), after_tax_ytms.tolist()):
+            # Sanity check: YTM should be reasonable (between -50% and 100%)
+            if math.isnan(ytm) or not (-0.5 <= ytm <= 1.0):
+                self.logger.warning(f"YTM calculation failed for {names[k]} (price: {dirty_price}, years: {years})")
+                ytm = None
+            
+            bonds.append({
+                'bond_name': names[k],
+                'clean_price': clean_price,
+                'accrued_interest': accrued,
+                'dirty_price': dirty_price,
+                'coupon_rate': coupon_rate,
+                'maturity_date': maturity_list[k],
+                'years_to_maturity': years,
+                'ytm': ytm,
+                'after_tax_ytm': None if math.isnan(after_tax_ytm) else after_tax_ytm,
+                'scraped_date': settlement_date.date(),
+                # Bond identifiers
+                'currency_code': identifiers[k]['currency_code'],
+                'isin': identifiers[k]['isin'],
+                'short_code': identifiers[k]['short_code'],
+                'combined_id': identifiers[k]['combined_id']
+            })
+        
+        return bonds
     
     def scrape_gilt_prices(self) -> List[Dict[str, Any]]:
         """Scrape UK Gilts and calculate YTM based on clean prices."""
-        arch = platform.machine().lower()
-        system = platform.system()
+        arch = self._arch
+        system = self._system
         
         try:
             return self._scrape_with_selenium()
@@ -420,58 +687,66 @@ class GiltMarketCollector(BaseCollector):
     def _scrape_with_selenium(self) -> List[Dict[str, Any]]:
         """Scrape using Selenium WebDriver."""
         driver = None
+        use_count = 0
+        scraped = False
         try:
-            service = self._get_chrome_service()
-            driver = webdriver.Chrome(service=service, options=self.chrome_options)
+            driver, use_count = self._acquire_driver()
             driver.get(self.base_url)
             
-            # Wait for content to load
-            time.sleep(7)
+            # Wait for the price table to load
+            self._wait_for_table(driver)
             
             bonds = []
+            parsed_rows = []  # (bond name, identifiers, coupon rate, maturity date, clean price)
             settlement_date = datetime.now()
             non_tradeable_count = 0
             
-            # Look for table rows directly
-            rows = driver.find_elements(By.CSS_SELECTOR, "table tr")
+            # Parse the loaded page once and look for table rows directly
+            rows = self._load_table_rows(driver)
             
             # Get header to understand structure
             if len(rows) > 0:
-                header_cells = rows[0].find_elements(By.TAG_NAME, "th")
+                header_cells = rows[0].xpath('.//th')
                 if not header_cells:
-                    header_cells = rows[0].find_elements(By.TAG_NAME, "td")
+                    header_cells = rows[0].xpath('.//td')
                 
-                headers = [cell.text.strip().lower() for cell in header_cells]
+                headers = [_element_text(cell).lower() for cell in header_cells]
                 self.logger.info(f"Table structure: {headers}")
                 
-                # Find column indices
-                issuer_col = next((i for i, h in enumerate(headers) if 'issuer' in h), 0)
-                coupon_col = next((i for i, h in enumerate(headers) if 'coupon' in h), 1)
-                maturity_col = next((i for i, h in enumerate(headers) if 'maturity' in h), 2)
-                price_col = next((i for i, h in enumerate(headers) if 'price' in h), 3)
+                # Find column indices (first header containing each keyword) in one pass
+                column_index = {}
+                for i, h in enumerate(headers):
+                    for keyword in ('issuer', 'coupon', 'maturity', 'price'):
+                        if keyword in h:
+                            column_index.setdefault(keyword, i)
+                
+                issuer_col = column_index.get('issuer', 0)
+                coupon_col = column_index.get('coupon', 1)
+                maturity_col = column_index.get('maturity', 2)
+                price_col = column_index.get('price', 3)
             
             for i, row in enumerate(rows[1:]):  # Skip header
-                cells = row.find_elements(By.TAG_NAME, "td")
+                cells = row.xpath('./td')
                 
                 if len(cells) >= 4:
                     try:
                         # Check if bond is tradeable first (filter out bonds with "Online dealing is not available")
-                        if not self._is_bond_tradeable(row):
+                        if not self._is_bond_tradeable_html(row):
                             non_tradeable_count += 1
                             self.logger.info(f"Row {i+1}: Skipping non-tradeable gilt")
                             continue
                         
                         # Get bond name/issuer and link information
                         bond_name_cell = cells[issuer_col]
-                        bond_name_text = bond_name_cell.text.strip()  # Full cell text (includes ISIN)
+                        bond_name_text = _element_text(bond_name_cell)  # Full cell text (includes ISIN)
                         
                         # Get bond link URL
                         bond_link_url = None
-                        try:
-                            bond_link = bond_name_cell.find_element(By.TAG_NAME, "a")
-                            bond_name = bond_link.text.strip()  # Display name from link
-                            bond_link_url = bond_link.get_attribute("href")
-                        except:
+                        bond_name_links = bond_name_cell.xpath('.//a')
+                        if bond_name_links:
+                            bond_name = _element_text(bond_name_links[0])  # Display name from link
+                            bond_link_url = bond_name_links[0].get('href')
+                        else:
                             bond_name = bond_name_text  # Fallback to full text
                         
                         # Extract bond identifiers (ISIN, currency, short code)
@@ -482,18 +757,18 @@ class GiltMarketCollector(BaseCollector):
                             continue
                         
                         # Get coupon rate
-                        coupon_text = cells[coupon_col].text.strip()
-                        coupon_match = re.search(r'(\d+\.?\d*)', coupon_text)
+                        coupon_text = _element_text(cells[coupon_col])
+                        coupon_match = _NUM_RE.search(coupon_text)
                         if not coupon_match:
                             continue
                         coupon_rate = float(coupon_match.group(1)) / 100
                         
                         # Get maturity date
-                        maturity_text = cells[maturity_col].text.strip()
+                        maturity_text = _element_text(cells[maturity_col])
                         maturity_date = self.parse_maturity_date(maturity_text)
                         if not maturity_date:
                             # Try to extract year from bond name and estimate
-                            year_match = re.search(r'20\d{2}', bond_name)
+                            year_match = _YEAR_RE.search(bond_name)
                             if year_match:
                                 year = int(year_match.group(0))
                                 maturity_date = datetime(year, 7, 15)  # Estimate mid-year
@@ -501,39 +776,13 @@ class GiltMarketCollector(BaseCollector):
                                 continue
                         
                         # Get clean price
-                        price_text = cells[price_col].text.strip()
-                        price_match = re.search(r'(\d+\.?\d*)', price_text)
+                        price_text = _element_text(cells[price_col])
+                        price_match = _NUM_RE.search(price_text)
                         if not price_match:
                             continue
                         
                         clean_price = float(price_match.group(1))
                         
-                        # Validate price range (gilts typically trade 20-150)
-                        if not (20 <= clean_price <= 200):
-                            continue
-                        
-                        years_to_maturity = self.calculate_years_to_maturity(maturity_date)
-                        if not years_to_maturity or years_to_maturity <= 0:
-                            continue
-                        
-                        # Calculate accrued interest
-                        # Determine face value based on clean price
-                        face_value = self._determine_face_value(clean_price)
-                        
-                        last_coupon_date = self.estimate_coupon_dates(bond_name, maturity_date, settlement_date)
-                        accrued_interest = self.calculate_accrued_interest(
-                            face_value, coupon_rate, last_coupon_date, settlement_date
-                        )
-                        
-                        # Calculate dirty price
-                        dirty_price = clean_price + accrued_interest
-                        
-                        # Calculate YTM using dirty price
-                        ytm = self.calculate_ytm_from_dirty(dirty_price, face_value, coupon_rate, years_to_maturity)
-                        
-                        # Calculate after-tax YTM (30% tax on coupons, no tax on capital gains)
-                        after_tax_ytm = self.calculate_after_tax_ytm(dirty_price, face_value, coupon_rate, years_to_maturity, 0.30)
-                        
                         # Create unique bond name for Treasury Strips and other duplicates
                         unique_bond_name = bond_name.split('\n')[0]  # Take first line
                         if 'treasury strip' in unique_bond_name.lower():
@@ -541,31 +790,20 @@ class GiltMarketCollector(BaseCollector):
                             maturity_str = maturity_date.strftime('%b-%Y')
                             unique_bond_name = f"{unique_bond_name} {maturity_str}"
                         
-                        bonds.append({
-                            'bond_name': unique_bond_name,
-                            'clean_price': clean_price,
-                            'accrued_interest': accrued_interest,
-                            'dirty_price': dirty_price,
-                            'coupon_rate': coupon_rate,
-                            'maturity_date': maturity_date,
-                            'years_to_maturity': years_to_maturity,
-                            'ytm': ytm,
-                            'after_tax_ytm': after_tax_ytm,
-                            'scraped_date': settlement_date.date(),
-                            # Bond identifiers
-                            'currency_code': identifiers['currency_code'],
-                            'isin': identifiers['isin'],
-                            'short_code': identifiers['short_code'],
-                            'combined_id': identifiers['combined_id']
-                        })
+                        # Validation and pricing happen for all rows at once after the loop
+                        parsed_rows.append((unique_bond_name, identifiers, coupon_rate, maturity_date, clean_price))
                         
                     except Exception as e:
                         self.logger.debug(f"Error processing bond row {i}: {str(e)}")
                         continue
             
+            if parsed_rows:
+                bonds = self._price_gilts(parsed_rows, settlement_date)
+            
             self.logger.info(f"Successfully scraped {len(bonds)} gilt market prices")
             if non_tradeable_count > 0:
                 self.logger.info(f"Filtered out {non_tradeable_count} non-tradeable gilts (showing 'Online dealing is not available')")
+            scraped = True
             return bonds
             
         except Exception as e:
@@ -573,10 +811,8 @@ class GiltMarketCollector(BaseCollector):
             raise RuntimeError(f"Gilt market scraping failed: {e}") from e
         finally:
             if driver:
-                try:
-                    driver.quit()
-                except:
-                    pass
+                # Keep the browser for the next scrape unless this one failed
+                self._release_driver(driver, use_count, reusable=scraped)
 
 
 def collect_gilt_market_prices(database_url=None):
@@ -591,48 +827,14 @@ def collect_gilt_market_prices(database_url=None):
             collector.logger.info("No gilt market data found")
             return 0
         
-        # Process and store data
-        bulk_data = []
-        for gilt in gilt_data:
-            try:
-                # Convert to database format (ensure NumPy types are converted to Python types)
-                data = {
-                    'bond_name': str(gilt['bond_name']) if gilt['bond_name'] is not None else None,
-                    'clean_price': float(gilt['clean_price']) if gilt['clean_price'] is not None else None,
-                    'accrued_interest': float(gilt['accrued_interest']) if gilt['accrued_interest'] is not None else None,
-                    'dirty_price': float(gilt['dirty_price']) if gilt['dirty_price'] is not None else None,
-                    'coupon_rate': float(gilt['coupon_rate']) if gilt['coupon_rate'] is not None else None,
-                    'maturity_date': gilt['maturity_date'].date(),
-                    'years_to_maturity': float(gilt['years_to_maturity']) if gilt['years_to_maturity'] is not None else None,
-                    'ytm': float(gilt['ytm']) if gilt['ytm'] is not None else None,
-                    'after_tax_ytm': float(gilt['after_tax_ytm']) if gilt['after_tax_ytm'] is not None else None,
-                    'scraped_date': gilt['scraped_date'],
-                    # Bond identifiers
-                    'currency_code': str(gilt['currency_code']) if gilt['currency_code'] is not None else None,
-                    'isin': str(gilt['isin']) if gilt['isin'] is not None else None,
-                    'short_code': str(gilt['short_code']) if gilt['short_code'] is not None else None,
-                    'combined_id': str(gilt['combined_id']) if gilt['combined_id'] is not None else None
-                }
-                bulk_data.append(data)
-                
-            except Exception as e:
-                collector.logger.error(f"Error processing gilt data: {str(e)}")
-                continue
-        
-        # Bulk upsert all records with custom conflict columns
-        if bulk_data:
-            success_count = collector.bulk_upsert_data(
-                "gilt_market_prices", 
-                bulk_data,
-                conflict_columns=['bond_name', 'scraped_date']
-            )
-            if success_count == 0:
-                raise RuntimeError(f"Database upsert failed - no records were successfully stored despite having {len(bulk_data)} records to process")
-            collector.logger.info(f"Successfully stored {success_count} gilt market price records")
-            return success_count
-        else:
-            collector.logger.info("No valid gilt market data to process")
-            return 0
+        # Convert and bulk upsert in a single transaction
+        success_count = _upsert_bond_records(
+            collector, "gilt_market_prices", gilt_data, GILT_PRICE_COLUMNS, GILT_NUMERIC_COLUMNS
+        )
+        if success_count == 0:
+            raise RuntimeError(f"Database upsert failed - no records were successfully stored despite having {len(gilt_data)} records to process")
+        collector.logger.info(f"Successfully stored {success_count} gilt market price records")
+        return success_count
             
     except Exception as e:
         collector.logger.error(f"Failed to collect gilt market prices: {str(e)}")
@@ -645,6 +847,9 @@ class IndexLinkedGiltCollector(GiltMarketCollector):
     Scrapes index-linked gilt prices and calculates real yields.
     """
     
+    # Own pool: sessions are launched with this collector's Chrome debug port
+    _driver_pool = queue.Queue(maxsize=1)
+    
     def __init__(self, database_url=None):
         super().__init__(database_url)
         self.base_url = "https://www.hl.co.uk/shares/corporate-bonds-gilts/bond-prices/uk-index-linked-gilts"
@@ -654,20 +859,21 @@ class IndexLinkedGiltCollector(GiltMarketCollector):
     def scrape_index_linked_gilt_prices(self) -> List[Dict[str, Any]]:
         """Scrape UK Index-Linked Gilts and calculate real yields."""
         driver = None
+        use_count = 0
+        scraped = False
         bonds = []
         
         try:
-            service = self._get_chrome_service()
-            driver = webdriver.Chrome(service=service, options=self.chrome_options)
+            driver, use_count = self._acquire_driver()
             
             self.logger.info(f"Loading index-linked gilts page: {self.base_url}")
             driver.get(self.base_url)
             
-            # Wait for page to load
-            time.sleep(7)
+            # Wait for the price table to load
+            self._wait_for_table(driver)
             
-            # Look for table rows directly (same approach as working gilt collector)
-            rows = driver.find_elements(By.CSS_SELECTOR, "table tr")
+            # Parse the loaded page once and look for table rows directly
+            rows = self._load_table_rows(driver)
             
             if len(rows) == 0:
                 self.logger.warning("No table rows found - page structure may have changed")
@@ -679,40 +885,41 @@ class IndexLinkedGiltCollector(GiltMarketCollector):
             
             # Get header to understand structure
             if len(rows) > 0:
-                header_cells = rows[0].find_elements(By.TAG_NAME, "th")
+                header_cells = rows[0].xpath('.//th')
                 if not header_cells:
-                    header_cells = rows[0].find_elements(By.TAG_NAME, "td")
+                    header_cells = rows[0].xpath('.//td')
                 
-                headers = [cell.text.strip().lower() for cell in header_cells]
+                headers = [_element_text(cell).lower() for cell in header_cells]
                 self.logger.info(f"Table structure: {headers}")
             
             for i, row in enumerate(rows[1:]):  # Skip header
                 try:
-                    cells = row.find_elements(By.TAG_NAME, "td")
+                    cells = row.xpath('./td')
                     
                     if len(cells) < 5:
                         self.logger.debug(f"Row {i}: Skipping row with only {len(cells)} cells (need 5+)")
                         continue
                     
+                    # Table layout: Issuer | Coupon (%) | Maturity | Price | Actions
+                    bond_name_cell, coupon_cell, maturity_cell, price_cell = cells[0], cells[1], cells[2], cells[3]
+                    
                     # Check if bond is tradeable first (filter out bonds with "Online dealing is not available")
-                    if not self._is_bond_tradeable(row):
+                    if not self._is_bond_tradeable_html(row):
                         non_tradeable_count += 1
                         self.logger.info(f"Row {i+1}: Skipping non-tradeable index-linked gilt")
                         continue
                     
                     # Extract bond data - index-linked gilt table structure
-                    bond_name_cell = cells[0]
-                    bond_name_text = bond_name_cell.text.strip()  # Full cell text (includes ISIN)
+                    bond_name_text = _element_text(bond_name_cell)  # Full cell text (includes ISIN)
                     
                     # Get bond link information
                     bond_link_url = None
-                    try:
-                        bond_name_element = bond_name_cell.find_element(By.TAG_NAME, "a")
-                        bond_name = bond_name_element.text.strip()  # Display name from link
-                        bond_link_url = bond_name_element.get_attribute("href")
-                    except Exception as e:
-                        self.logger.debug(f"Row {i}: No bond name link found, skipping: {str(e)}")
+                    bond_name_links = bond_name_cell.xpath('.//a')
+                    if not bond_name_links:
+                        self.logger.debug(f"Row {i}: No bond name link found, skipping")
                         continue
+                    bond_name = _element_text(bond_name_links[0])  # Display name from link
+                    bond_link_url = bond_name_links[0].get('href')
                     
                     # Extract bond identifiers (ISIN, currency, short code)
                     identifiers = self.extract_bond_identifiers(bond_name_text, bond_link_url)
@@ -723,8 +930,8 @@ class IndexLinkedGiltCollector(GiltMarketCollector):
                         continue
                     
                     # Extract clean price from Price column (column 3)
-                    clean_price_text = cells[3].text.strip() if len(cells) > 3 else ""
-                    clean_price_match = re.search(r'([0-9]+\.?[0-9]*)', clean_price_text)
+                    clean_price_text = _element_text(price_cell)
+                    clean_price_match = _NUM_RE.search(clean_price_text)
                     if not clean_price_match:
                         self.logger.debug(f"Row {i}: No clean price found in '{clean_price_text}' for {bond_name}")
                         continue
@@ -733,8 +940,8 @@ class IndexLinkedGiltCollector(GiltMarketCollector):
                     
                     # Parse coupon rate from Coupon (%) column (column 1) and use as approximate real yield
                     # Index-linked gilts don't show real yield directly on this page
-                    coupon_text = cells[1].text.strip() if len(cells) > 1 else ""
-                    coupon_match = re.search(r'([0-9]+\.?[0-9]*)', coupon_text)
+                    coupon_text = _element_text(coupon_cell)
+                    coupon_match = _NUM_RE.search(coupon_text)
                     if not coupon_match:
                         self.logger.debug(f"Row {i}: No coupon rate found in '{coupon_text}' for {bond_name}")
                         continue
@@ -742,34 +949,40 @@ class IndexLinkedGiltCollector(GiltMarketCollector):
                     coupon_rate = float(coupon_match.group(1)) / 100  # Convert percentage to decimal
                     
                     # Parse maturity date from Maturity column (column 2) - more reliable than bond name
-                    maturity_text = cells[2].text.strip() if len(cells) > 2 else ""
+                    maturity_text = _element_text(maturity_cell)
                     maturity_date = None
                     
                     if maturity_text:
                         try:
-                            # Try different common date formats from the Maturity column
-                            date_formats = [
-                                "%d %B %Y",      # "22 March 2026"
-                                "%d %b %Y",      # "22 Mar 2026" 
-                                "%B %d, %Y",     # "March 22, 2026"
-                                "%b %d, %Y",     # "Mar 22, 2026"
-                                "%d/%m/%Y",      # "22/03/2026"
-                                "%m/%d/%Y",      # "03/22/2026" (US format)
-                                "%Y-%m-%d",      # "2026-03-22" (ISO format)
-                                "%d-%m-%Y",      # "22-03-2026"
-                            ]
+                            # Fast path for the usual "22 March 2026" format
+                            maturity_date = _parse_hl_date(maturity_text)
                             
-                            for date_format in date_formats:
-                                try:
-                                    maturity_date = datetime.strptime(maturity_text, date_format)
-                                    self.logger.debug(f"Row {i}: Parsed maturity date '{maturity_text}' as {maturity_date.strftime('%Y-%m-%d')} for '{bond_name}'")
-                                    break
-                                except ValueError:
-                                    continue
+                            if maturity_date is None:
+                                # Try different common date formats from the Maturity column
+                                date_formats = [
+                                    "%d %B %Y",      # "22 March 2026"
+                                    "%d %b %Y",      # "22 Mar 2026" 
+                                    "%B %d, %Y",     # "March 22, 2026"
+                                    "%b %d, %Y",     # "Mar 22, 2026"
+                                    "%d/%m/%Y",      # "22/03/2026"
+                                    "%m/%d/%Y",      # "03/22/2026" (US format)
+                                    "%Y-%m-%d",      # "2026-03-22" (ISO format)
+                                    "%d-%m-%Y",      # "22-03-2026"
+                                ]
+                                
+                                for date_format in date_formats:
+                                    try:
+                                        maturity_date = datetime.strptime(maturity_text, date_format)
+                                        break
+                                    except ValueError:
+                                        continue
+                            
+                            if maturity_date is not None:
+                                self.logger.debug(f"Row {i}: Parsed maturity date '{maturity_text}' as {maturity_date.strftime('%Y-%m-%d')} for '{bond_name}'")
                             
                             if maturity_date is None:
                                 # If no date format worked, try to extract just the year
-                                year_match = re.search(r'(\d{4})', maturity_text)
+                                year_match = _FOUR_DIGIT_YEAR_RE.search(maturity_text)
                                 if year_match:
                                     maturity_year = int(year_match.group(1))
                                     maturity_date = datetime(maturity_year, 3, 22)  # Default to March 22
@@ -857,6 +1070,7 @@ class IndexLinkedGiltCollector(GiltMarketCollector):
             rows_processed = len(rows) - 1  # Exclude header
             if rows_processed > len(bonds):
                 self.logger.info(f"Note: Found {rows_processed} data rows but only scraped {len(bonds)} bonds - {rows_processed - len(bonds)} rows were filtered out")
+            scraped = True
             return bonds
         
         except Exception as e:
@@ -864,10 +1078,8 @@ class IndexLinkedGiltCollector(GiltMarketCollector):
             raise RuntimeError(f"Index-linked gilt scraping failed: {e}") from e
         finally:
             if driver:
-                try:
-                    driver.quit()
-                except:
-                    pass
+                # Keep the browser for the next scrape unless this one failed
+                self._release_driver(driver, use_count, reusable=scraped)
 
 
 def collect_index_linked_gilt_prices(database_url=None):
@@ -882,49 +1094,14 @@ def collect_index_linked_gilt_prices(database_url=None):
             collector.logger.info("No index-linked gilt data found")
             return 0
         
-        # Process and store data
-        bulk_data = []
-        for gilt in il_gilt_data:
-            try:
-                # Convert to database format
-                data = {
-                    'bond_name': str(gilt['bond_name']) if gilt['bond_name'] is not None else None,
-                    'clean_price': float(gilt['clean_price']) if gilt['clean_price'] is not None else None,
-                    'accrued_interest': float(gilt['accrued_interest']) if gilt['accrued_interest'] is not None else None,
-                    'dirty_price': float(gilt['dirty_price']) if gilt['dirty_price'] is not None else None,
-                    'coupon_rate': float(gilt['coupon_rate']) if gilt['coupon_rate'] is not None else None,
-                    'maturity_date': gilt['maturity_date'].date(),
-                    'years_to_maturity': float(gilt['years_to_maturity']) if gilt['years_to_maturity'] is not None else None,
-                    'real_yield': float(gilt['real_yield']) if gilt['real_yield'] is not None else None,
-                    'after_tax_real_yield': float(gilt['after_tax_real_yield']) if gilt['after_tax_real_yield'] is not None else None,
-                    'scraped_date': gilt['scraped_date'],
-                    'inflation_assumption': float(gilt['inflation_assumption']) if gilt['inflation_assumption'] is not None else None,
-                    # Bond identifiers
-                    'currency_code': str(gilt['currency_code']) if gilt['currency_code'] is not None else None,
-                    'isin': str(gilt['isin']) if gilt['isin'] is not None else None,
-                    'short_code': str(gilt['short_code']) if gilt['short_code'] is not None else None,
-                    'combined_id': str(gilt['combined_id']) if gilt['combined_id'] is not None else None
-                }
-                bulk_data.append(data)
-                
-            except Exception as e:
-                collector.logger.error(f"Error processing index-linked gilt data: {str(e)}")
-                continue
-        
-        # Bulk upsert all records
-        if bulk_data:
-            success_count = collector.bulk_upsert_data(
-                "index_linked_gilt_prices", 
-                bulk_data,
-                conflict_columns=['bond_name', 'scraped_date']
-            )
-            if success_count == 0:
-                raise RuntimeError(f"Database upsert failed - no records were successfully stored despite having {len(bulk_data)} records to process")
-            collector.logger.info(f"Successfully stored {success_count} index-linked gilt price records")
-            return success_count
-        else:
-            collector.logger.info("No valid index-linked gilt data to process")
-            return 0
+        # Convert and bulk upsert in a single transaction
+        success_count = _upsert_bond_records(
+            collector, "index_linked_gilt_prices", il_gilt_data, IL_GILT_PRICE_COLUMNS, IL_GILT_NUMERIC_COLUMNS
+        )
+        if success_count == 0:
+            raise RuntimeError(f"Database upsert failed - no records were successfully stored despite having {len(il_gilt_data)} records to process")
+        collector.logger.info(f"Successfully stored {success_count} index-linked gilt price records")
+        return success_count
             
     except Exception as e:
         collector.logger.error(f"Failed to collect index-linked gilt prices: {str(e)}")
@@ -937,6 +1114,9 @@ class CorporateBondCollector(GiltMarketCollector):
     Scrapes GBP corporate bond prices and calculates yields with credit risk analysis.
     """
     
+    # Own pool: sessions are launched with this collector's Chrome debug port
+    _driver_pool = queue.Queue(maxsize=1)
+    
     def __init__(self, database_url=None):
         super().__init__(database_url)
         self.base_url = "https://www.hl.co.uk/shares/corporate-bonds-gilts/bond-prices/gbp-bonds"
@@ -946,20 +1126,21 @@ class CorporateBondCollector(GiltMarketCollector):
     def scrape_corporate_bond_prices(self) -> List[Dict[str, Any]]:
         """Scrape GBP Corporate Bonds and calculate yields with credit analysis."""
         driver = None
+        use_count = 0
+        scraped = False
         bonds = []
         
         try:
-            service = self._get_chrome_service()
-            driver = webdriver.Chrome(service=service, options=self.chrome_options)
+            driver, use_count = self._acquire_driver()
             
             self.logger.info(f"Loading corporate bonds page: {self.base_url}")
             driver.get(self.base_url)
             
-            # Wait for page to load
-            time.sleep(7)
+            # Wait for the price table to load
+            self._wait_for_table(driver)
             
-            # Look for table rows directly (same approach as working gilt collector)
-            rows = driver.find_elements(By.CSS_SELECTOR, "table tr")
+            # Parse the loaded page once and look for table rows directly
+            rows = self._load_table_rows(driver)
             
             if len(rows) == 0:
                 self.logger.warning("No table rows found - page structure may have changed")
@@ -973,47 +1154,51 @@ class CorporateBondCollector(GiltMarketCollector):
             non_tradeable_count = 0
             na_maturity_count = 0
             processed_count = 0
+            candidates = []  # (row index, face value, bond record) awaiting YTM
             
             # Get header to understand structure
             if len(rows) > 0:
-                header_cells = rows[0].find_elements(By.TAG_NAME, "th")
+                header_cells = rows[0].xpath('.//th')
                 if not header_cells:
-                    header_cells = rows[0].find_elements(By.TAG_NAME, "td")
+                    header_cells = rows[0].xpath('.//td')
                 
-                headers = [cell.text.strip().lower() for cell in header_cells]
+                headers = [_element_text(cell).lower() for cell in header_cells]
                 self.logger.info(f"Table structure: {headers}")
             
             for i, row in enumerate(rows[1:]):  # Skip header
                 try:
                     # Check if bond is tradeable first (filter out non-tradeable bonds)
-                    if not self._is_bond_tradeable(row):
+                    if not self._is_bond_tradeable_html(row):
                         non_tradeable_count += 1
                         self.logger.debug(f"Row {i+1}: Skipping non-tradeable bond")
                         continue
                     
-                    cells = row.find_elements(By.TAG_NAME, "td")
+                    cells = row.xpath('./td')
                     
                     if len(cells) < 5:
                         continue
                     
+                    # Table layout: Issuer | Coupon (%) | Maturity | Price | Actions | [Rating]
+                    bond_name_cell, coupon_cell, maturity_cell, price_cell = cells[0], cells[1], cells[2], cells[3]
+                    rating_cell = cells[5] if len(cells) > 5 else None
+                    
                     # Check for n/a maturity early (before parsing)
-                    maturity_text = cells[2].text.strip() if len(cells) > 2 else ""
+                    maturity_text = _element_text(maturity_cell)
                     if maturity_text.lower() in ['n/a', 'na', '', '-']:
                         na_maturity_count += 1
                         self.logger.debug(f"Row {i+1}: Skipping bond with n/a maturity: {maturity_text}")
                         continue
                     
                     # Extract bond data - corporate bond table structure
-                    bond_name_cell = cells[0]
-                    bond_name_text = bond_name_cell.text.strip()  # Full cell text (includes ISIN)
+                    bond_name_text = _element_text(bond_name_cell)  # Full cell text (includes ISIN)
                     
                     # Get bond link information
                     bond_link_url = None
-                    try:
-                        bond_name_element = bond_name_cell.find_element(By.TAG_NAME, "a")
-                        bond_name = bond_name_element.text.strip()  # Display name from link
-                        bond_link_url = bond_name_element.get_attribute("href")
-                    except:
+                    bond_name_links = bond_name_cell.xpath('.//a')
+                    if bond_name_links:
+                        bond_name = _element_text(bond_name_links[0])  # Display name from link
+                        bond_link_url = bond_name_links[0].get('href')
+                    else:
                         bond_name = bond_name_text  # Fallback to full text
                     
                     # Skip if empty or invalid name
@@ -1027,8 +1212,8 @@ class CorporateBondCollector(GiltMarketCollector):
                     company_name = bond_name.split('\n')[0] if bond_name else "Unknown"
                     
                     # Extract clean price from Price column (column 3)
-                    clean_price_text = cells[3].text.strip() if len(cells) > 3 else ""
-                    clean_price_match = re.search(r'([0-9]+\.?[0-9]*)', clean_price_text)
+                    clean_price_text = _element_text(price_cell)
+                    clean_price_match = _NUM_RE.search(clean_price_text)
                     if not clean_price_match:
                         continue
                     
@@ -1041,8 +1226,8 @@ class CorporateBondCollector(GiltMarketCollector):
                     
                     # Parse coupon rate from Coupon (%) column (column 1) 
                     # Corporate bonds don't typically show YTM directly, use coupon as approximation
-                    coupon_text = cells[1].text.strip() if len(cells) > 1 else ""
-                    coupon_match = re.search(r'([0-9]+\.?[0-9]*)', coupon_text)
+                    coupon_text = _element_text(coupon_cell)
+                    coupon_match = _NUM_RE.search(coupon_text)
                     if not coupon_match:
                         continue
                     
@@ -1051,20 +1236,18 @@ class CorporateBondCollector(GiltMarketCollector):
                     # YTM will be calculated after we get the maturity date and accrued interest
                     
                     # Parse maturity date from Maturity column (column 2)
-                    maturity_text = cells[2].text.strip() if len(cells) > 2 else ""
-                    maturity_date_match = re.search(r'(\d{4})', maturity_text)
+                    maturity_date_match = _FOUR_DIGIT_YEAR_RE.search(maturity_text)
                     if maturity_date_match:
                         maturity_year = int(maturity_date_match.group(1))
-                        # Try to parse the full date if possible (e.g., "3 December 2032")
-                        try:
-                            # Common formats: "3 December 2032", "30 September 2026"
-                            maturity_date = datetime.strptime(maturity_text, "%d %B %Y")
-                        except ValueError:
+                        # Try to parse the full date if possible
+                        # Common formats: "3 December 2032", "30 September 2026"
+                        maturity_date = _parse_hl_date(maturity_text)
+                        if maturity_date is None:
                             # Fallback to mid-year estimate
                             maturity_date = datetime(maturity_year, 6, 15)
                     else:
                         # Fallback: try to extract from bond name
-                        maturity_match = re.search(r'(20\d{2})', bond_name)
+                        maturity_match = _YEAR_RE.search(bond_name)
                         if maturity_match:
                             maturity_year = int(maturity_match.group(1))
                             maturity_date = datetime(maturity_year, 6, 15)
@@ -1084,43 +1267,19 @@ class CorporateBondCollector(GiltMarketCollector):
                     
                     dirty_price = clean_price + accrued_interest
                     
-                    # Calculate proper YTM using bond pricing equation
                     # Determine face value based on clean price
                     face_value = self._determine_face_value(clean_price)
-                    try:
-                        self.logger.debug(f"Row {i}: Calculating YTM for {company_name} - Price: {dirty_price}, Coupon: {coupon_rate*100:.3f}%, Years: {years_to_maturity:.2f}")
-                        
-                        ytm = self.calculate_ytm_from_dirty(dirty_price, face_value, coupon_rate, years_to_maturity)
-                        
-                        if ytm is None:
-                            raise ValueError(f"YTM calculation failed for {company_name} - Price: {dirty_price}, Coupon: {coupon_rate*100:.3f}%, Years: {years_to_maturity:.2f}")
-                        
-                        self.logger.debug(f"Row {i}: YTM calculated successfully for {company_name}: {ytm*100:.3f}%")
-                    
-                    except Exception as e:
-                        self.logger.error(f"Row {i}: YTM calculation error for {company_name}: {str(e)}")
-                        raise
-                    
-                    # No tax calculation as requested
-                    after_tax_ytm = ytm  # Same as pre-tax YTM
                     
                     # Try to extract credit rating if available (often in additional columns)
                     credit_rating = "NR"  # Not Rated default
-                    if len(cells) > 5:
-                        rating_text = cells[5].text.strip()
+                    if rating_cell is not None:
+                        rating_text = _element_text(rating_cell)
                         if rating_text and len(rating_text) <= 5:  # Typical rating format
                             credit_rating = rating_text
                     
-                    # Ensure unique bond names
-                    unique_bond_name = bond_name
-                    existing_names = [b['bond_name'] for b in bonds]
-                    counter = 1
-                    while unique_bond_name in existing_names:
-                        counter += 1
-                        unique_bond_name = f"{bond_name} #{counter}"
-                    
-                    bonds.append({
-                        'bond_name': unique_bond_name,
+                    # YTM is solved for all bonds at once after the row loop
+                    candidates.append((i, face_value, {
+                        'bond_name': bond_name,
                         'company_name': company_name,
                         'clean_price': clean_price,
                         'accrued_interest': accrued_interest,
@@ -1128,8 +1287,8 @@ class CorporateBondCollector(GiltMarketCollector):
                         'coupon_rate': coupon_rate,
                         'maturity_date': maturity_date,
                         'years_to_maturity': years_to_maturity,
-                        'ytm': ytm,
-                        'after_tax_ytm': after_tax_ytm,
+                        'ytm': None,
+                        'after_tax_ytm': None,
                         'credit_rating': credit_rating,
                         'scraped_date': settlement_date.date(),
                         # Bond identifiers
@@ -1137,13 +1296,45 @@ class CorporateBondCollector(GiltMarketCollector):
                         'isin': identifiers['isin'],
                         'short_code': identifiers['short_code'],
                         'combined_id': identifiers['combined_id']
-                    })
-                    processed_count += 1
+                    }))
                     
                 except Exception as e:
                     self.logger.debug(f"Error processing corporate bond row {i}: {str(e)}")
                     continue
             
+            # Calculate proper YTM using bond pricing equation, solving every bond in one
+            # batch with the same Newton/Brent solver as gilts
+            if candidates:
+                ytms = solve_pre_tax_ytm_batch(
+                    np.array([bond['dirty_price'] for _, _, bond in candidates], dtype=float),
+                    np.array([face_value for _, face_value, _ in candidates], dtype=float),
+                    np.array([bond['coupon_rate'] for _, _, bond in candidates], dtype=float),
+                    np.array([bond['years_to_maturity'] for _, _, bond in candidates], dtype=float),
+                    2
+                )
+                
+                for (i, _, bond), ytm in zip(candidates, ytms.tolist()):
+                    if math.isnan(ytm) or not (-0.5 <= ytm <= 1.0):
+                        self.logger.error(f"Row {i}: YTM calculation error for {bond['company_name']}: YTM calculation failed for {bond['company_name']} - Price: {bond['dirty_price']}, Coupon: {bond['coupon_rate']*100:.3f}%, Years: {bond['years_to_maturity']:.2f}")
+                        continue
+                    
+                    self.logger.debug(f"Row {i}: YTM calculated successfully for {bond['company_name']}: {ytm*100:.3f}%")
+                    bond['ytm'] = ytm
+                    bond['after_tax_ytm'] = ytm  # No tax calculation as requested - same as pre-tax YTM
+                    
+                    # Ensure unique bond names
+                    bond_name = bond['bond_name']
+                    unique_bond_name = bond_name
+                    existing_names = [b['bond_name'] for b in bonds]
+                    counter = 1
+                    while unique_bond_name in existing_names:
+                        counter += 1
+                        unique_bond_name = f"{bond_name} #{counter}"
+                    bond['bond_name'] = unique_bond_name
+                    
+                    bonds.append(bond)
+                    processed_count += 1
+            
             # Log filtering summary
             self.logger.info(f"Corporate bond filtering summary:")
             self.logger.info(f"  Total rows processed: {total_rows}")
@@ -1153,6 +1344,7 @@ class CorporateBondCollector(GiltMarketCollector):
             self.logger.info(f"  Final bond count: {len(bonds)}")
             
             self.logger.info(f"Successfully scraped {len(bonds)} corporate bond prices")
+            scraped = True
             return bonds
         
         except Exception as e:
@@ -1160,10 +1352,8 @@ class CorporateBondCollector(GiltMarketCollector):
             raise RuntimeError(f"Corporate bond scraping failed: {e}") from e
         finally:
             if driver:
-                try:
-                    driver.quit()
-                except:
-                    pass
+                # Keep the browser for the next scrape unless this one failed
+                self._release_driver(driver, use_count, reusable=scraped)
 
 
 def collect_corporate_bond_prices(database_url=None):
@@ -1178,56 +1368,53 @@ def collect_corporate_bond_prices(database_url=None):
             collector.logger.info("No corporate bond data found")
             return 0
         
-        # Process and store data
-        bulk_data = []
-        for bond in corporate_bond_data:
-            try:
-                # Convert to database format
-                data = {
-                    'bond_name': str(bond['bond_name']) if bond['bond_name'] is not None else None,
-                    'company_name': str(bond['company_name']) if bond['company_name'] is not None else None,
-                    'clean_price': float(bond['clean_price']) if bond['clean_price'] is not None else None,
-                    'accrued_interest': float(bond['accrued_interest']) if bond['accrued_interest'] is not None else None,
-                    'dirty_price': float(bond['dirty_price']) if bond['dirty_price'] is not None else None,
-                    'coupon_rate': float(bond['coupon_rate']) if bond['coupon_rate'] is not None else None,
-                    'maturity_date': bond['maturity_date'].date(),
-                    'years_to_maturity': float(bond['years_to_maturity']) if bond['years_to_maturity'] is not None else None,
-                    'ytm': float(bond['ytm']) if bond['ytm'] is not None else None,
-                    'after_tax_ytm': float(bond['after_tax_ytm']) if bond['after_tax_ytm'] is not None else None,
-                    'credit_rating': str(bond['credit_rating']) if bond['credit_rating'] is not None else None,
-                    'scraped_date': bond['scraped_date'],
-                    # Bond identifiers
-                    'currency_code': str(bond['currency_code']) if bond['currency_code'] is not None else None,
-                    'isin': str(bond['isin']) if bond['isin'] is not None else None,
-                    'short_code': str(bond['short_code']) if bond['short_code'] is not None else None,
-                    'combined_id': str(bond['combined_id']) if bond['combined_id'] is not None else None
-                }
-                bulk_data.append(data)
-                
-            except Exception as e:
-                collector.logger.error(f"Error processing corporate bond data: {str(e)}")
-                continue
-        
-        # Bulk upsert all records
-        if bulk_data:
-            success_count = collector.bulk_upsert_data(
-                "corporate_bond_prices", 
-                bulk_data,
-                conflict_columns=['bond_name', 'scraped_date']
-            )
-            if success_count == 0:
-                raise RuntimeError(f"Database upsert failed - no records were successfully stored despite having {len(bulk_data)} records to process")
-            collector.logger.info(f"Successfully stored {success_count} corporate bond price records")
-            return success_count
-        else:
-            collector.logger.info("No valid corporate bond data to process")
-            return 0
+        # Convert and bulk upsert in a single transaction
+        success_count = _upsert_bond_records(
+            collector, "corporate_bond_prices", corporate_bond_data, CORPORATE_BOND_PRICE_COLUMNS, CORPORATE_BOND_NUMERIC_COLUMNS
+        )
+        if success_count == 0:
+            raise RuntimeError(f"Database upsert failed - no records were successfully stored despite having {len(corporate_bond_data)} records to process")
+        collector.logger.info(f"Successfully stored {success_count} corporate bond price records")
+        return success_count
             
     except Exception as e:
         collector.logger.error(f"Failed to collect corporate bond prices: {str(e)}")
         raise  # Re-raise the exception to fail the Airflow task
 
 
+def close_hl_driver_pools():
+    """Quit the idle Chrome sessions pooled by the Hargreaves Lansdown collectors."""
+    for collector_class in (GiltMarketCollector, IndexLinkedGiltCollector, CorporateBondCollector):
+        while True:
+            try:
+                driver, _ = collector_class._driver_pool.get_nowait()
+            except queue.Empty:
+                break
+            _quit_driver(driver)
+
+
+# Don't leave pooled browsers running when the worker process exits
+atexit.register(close_hl_driver_pools)
+
+
+def collect_all_hl_bond_prices(database_url=None):
+    """
+    Collect index-linked gilt and corporate bond prices from Hargreaves Lansdown in parallel.
+    
+    Both scrapes are I/O-bound (Selenium + database), so each runs on its own thread
+    with its own collector and Chrome instance (distinct debug ports).
+    """
+    collect_funcs = [collect_index_linked_gilt_prices, collect_corporate_bond_prices]
+    
+    total_count = 0
+    with ThreadPoolExecutor(max_workers=len(collect_funcs)) as executor:
+        futures = [executor.submit(collect_func, database_url) for collect_func in collect_funcs]
+        for future in as_completed(futures):
+            total_count += future.result()  # Re-raise the exception to fail the Airflow task
+    
+    return total_count
+
+
 class AJBellCorporateBondCollector(BaseCollector):
     """
     Collector for real-time corporate bond prices from AJ Bell broker.
@@ -1238,6 +1425,9 @@ class AJBellCorporateBondCollector(BaseCollector):
         super().__init__(database_url)
         self.base_url = "https://www.ajbell.co.uk/investment/bonds/corporate/prices"
         self.chrome_options = self._setup_chrome_options()
+        # Platform is fixed for the process; look it up once rather than per scrape
+        self._arch = platform.machine().lower()
+        self._system = platform.system()
     
     def _setup_chrome_options(self):
         """Configure Chrome options for Pi-friendly headless scraping."""
@@ -1253,83 +1443,10 @@ class AJBellCorporateBondCollector(BaseCollector):
     
     def _get_chrome_service(self):
         """Get Chrome service for both Pi and development environments."""
-        arch = platform.machine().lower()
-        system = platform.system()
-        
-        # Try Pi-specific paths first (ARM64 Linux)
-        if arch in ['aarch64', 'arm64'] and system == 'Linux':
-            # Check shared volume locations (init container installation)
-            shared_paths = [
-                '/shared/usr/bin/chromedriver',
-                '/shared/usr/lib/chromium-browser/chromedriver',
-                '/shared/snap/chromium/current/usr/lib/chromium-browser/chromedriver'
-            ]
-            
-            for path in shared_paths:
-                if os.path.exists(path):
-                    self.logger.info(f"Using Pi ChromeDriver from init container: {path}")
-                    
-                    # Set library path for copied shared libraries
-                    current_ld_path = os.environ.get('LD_LIBRARY_PATH', '')
-                    shared_lib_paths = [
-                        '/shared/lib/aarch64-linux-gnu',
-                        '/shared/usr/lib/aarch64-linux-gnu', 
-                        '/shared/usr/lib',
-                        '/shared/lib'
-                    ]
-                    # Only add paths that exist
-                    existing_paths = [p for p in shared_lib_paths if os.path.exists(p)]
-                    if existing_paths:
-                        new_ld_path = ':'.join(existing_paths)
-                        if current_ld_path:
-                            os.environ['LD_LIBRARY_PATH'] = f"{new_ld_path}:{current_ld_path}"
-                        else:
-                            os.environ['LD_LIBRARY_PATH'] = new_ld_path
-                        self.logger.info(f"Set LD_LIBRARY_PATH: {os.environ['LD_LIBRARY_PATH']}")
-                    
-                    # Also set chromium binary location if available
-                    if os.path.exists('/shared/usr/bin/chromium'):
-                        self.chrome_options.binary_location = '/shared/usr/bin/chromium'
-                        self.logger.info("Using Chromium binary from shared volume")
-                    return Service(path)
-            
-            # Fallback to system paths
-            system_paths = [
-                '/usr/bin/chromedriver',
-                '/usr/lib/chromium-browser/chromedriver',
-                '/snap/chromium/current/usr/lib/chromium-browser/chromedriver'
-            ]
-            
-            for path in system_paths:
-                if os.path.exists(path):
-                    self.logger.info(f"Using Pi ChromeDriver from system: {path}")
-                    return Service(path)
-        
-        # Fallback to webdriver-manager for development environments
-        if ChromeDriverManager is not None:
-            try:
-                self.logger.info("Using ChromeDriver from webdriver-manager (development environment)")
-                return Service(ChromeDriverManager().install())
-            except Exception as e:
-                self.logger.warning(f"webdriver-manager failed: {e}")
-        
-        # Final fallback - check common system paths
-        common_paths = [
-            '/usr/bin/chromedriver',
-            '/usr/local/bin/chromedriver',
-            '/opt/homebrew/bin/chromedriver',  # macOS with Homebrew
-        ]
-        
-        for path in common_paths:
-            if os.path.exists(path):
-                self.logger.info(f"Using system ChromeDriver at: {path}")
-                return Service(path)
-        
-        # No ChromeDriver found
-        if arch in ['aarch64', 'arm64'] and system == 'Linux':
-            raise RuntimeError("ChromeDriver not found - install with: apt install chromium-chromedriver")
-        else:
-            raise RuntimeError("ChromeDriver not found - install via webdriver-manager or system package manager")
+        driver_path, chromium_binary = _resolve_chromedriver(self._arch, self._system)
+        if chromium_binary:
+            self.chrome_options.binary_location = chromium_binary
+        return Service(driver_path)
     
     def _handle_cookie_consent(self, driver):
         """Handle cookie consent banner if present."""
@@ -1451,10 +1568,10 @@ class AJBellCorporateBondCollector(BaseCollector):
             return None
         
         # Remove currency symbols and common formatting
-        clean_text = re.sub(r'[£$€,]', '', price_text.strip())
+        clean_text = _CURRENCY_SYMBOLS_RE.sub('', price_text.strip())
         
         # Extract numeric value
-        price_match = re.search(r'(\d+\.?\d*)', clean_text)
+        price_match = _NUM_RE.search(clean_text)
         if price_match:
             try:
                 return float(price_match.group(1))
@@ -1469,7 +1586,7 @@ class AJBellCorporateBondCollector(BaseCollector):
         
         # Remove % symbol and extract number
         clean_text = percent_text.replace('%', '').strip()
-        percent_match = re.search(r'(\d+\.?\d*)', clean_text)
+        percent_match = _NUM_RE.search(clean_text)
         if percent_match:
             try:
                 return float(percent_match.group(1)) / 100  # Convert to decimal
@@ -1499,7 +1616,7 @@ class AJBellCorporateBondCollector(BaseCollector):
                 continue
         
         # Try to extract just year and estimate mid-year
-        year_match = re.search(r'20\d{2}', date_text)
+        year_match = _YEAR_RE.search(date_text)
         if year_match:
             year = int(year_match.group(0))
             return datetime(year, 7, 15)  # Mid-year estimate
@@ -1516,8 +1633,8 @@ class AJBellCorporateBondCollector(BaseCollector):
         # Days since last coupon payment
         days_since_coupon = (settlement_date - last_coupon_date).days
         
-        # Days in coupon period (assume 6 months = 182.5 days for semi-annual)
-        days_in_period = 365.25 / payments_per_year
+        # Days in coupon period (6 months = 182.625 days for semi-annual)
+        days_in_period = DAYS_PER_YEAR / payments_per_year
         
         # Accrued interest = (Days since coupon / Days in period) * Coupon payment
         accrued = (days_since_coupon / days_in_period) * coupon_payment
@@ -1538,23 +1655,13 @@ class AJBellCorporateBondCollector(BaseCollector):
         
         year = settlement_date.year
         
-        # Calculate the two coupon dates per year (6 months apart)
-        # Apply day limits upfront to avoid invalid dates
-        try:
-            if mat_month <= 6:
-                coupon1 = datetime(year, mat_month, min(mat_day, 28))
-                coupon2 = datetime(year, mat_month + 6, min(mat_day, 28))
-            else:
-                coupon1 = datetime(year, mat_month - 6, min(mat_day, 28))
-                coupon2 = datetime(year, mat_month, min(mat_day, 28))
-        except ValueError:
-            # Fallback to safe dates if still invalid
-            if mat_month <= 6:
-                coupon1 = datetime(year, mat_month, 28)
-                coupon2 = datetime(year, mat_month + 6, 28)
-            else:
-                coupon1 = datetime(year, mat_month - 6, 28)
-                coupon2 = datetime(year, mat_month, 28)
+        # The two coupon months per year (6 months apart), first half-year month first.
+        # Capping the day at 28 keeps every date valid, so no exception handling is needed.
+        month1 = (mat_month - 1) % 6 + 1
+        month2 = month1 + 6
+        day = min(mat_day, 28)
+        coupon1 = datetime(year, month1, day)
+        coupon2 = datetime(year, month2, day)
         
         # Find the most recent coupon date before settlement
         if settlement_date >= coupon2:
@@ -1563,13 +1670,7 @@ class AJBellCorporateBondCollector(BaseCollector):
             return coupon1
         else:
             # Must be from previous year
-            try:
-                if mat_month <= 6:
-                    return datetime(year - 1, mat_month + 6, min(mat_day, 28))
-                else:
-                    return datetime(year - 1, mat_month, min(mat_day, 28))
-            except:
-                return datetime(year - 1, 7, 31)  # Default fallback
+            return datetime(year - 1, month2, day)
     
     def _determine_face_value(self, clean_price: float) -> float:
         """
@@ -1586,11 +1687,6 @@ class AJBellCorporateBondCollector(BaseCollector):
                                coupon_rate: float, years_to_maturity: float, 
                                payments_per_year: int = 2) -> Optional[float]:
         """Calculate YTM using dirty price."""
-        if fsolve is None:
-            self.logger.warning("scipy not available - cannot calculate YTM")
-            return None
-            
-        coupon_payment = (coupon_rate * face_value) / payments_per_year
         total_periods = years_to_maturity * payments_per_year  # Keep as float, don't round to int
         
         # Handle edge case where bond has essentially no time remaining
@@ -1598,28 +1694,13 @@ class AJBellCorporateBondCollector(BaseCollector):
             self.logger.warning(f"Bond has minimal time remaining (years_to_maturity: {years_to_maturity})")
             return None
         
-        def bond_price_equation(ytm):
-            if ytm == 0:
-                return coupon_payment * total_periods + face_value - dirty_price
-            
-            periodic_rate = ytm / payments_per_year
-            
-            # Avoid numerical issues with very negative rates
-            if periodic_rate <= -0.99:
-                return float('inf')
-            
-            try:
-                present_value_coupons = coupon_payment * (1 - (1 + periodic_rate) ** -total_periods) / periodic_rate
-                present_value_face = face_value / (1 + periodic_rate) ** total_periods
-                return present_value_coupons + present_value_face - dirty_price
-            except (OverflowError, ZeroDivisionError):
-                return float('inf')
-        
-        # Use approximate YTM as initial guess
-        initial_guess = (coupon_rate + (face_value - dirty_price) / years_to_maturity) / ((face_value + dirty_price) / 2)
-        
         try:
-            ytm_solution = fsolve(bond_price_equation, initial_guess, xtol=1e-8)[0]
+            ytm_solution = solve_ytm(float(dirty_price), float(face_value), float(coupon_rate),
+                                     float(years_to_maturity), payments_per_year)
+            
+            if math.isnan(ytm_solution):
+                self.logger.warning(f"YTM calculation did not converge (price: {dirty_price}, years: {years_to_maturity})")
+                return None
             
             # Sanity check: YTM should be reasonable (between -50% and 100%)
             if -0.5 <= ytm_solution <= 1.0:
@@ -1641,38 +1722,18 @@ class AJBellCorporateBondCollector(BaseCollector):
         - Coupon payments are taxed at tax_rate_on_coupons
         - Capital gains are tax-free (typical for UK corporate bonds)
         """
-        if fsolve is None:
-            self.logger.warning("scipy not available - cannot calculate after-tax YTM")
-            return None
-            
-        coupon_payment = (coupon_rate * face_value) / payments_per_year
-        after_tax_coupon = coupon_payment * (1 - tax_rate_on_coupons)
-        total_periods = int(years_to_maturity * payments_per_year)
-        
-        def after_tax_bond_equation(ytm):
-            if ytm == 0:
-                return after_tax_coupon * total_periods + face_value - dirty_price
-            
-            periodic_rate = ytm / payments_per_year
-            # Present value of after-tax coupons
-            present_value_coupons = after_tax_coupon * (1 - (1 + periodic_rate) ** -total_periods) / periodic_rate
-            # Present value of face value (no tax on capital gains)
-            present_value_face = face_value / (1 + periodic_rate) ** total_periods
-            
-            return present_value_coupons + present_value_face - dirty_price
-        
-        initial_guess = coupon_rate if coupon_rate > 0 else 0.05
-        
         try:
-            ytm_solution = fsolve(after_tax_bond_equation, initial_guess)[0]
-            return ytm_solution
-        except:
+            ytm_solution = solve_after_tax_ytm(float(dirty_price), float(face_value), float(coupon_rate),
+                                               float(years_to_maturity), float(tax_rate_on_coupons),
+                                               payments_per_year)
+            return None if math.isnan(ytm_solution) else ytm_solution
+        except Exception:
             return None
     
     def scrape_corporate_bond_prices(self) -> List[Dict[str, Any]]:
         """Scrape AJ Bell corporate bond prices."""
-        arch = platform.machine().lower()
-        system = platform.system()
+        arch = self._arch
+        system = self._system
         
         try:
             return self._scrape_with_selenium()
@@ -1734,16 +1795,16 @@ class AJBellCorporateBondCollector(BaseCollector):
     def _parse_corporate_bond_table(self, table_element) -> List[Dict[str, Any]]:
         """Parse the AJ Bell corporate bond price table."""
         try:
-            rows = table_element.find_elements(By.TAG_NAME, "tr")
+            rows = _read_table_text(table_element)
             if len(rows) < 2:  # Need header + at least one data row
                 return []
             
             # Get headers
-            header_row = rows[0]
-            headers = [cell.text.strip().lower() for cell in header_row.find_elements(By.TAG_NAME, "th")]
+            header_th, header_td = rows[0]
+            headers = [text.strip().lower() for text in header_th]
             
             if not headers:
-                headers = [cell.text.strip().lower() for cell in header_row.find_elements(By.TAG_NAME, "td")]
+                headers = [text.strip().lower() for text in header_td]
             
             self.logger.info(f"AJ Bell corporate bond table headers: {headers}")
             self.logger.info(f"Found {len(rows)} total rows (including header)")
@@ -1755,18 +1816,16 @@ class AJBellCorporateBondCollector(BaseCollector):
             maturity_col = self._find_column_index(headers, ['maturity', 'expiry', 'date'])
             
             corporate_bond_data = []
-            for i, row in enumerate(rows[1:]):  # Skip header
+            for i, (_, cells) in enumerate(rows[1:]):  # Skip header
                 try:
-                    cells = row.find_elements(By.TAG_NAME, "td")
-                    
                     if len(cells) < 4:  # Need minimum columns
                         continue
                     
                     # Extract data with error handling
-                    bond_name_full = cells[name_col].text.strip() if name_col is not None and name_col < len(cells) else ""
-                    price_text = cells[price_col].text.strip() if price_col is not None and price_col < len(cells) else ""
-                    coupon_text = cells[coupon_col].text.strip() if coupon_col is not None and coupon_col < len(cells) else ""
-                    maturity_text = cells[maturity_col].text.strip() if maturity_col is not None and maturity_col < len(cells) else ""
+                    bond_name_full = cells[name_col].strip() if name_col is not None and name_col < len(cells) else ""
+                    price_text = cells[price_col].strip() if price_col is not None and price_col < len(cells) else ""
+                    coupon_text = cells[coupon_col].strip() if coupon_col is not None and coupon_col < len(cells) else ""
+                    maturity_text = cells[maturity_col].strip() if maturity_col is not None and maturity_col < len(cells) else ""
                     
                     # Extract clean bond name (before ISIN codes)
                     if '\n' in bond_name_full:
@@ -1818,7 +1877,7 @@ class AJBellCorporateBondCollector(BaseCollector):
                     short_code = None
                     
                     # Look for ISIN pattern (2 letters + 10 alphanumeric)
-                    isin_match = re.search(r'[A-Z]{2}[A-Z0-9]{10}', bond_name_full)
+                    isin_match = _ISIN_ANYWHERE_RE.search(bond_name_full)
                     if isin_match:
                         isin = isin_match.group(0)
                     
@@ -1829,7 +1888,7 @@ class AJBellCorporateBondCollector(BaseCollector):
                     elif len(parts) >= 2:
                         # Fallback: if only 2 parts, check if second part is ISIN or short code
                         second_part = parts[1].strip()
-                        if re.match(r'^GB[A-Z0-9]{10}$', second_part):
+                        if _GB_ISIN_RE.match(second_part):
                             short_code = None  # Second part is ISIN, no short code available
                         else:
                             short_code = second_part  # Second part is the short code
@@ -1946,41 +2005,36 @@ def collect_ajbell_corporate_bond_prices(database_url=None):
         # Process and store data
         bulk_data = []
         for bond in corporate_bond_data:
-            try:
-                # Convert to database format matching corporate_bond_prices table structure
-                isin_value = str(bond['isin']) if bond['isin'] is not None else None
-                short_code_value = str(bond['short_code']) if bond['short_code'] is not None else None
-                
-                # Debug log field lengths to help identify constraint violations
-                if isin_value and len(isin_value) > 10:
-                    collector.logger.debug(f"ISIN longer than 10 chars for {bond['bond_name']}: '{isin_value}' ({len(isin_value)} chars)")
-                if short_code_value and len(short_code_value) > 10:
-                    collector.logger.warning(f"Short code longer than 10 chars for {bond['bond_name']}: '{short_code_value}' ({len(short_code_value)} chars) - truncating to 10 chars")
-                    short_code_value = short_code_value[:10]  # Truncate to fit VARCHAR(10) constraint
-                
-                data = {
-                    'bond_name': str(bond['bond_name']) if bond['bond_name'] is not None else None,
-                    'company_name': str(bond['company_name']) if bond['company_name'] is not None else None,
-                    'clean_price': float(bond['clean_price']) if bond['clean_price'] is not None else None,
-                    'accrued_interest': float(bond['accrued_interest']) if bond['accrued_interest'] is not None else None,
-                    'dirty_price': float(bond['dirty_price']) if bond['dirty_price'] is not None else None,
-                    'coupon_rate': float(bond['coupon_rate']) if bond['coupon_rate'] is not None else None,
-                    'maturity_date': bond['maturity_date'].date(),
-                    'years_to_maturity': float(bond['years_to_maturity']) if bond['years_to_maturity'] is not None else None,
-                    'ytm': float(bond['ytm']) if bond['ytm'] is not None else None,
-                    'after_tax_ytm': float(bond['after_tax_ytm']) if bond['after_tax_ytm'] is not None else None,
-                    'credit_rating': str(bond['credit_rating']) if bond['credit_rating'] is not None else 'NR',
-                    'scraped_date': bond['scraped_date'],
-                    'currency_code': str(bond['currency_code']),
-                    'isin': isin_value,
-                    'short_code': short_code_value,
-                    'combined_id': str(bond['combined_id']) if bond['combined_id'] is not None else None
-                }
-                bulk_data.append(data)
-                
-            except Exception as e:
-                collector.logger.error(f"Error processing AJ Bell corporate bond data: {str(e)}")
-                continue
+            # Convert to database format matching corporate_bond_prices table structure
+            isin_value = str(bond['isin']) if bond['isin'] is not None else None
+            short_code_value = str(bond['short_code']) if bond['short_code'] is not None else None
+            
+            # Debug log field lengths to help identify constraint violations
+            if isin_value and len(isin_value) > 10:
+                collector.logger.debug(f"ISIN longer than 10 chars for {bond['bond_name']}: '{isin_value}' ({len(isin_value)} chars)")
+            if short_code_value and len(short_code_value) > 10:
+                collector.logger.warning(f"Short code longer than 10 chars for {bond['bond_name']}: '{short_code_value}' ({len(short_code_value)} chars) - truncating to 10 chars")
+                short_code_value = short_code_value[:10]  # Truncate to fit VARCHAR(10) constraint
+            
+            data = {
+                'bond_name': str(bond['bond_name']) if bond['bond_name'] is not None else None,
+                'company_name': str(bond['company_name']) if bond['company_name'] is not None else None,
+                'clean_price': float(bond['clean_price']) if bond['clean_price'] is not None else None,
+                'accrued_interest': float(bond['accrued_interest']) if bond['accrued_interest'] is not None else None,
+                'dirty_price': float(bond['dirty_price']) if bond['dirty_price'] is not None else None,
+                'coupon_rate': float(bond['coupon_rate']) if bond['coupon_rate'] is not None else None,
+                'maturity_date': bond['maturity_date'].date(),
+                'years_to_maturity': float(bond['years_to_maturity']) if bond['years_to_maturity'] is not None else None,
+                'ytm': float(bond['ytm']) if bond['ytm'] is not None else None,
+                'after_tax_ytm': float(bond['after_tax_ytm']) if bond['after_tax_ytm'] is not None else None,
+                'credit_rating': str(bond['credit_rating']) if bond['credit_rating'] is not None else 'NR',
+                'scraped_date': bond['scraped_date'],
+                'currency_code': str(bond['currency_code']),
+                'isin': isin_value,
+                'short_code': short_code_value,
+                'combined_id': str(bond['combined_id']) if bond['combined_id'] is not None else None
+            }
+            bulk_data.append(data)
         
         # Bulk upsert all records to AJ Bell specific table
         if bulk_data:
@@ -1,8 +1,16 @@
+import asyncio
+import functools
+import hashlib
+import html
+import os
+import re
+import orjson
 import requests
-from datetime import datetime, timedelta
-from typing import Dict, Any, List
-from .base import BaseCollector
-from .economic_indicators import FREDCollector
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
+from typing import Dict, Any, Iterable, List, Optional
+from .base import BaseCollector, USER_CACHE_DIR
+from .economic_indicators import FREDCollector, FRED_WINDOW_DAYS
 
 # FRED Treasury Series Mapping
 FRED_TREASURY_SERIES = {
@@ -18,119 +26,113 @@ FRED_TREASURY_SERIES = {
     "DGS30": "30Y"
 }
 
-def collect_sp500(database_url=None):
-    """Collect S&P 500 Index data from FRED with incremental updates."""
-    collector = FREDCollector(database_url)
-    
-    # Get date range for collection
-    start_date, end_date = collector.get_date_range_for_collection(
-        table="sp500_index",
-        default_lookback_days=10*365  # 10 years of historical data
-    )
+# multpl.com shows the latest value in <div id="current">
+_MULTPL_CURRENT_RE = re.compile(r'<div[^>]*\bid=["\']current["\'][^>]*>(.*?)</div>', re.S | re.I)
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_NUMBER_RE = re.compile(r'([\d.]+)')
+
+# Conditional-GET validators and the last parsed value for each multpl.com page,
+# kept between runs so an unchanged page costs a 304 instead of a full download.
+# The directory is per-user and owner-only, so nobody else can plant a value
+MULTPL_CACHE_DIR = os.path.join(USER_CACHE_DIR, "multpl")
+
+
+def _iter_fred_values(observations: Iterable[Dict], logger, label: str):
+    """
+    Yield (date, value) for each FRED observation, skipping missing values.
     
-    if start_date is None and end_date is None:
-        collector.logger.info("S&P 500 data is already up to date")
-        return 0
+    FRED marks missing observations with "."; items that fail to parse are
+    logged and skipped.
+    """
+    # Local aliases avoid global lookups in the per-observation loop
+    fromisoformat = date.fromisoformat
+    to_float = float
+    for item in observations:
+        try:
+            value = item["value"]
+            if value == "." or value == "":
+                continue  # Skip missing values
+            yield fromisoformat(item["date"]), to_float(value)
+        except Exception as e:
+            logger.error(f"Error processing {label} data item: {str(e)}")
+
+def _fetch_fred_price_series(collector: FREDCollector, series_id: str,
+                             start_date: Optional[date], end_date: date) -> Iterable[Dict]:
+    """
+    Fetch a FRED series over the collection date range.
     
-    # Handle unlimited historical data fetch
+    Ranges longer than one window (including a cold-start backfill, whose start
+    is looked up from the series metadata) are fetched as parallel windows;
+    short incremental ranges are streamed in a single request.
+    """
     if start_date is None:
-        # Fetch all available historical data - don't specify observation_start
-        series_data = collector.get_series_data(
-            "SP500",
-            observation_end=end_date.strftime("%Y-%m-%d")
-        )
-    else:
-        series_data = collector.get_series_data(
-            "SP500",
-            observation_start=start_date.strftime("%Y-%m-%d"),
-            observation_end=end_date.strftime("%Y-%m-%d")
-        )
+        start_date = collector.get_series_observation_start(series_id)
     
-    bulk_data = []
-    for item in series_data:
-        try:
-            if item["value"] == ".":
-                continue
-                
-            data = {
-                "date": datetime.strptime(item["date"], "%Y-%m-%d").date(),
-                "close_price": float(item["value"]),
-                "open_price": float(item["value"]),  # FRED only provides closing prices
-                "high_price": float(item["value"]),
-                "low_price": float(item["value"]),
-            }
-            bulk_data.append(data)
-                
-        except Exception as e:
-            collector.logger.error(f"Error processing S&P 500 data item: {str(e)}")
+    if start_date is not None and (end_date - start_date).days > FRED_WINDOW_DAYS:
+        return collector.get_series_data_windowed(series_id, start_date, end_date)
     
-    # Bulk upsert all records
-    if bulk_data:
-        success_count = collector.bulk_upsert_data("sp500_index", bulk_data)
-        collector.logger.info(f"Successfully bulk upserted {success_count} S&P 500 records")
-        return success_count
-    else:
-        collector.logger.info("No valid S&P 500 data to process")
-        return 0
+    return collector.iter_series_data(
+        series_id,
+        observation_start=start_date.strftime("%Y-%m-%d") if start_date else None,
+        observation_end=end_date.strftime("%Y-%m-%d")
+    )
 
-def collect_vix(database_url=None):
-    """Collect VIX data from FRED with incremental updates."""
+def _collect_fred_price_series(database_url, series_id: str, table: str, label: str,
+                               last_dates=None) -> int:
+    """
+    Collect a daily FRED index level into an OHLC price table with incremental updates.
+    
+    FRED only provides closing values, so open/high/low are set to the close.
+    """
     collector = FREDCollector(database_url)
     
     # Get date range for collection
     start_date, end_date = collector.get_date_range_for_collection(
-        table="vix_index",
-        default_lookback_days=10*365  # 10 years of historical data
+        table=table,
+        default_lookback_days=10*365,  # 10 years of historical data
+        last_dates=last_dates
     )
     
     if start_date is None and end_date is None:
-        collector.logger.info("VIX data is already up to date")
+        collector.logger.info(f"{label} data is already up to date")
         return 0
     
-    # Handle unlimited historical data fetch
-    if start_date is None:
-        # Fetch all available historical data - don't specify observation_start
-        series_data = collector.get_series_data(
-            "VIXCLS",
-            observation_end=end_date.strftime("%Y-%m-%d")
-        )
-    else:
-        series_data = collector.get_series_data(
-            "VIXCLS",
-            observation_start=start_date.strftime("%Y-%m-%d"),
-            observation_end=end_date.strftime("%Y-%m-%d")
-        )
+    series_data = _fetch_fred_price_series(collector, series_id, start_date, end_date)
     
-    bulk_data = []
-    for item in series_data:
-        try:
-            if item["value"] == ".":
-                continue
-                
-            data = {
-                "date": datetime.strptime(item["date"], "%Y-%m-%d").date(),
-                "close_price": float(item["value"]),
-                "open_price": float(item["value"]),
-                "high_price": float(item["value"]),
-                "low_price": float(item["value"]),
-            }
-            bulk_data.append(data)
-                
-        except Exception as e:
-            collector.logger.error(f"Error processing VIX data item: {str(e)}")
+    bulk_data = [
+        {
+            "date": obs_date,
+            "close_price": value,
+            "open_price": value,
+            "high_price": value,
+            "low_price": value,
+        }
+        for obs_date, value in _iter_fred_values(series_data, collector.logger, label)
+    ]
     
-    # Bulk upsert all records
+    # Bulk upsert all records, or COPY them into the empty table on a cold start
     if bulk_data:
-        success_count = collector.bulk_upsert_data("vix_index", bulk_data)
-        collector.logger.info(f"Successfully bulk upserted {success_count} VIX records")
+        if start_date is None:
+            success_count = collector.bulk_copy_data(table, bulk_data)
+        else:
+            success_count = collector.bulk_upsert_data(table, bulk_data)
+        collector.logger.info(f"Successfully stored {success_count} {label} records")
         return success_count
     else:
-        collector.logger.info("No valid VIX data to process")
+        collector.logger.info(f"No valid {label} data to process")
         return 0
 
+def collect_sp500(database_url=None, last_dates=None):
+    """Collect S&P 500 Index data from FRED with incremental updates."""
+    return _collect_fred_price_series(database_url, "SP500", "sp500_index", "S&P 500", last_dates)
+
+def collect_vix(database_url=None, last_dates=None):
+    """Collect VIX data from FRED with incremental updates."""
+    return _collect_fred_price_series(database_url, "VIXCLS", "vix_index", "VIX", last_dates)
 
 
-def collect_fred_treasury_yields(database_url=None):
+
+def collect_fred_treasury_yields(database_url=None, last_dates=None):
     """
     Collect Treasury yield curve data from FRED with incremental updates.
     Uses multiple FRED series for different maturities.
@@ -140,68 +142,78 @@ def collect_fred_treasury_yields(database_url=None):
     # Get date range for collection (use new table)
     start_date, end_date = collector.get_date_range_for_collection(
         table="fred_treasury_yields",
-        default_lookback_days=5*365  # 5 years of historical data
+        default_lookback_days=5*365,  # 5 years of historical data
+        last_dates=last_dates
     )
     
     if start_date is None and end_date is None:
         collector.logger.info("FRED Treasury yields data is already up to date")
         return 0
     
-    total_success_count = 0
+    # Date range shared by every series request
+    if start_date is None:
+        # Fetch all available historical data - don't specify observation_start
+        date_params = {"observation_end": end_date.strftime("%Y-%m-%d")}
+    else:
+        date_params = {
+            "observation_start": start_date.strftime("%Y-%m-%d"),
+            "observation_end": end_date.strftime("%Y-%m-%d")
+        }
+    
+    # Rows from every series are accumulated and written in one bulk upsert
+    bulk_data = []
     
-    # Collect data for each Treasury series
-    for series_id, maturity in FRED_TREASURY_SERIES.items():
-        collector.logger.info(f"Collecting {maturity} Treasury yields (series: {series_id})")
+    collector.logger.info(f"Collecting {len(FRED_TREASURY_SERIES)} Treasury yield series from FRED")
+    
+    # The requests are I/O-bound, so all series are fetched concurrently;
+    # results are parsed on this thread as they arrive
+    with ThreadPoolExecutor(max_workers=len(FRED_TREASURY_SERIES)) as executor:
+        futures = {
+            executor.submit(collector.get_series_data, series_id, **date_params): (series_id, maturity)
+            for series_id, maturity in FRED_TREASURY_SERIES.items()
+        }
         
-        try:
-            # Fetch data with date range for this specific series
-            if start_date is None:
-                # Fetch all available historical data - don't specify observation_start
-                series_data = collector.get_series_data(
-                    series_id,
-                    observation_end=end_date.strftime("%Y-%m-%d")
-                )
-            else:
-                series_data = collector.get_series_data(
-                    series_id,
-                    observation_start=start_date.strftime("%Y-%m-%d"),
-                    observation_end=end_date.strftime("%Y-%m-%d")
-                )
+        for future in as_completed(futures):
+            series_id, maturity = futures[future]
             
-            # Prepare bulk data for this series
-            bulk_data = []
-            for item in series_data:
-                try:
-                    if item["value"] == ".":
-                        continue  # Skip missing values
-                        
-                    data = {
-                        "date": datetime.strptime(item["date"], "%Y-%m-%d").date(),
+            try:
+                series_data = future.result()
+                
+                series_rows = [
+                    {
+                        "date": obs_date,
                         "series_id": series_id,
                         "maturity": maturity,
-                        "yield_rate": float(item["value"]),
+                        "yield_rate": value,
                     }
-                    bulk_data.append(data)
-                        
-                except Exception as e:
-                    collector.logger.error(f"Error processing {series_id} data item: {str(e)}")
-                    
-            # Bulk upsert all records for this series
-            if bulk_data:
-                series_success_count = collector.bulk_upsert_data(
-                    "fred_treasury_yields", 
-                    bulk_data, 
-                    conflict_columns=["date", "series_id"]
-                )
-                collector.logger.info(f"Successfully bulk upserted {series_success_count} records for {maturity} yields")
-                total_success_count += series_success_count
-            else:
-                collector.logger.info(f"No valid data to process for {maturity} yields")
-            
-        except Exception as e:
-            collector.logger.error(f"Failed to collect {series_id} ({maturity}) data: {str(e)}")
-            continue
-            
+                    for obs_date, value in _iter_fred_values(series_data, collector.logger, series_id)
+                ]
+                bulk_data.extend(series_rows)
+                
+                series_count = len(series_rows)
+                if series_count:
+                    collector.logger.info(f"Prepared {series_count} records for {maturity} yields")
+                else:
+                    collector.logger.info(f"No valid data to process for {maturity} yields")
+                
+            except Exception as e:
+                collector.logger.error(f"Failed to collect {series_id} ({maturity}) data: {str(e)}")
+                continue
+    
+    # Store all series in a single transaction
+    if not bulk_data:
+        collector.logger.info("No valid Treasury yield data to process from FRED")
+        return 0
+    
+    if start_date is None:
+        # Cold start: the table is empty, so nothing can conflict
+        total_success_count = collector.bulk_copy_data("fred_treasury_yields", bulk_data)
+    else:
+        total_success_count = collector.bulk_upsert_data(
+            "fred_treasury_yields", 
+            bulk_data, 
+            conflict_columns=["date", "series_id"]
+        )
     collector.logger.info(f"Successfully processed {total_success_count} total Treasury yield records from FRED")
     return total_success_count
 
@@ -211,49 +223,98 @@ class PERatioCollector(BaseCollector):
         super().__init__(database_url)
         self.multpl_url = "https://www.multpl.com/s-p-500-pe-ratio"
         self.shiller_url = "https://www.multpl.com/shiller-pe"
+        self.cache_dir = os.environ.get("MULTPL_CACHE_DIR", MULTPL_CACHE_DIR)
+        
+    def _cache_path(self, url: str) -> str:
+        """Path of the cache entry for a multpl.com page."""
+        return os.path.join(self.cache_dir, hashlib.sha1(url.encode()).hexdigest() + ".json")
+    
+    def _load_cached_page(self, url: str) -> Optional[Dict[str, Any]]:
+        """Load the ETag/Last-Modified validators and value cached for a page, if any."""
+        if not self._private_cache_dir(self.cache_dir):
+            return None
+        
+        try:
+            with open(self._cache_path(url), 'rb') as f:
+                return orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+    
+    def _save_cached_page(self, url: str, response, value: float):
+        """Cache the page's validators with the parsed value; a failed write never fails the scrape."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not (etag or last_modified):
+            return
+        
+        if not self._private_cache_dir(self.cache_dir):
+            return
+        
+        try:
+            payload = orjson.dumps({"etag": etag, "last_modified": last_modified, "value": value})
+            
+            # Write then rename so a concurrent reader never sees a partial entry
+            path = self._cache_path(url)
+            with open(f"{path}.tmp", 'wb') as f:
+                f.write(payload)
+            os.replace(f"{path}.tmp", path)
+        except (OSError, TypeError) as e:
+            self.logger.warning(f"Could not cache validators for {url}: {str(e)}")
         
     def scrape_multpl_data(self, url: str) -> float:
-        """Scrape P/E ratio data from multpl.com."""
+        """Scrape P/E ratio data from multpl.com, skipping the download when the page is unchanged."""
+        cached = self._load_cached_page(url)
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+        
         try:
-            response = self.session.get(url, timeout=30)
+            response = self.session.get(url, headers=headers, timeout=30)
+            if cached and response.status_code == 304:
+                self.logger.info(f"{url} not modified, reusing cached value {cached['value']}")
+                return cached["value"]
             response.raise_for_status()
             
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Find the current value
-            value_element = soup.find('div', {'id': 'current'})
-            if value_element:
-                value_text = value_element.text.strip()
+            # Find the current value without building a DOM for the whole page
+            current_match = _MULTPL_CURRENT_RE.search(response.text)
+            if current_match:
+                value_text = html.unescape(_HTML_TAG_RE.sub('', current_match.group(1))).strip()
                 # Extract numeric value (remove any trailing text)
-                import re
-                match = re.search(r'([\d.]+)', value_text)
+                match = _NUMBER_RE.search(value_text)
                 if match:
-                    return float(match.group(1))
+                    value = float(match.group(1))
+                    self._save_cached_page(url, response, value)
+                    return value
                     
         except Exception as e:
             self.logger.error(f"Error scraping data from {url}: {str(e)}")
             
         return None
 
-def collect_pe_ratios(database_url=None):
+def collect_pe_ratios(database_url=None, last_dates=None):
     """Collect P/E ratio data with daily updates."""
     collector = PERatioCollector(database_url)
     
     # Check if we already have today's data
     today = datetime.now().date()
-    last_date = collector.get_last_record_date("pe_ratios")
+    if last_dates is not None and "pe_ratios" in last_dates:
+        last_date = last_dates["pe_ratios"]
+    else:
+        last_date = collector.get_last_record_date("pe_ratios")
     
     if last_date and last_date >= today:
         collector.logger.info("P/E ratios data is already up to date for today")
         return 0
     
     try:
-        # Get current S&P 500 P/E ratio
-        sp500_pe = collector.scrape_multpl_data(collector.multpl_url)
-        
-        # Get current Shiller P/E ratio
-        shiller_pe = collector.scrape_multpl_data(collector.shiller_url)
+        # Get current S&P 500 and Shiller P/E ratios - independent pages, fetched concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            sp500_future = executor.submit(collector.scrape_multpl_data, collector.multpl_url)
+            shiller_future = executor.submit(collector.scrape_multpl_data, collector.shiller_url)
+            sp500_pe, shiller_pe = sp500_future.result(), shiller_future.result()
         
         if sp500_pe or shiller_pe:
             data = {
@@ -275,4 +336,44 @@ def collect_pe_ratios(database_url=None):
     except Exception as e:
         collector.logger.error(f"Error collecting P/E ratios: {str(e)}")
         
-    return 0
\ No newline at end of file
+    return 0
+
+
+# Tables written by the market data collectors, keyed to their collect function
+MARKET_DATA_COLLECTORS = (
+    ("sp500_index", collect_sp500),
+    ("vix_index", collect_vix),
+    ("fred_treasury_yields", collect_fred_treasury_yields),
+    ("pe_ratios", collect_pe_ratios),
+)
+
+async def collect_all_market_data_async(database_url=None, last_dates=None):
+    """
+    Run every market data collector concurrently on one event loop.
+    
+    The collectors are independent (FRED and multpl.com) and spend nearly all
+    their time waiting on HTTP, so each runs in the loop's default executor and
+    the whole run takes about as long as the slowest collector rather than the sum.
+    They share the pooled HTTP session, and their database writes stay synchronous
+    inside the executor threads.
+    """
+    loop = asyncio.get_running_loop()
+    counts = await asyncio.gather(*(
+        loop.run_in_executor(None, functools.partial(collect_func, database_url, last_dates=last_dates))
+        for _, collect_func in MARKET_DATA_COLLECTORS
+    ))
+    return sum(counts)
+
+def collect_all_market_data(database_url=None):
+    """
+    Run every market data collector, looking up all their last record dates in one query.
+    
+    Each collector is handed the shared watermarks, so none of them issues its
+    own MAX(date) query before deciding whether it is up to date. The collectors
+    themselves run concurrently via collect_all_market_data_async.
+    """
+    last_dates = BaseCollector(database_url).get_last_dates(
+        [table for table, _ in MARKET_DATA_COLLECTORS]
+    )
+    
+    return asyncio.run(collect_all_market_data_async(database_url, last_dates=last_dates))
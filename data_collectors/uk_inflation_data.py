@@ -16,20 +16,151 @@ Supports the database schema designed for efficient rate calculations and contri
 import pandas as pd
 import numpy as np
 import re
+import csv
+import functools
+from bisect import bisect_right
 from datetime import datetime, date
-from typing import Dict, Any, Optional, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
+from typing import Dict, Any, Iterable, Iterator, Optional, List, Tuple
 import logging
 import io
-import requests
-import tempfile
 import os
+import queue
+import threading
+import orjson
+import requests
+from psycopg2.extras import execute_values
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+    pacsv = None
+
+from .base import BaseCollector, USER_CACHE_DIR
+
+# "<CPI|CPIH> <INDEX|WEIGHTS> <COICOP code>" - series, kind and code of a series column header
+_SERIES_COLUMN_RE = re.compile(r'(CPIH?) (INDEX|WEIGHTS) ([0-9]+(?:\.[0-9]+)*[A-Z]*)', re.IGNORECASE)
+
+# Headers of the MM23 columns the collector reads: the CPI/CPIH index and weight
+# series and the RPI indices. Every other column is skipped while parsing.
+_MM23_COLUMN_RE = re.compile(r'CPIH? (?:INDEX|WEIGHTS) [0-9]|RPI', re.IGNORECASE)
+
+# First-column labels of the monthly ("2024 JAN") and annual ("2024") data rows
+_MONTHLY_ROW_PATTERN = r'\d{4}\s+(?:JAN|FEB|MAR|APR|MAY|JUN|JUL|AUG|SEP|OCT|NOV|DEC)$'
+_YEAR_ROW_PATTERN = r'\d{4}$'
+
+# Year and month groups of a monthly row label
+_MONTHLY_ROW_RE = re.compile(r'(\d{4})\s+(JAN|FEB|MAR|APR|MAY|JUN|JUL|AUG|SEP|OCT|NOV|DEC)', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=4096)
+def _compile_header_pattern(pattern: str) -> re.Pattern:
+    """
+    Compile a case-insensitive header pattern once per process.
+    
+    find_series_columns builds several patterns per COICOP code, more than the 512
+    that re's own cache holds, so without this every run recompiles all of them.
+    """
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def _mm23_usecols(header: List[str]) -> List[int]:
+    """Positions of the MM23 columns to parse: the row-label column and the series columns."""
+    return [0] + [i for i, text in enumerate(header) if i and _MM23_COLUMN_RE.search(text)]
+
+
+def _to_float_matrix(cells: np.ndarray) -> np.ndarray:
+    """
+    Convert a block of MM23 cells (strings, NaN for blanks, or numbers) to float64.
+    
+    NumPy's bulk cast handles the usual all-numeric block several times faster than
+    pd.to_numeric; a block holding any non-numeric text ("x", footnote markers)
+    falls back to to_numeric, which turns just those cells into NaN.
+    """
+    try:
+        return cells.astype(float)
+    except (TypeError, ValueError):
+        return np.asarray(pd.to_numeric(cells.ravel(), errors='coerce'), dtype=float).reshape(cells.shape)
+
+
+@functools.lru_cache(maxsize=4096)
+def _coicop_sort_order(coicop_id: str) -> int:
+    """
+    Pack a COICOP id's parts into an integer, three decimal digits per part.
+    
+    "07.1.1A" -> 7_001_000: a non-numeric part counts as 0. Only the first six parts are
+    kept, so the result fits the database's 18-digit limit.
+    """
+    sort_order = 0
+    for part in coicop_id.split('.')[:6]:
+        sort_order = sort_order * 1000 + (int(part) if part.isdigit() else 0)
+    return sort_order
+
 
-from .base import BaseCollector
+# Rows of the MM23 CSV parsed per chunk while it streams in (pandas parser), or bytes
+# per block (pyarrow's multi-threaded reader, when installed)
+MM23_CSV_CHUNKSIZE = 50_000
+MM23_ARROW_BLOCK_SIZE = 8 << 20
+
+# Bytes per block read off the MM23 response by the download thread, and blocks it
+# may run ahead of the parser (bounds the buffered download to ~16 MB)
+MM23_DOWNLOAD_BLOCK_SIZE = 1 << 20
+MM23_DOWNLOAD_QUEUE_BLOCKS = 16
+
+# Price records sent per INSERT ... unnest statement
+PRICE_DATA_BATCH_SIZE = 5000
+
+# Field order of the price record tuples built by the collector; plain tuples avoid a
+# dict per record on runs that produce hundreds of thousands of them
+PRICE_DATA_FIELDS = ('date', 'coicop_id', 'series_type', 'index_value', 'weight_value', 'source_column')
+
+# Conditional-GET validators and the parsed MM23 frame, kept between runs so an
+# unchanged file costs a 304 instead of a full download and parse. The directory is
+# per-user and owner-only; the frame is stored as CSV, which can't run code on load
+MM23_CACHE_DIR = os.path.join(USER_CACHE_DIR, "mm23")
+
+
+class _QueueReader(io.RawIOBase):
+    """
+    Read-only stream over byte blocks put on a queue by a download thread.
+    
+    None on the queue marks the end of the stream; an exception is re-raised to the reader.
+    """
+    
+    def __init__(self, blocks: queue.Queue):
+        self._blocks = blocks
+        self._pending = memoryview(b'')
+        self._finished = False
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, buffer) -> int:
+        while not self._pending and not self._finished:
+            block = self._blocks.get()
+            if block is None:
+                self._finished = True
+            elif isinstance(block, BaseException):
+                raise block
+            else:
+                self._pending = memoryview(block)
+        
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
 
 
 class UKInflationCollector(BaseCollector):
     """Collector for UK inflation data from ONS MM23 CSV file."""
     
+    # Month numbers of the month tokens in MM23 row labels ("2024 JAN")
+    _MONTH_NUMBERS = {'JAN': 1, 'FEB': 2, 'MAR': 3, 'APR': 4, 'MAY': 5, 'JUN': 6,
+                      'JUL': 7, 'AUG': 8, 'SEP': 9, 'OCT': 10, 'NOV': 11, 'DEC': 12}
+    
     # ONS MM23 CSV download URL
     ONS_MM23_URL = "https://www.ons.gov.uk/file?uri=/economy/inflationandpriceindices/datasets/consumerpriceindices/current/mm23.csv"
     
@@ -37,6 +168,13 @@ class UKInflationCollector(BaseCollector):
         super().__init__(database_url)
         self.logger = logging.getLogger(__name__)
         
+        # (df, header strings, (series, kind, code) -> columns, joined header text,
+        # column start offsets in that text) for the last frame searched
+        self._header_cache = None
+        # (df, row positions, years) of the annual rows of the last frame parsed
+        self._year_rows_cache = None
+        self.cache_dir = os.environ.get("MM23_CACHE_DIR", MM23_CACHE_DIR)
+        
         # COICOP Level 1 categories mapping
         self.level1_categories = {
             '00': 'ALL ITEMS',
@@ -54,61 +192,230 @@ class UKInflationCollector(BaseCollector):
             '12': 'MISCELLANEOUS GOODS AND SERVICES'
         }
         
+    def _clear_frame_caches(self):
+        """Drop the header and year-row caches, releasing the frame they reference."""
+        self._header_cache = None
+        self._year_rows_cache = None
+    
+    def _get_header_index(self, df: pd.DataFrame) -> Tuple[List[str], Dict[Tuple[str, str, str], List[int]]]:
+        """
+        Get the header row of df as strings, plus the columns of each series header.
+        
+        The series column map is keyed by upper-cased (series, kind, COICOP code), e.g.
+        ("CPI", "INDEX", "01.1"). Both are built in one pass over the header row and
+        reused by every column lookup on the same frame.
+        """
+        if self._header_cache is not None and self._header_cache[0] is df:
+            return self._header_cache[1], self._header_cache[2]
+        
+        # str() per cell, not astype(str): pandas 3 keeps missing cells as NaN under astype(str)
+        headers = [str(header) for header in df.iloc[0].tolist()]
+        column_map = {}
+        for i, header in enumerate(headers):
+            match = _SERIES_COLUMN_RE.search(header)
+            if match:
+                column_map.setdefault(tuple(part.upper() for part in match.groups()), []).append(i)
+        
+        # NUL never occurs in header text, so a match can't straddle two columns
+        header_text = '\0'.join(headers)
+        starts = list(accumulate((len(header) + 1 for header in headers[:-1]), initial=0))
+        
+        self._header_cache = (df, headers, column_map, header_text, starts)
+        return headers, column_map
+    
     def find_column_by_header_text(self, df: pd.DataFrame, header_text: str) -> Optional[int]:
-        """Find column index by searching for header text in the first row."""
-        header_row = df.iloc[0]
-        for i, header in enumerate(header_row):
-            if header_text in str(header):
-                return i
-        return None
+        """
+        Find column index by searching for header text in the first row.
+        
+        One str.find over the joined header row replaces a containment test per column;
+        the match offset is mapped back to its column by bisecting the column starts.
+        """
+        self._get_header_index(df)
+        joined, starts = self._header_cache[3], self._header_cache[4]
+        position = joined.find(header_text)
+        if position == -1:
+            return None
+        return bisect_right(starts, position) - 1
     
     def find_column_by_regex(self, df: pd.DataFrame, pattern: str) -> Optional[int]:
         """Find column index by regex pattern matching in the first row."""
-        header_row = df.iloc[0]
-        regex = re.compile(pattern, re.IGNORECASE)
-        for i, header in enumerate(header_row):
-            if regex.search(str(header)):
-                return i
-        return None
-    
-    def download_mm23_csv(self) -> str:
+        headers, _ = self._get_header_index(df)
+        return self._find_series_column(headers, range(len(headers)), pattern)
+    
+    def _iter_csv_frames(self, response, chunksize: int) -> Iterator[pd.DataFrame]:
         """
-        Download the latest MM23.csv file from ONS website.
+        Parse a streamed MM23 response as filtered DataFrame chunks.
         
-        Returns:
-            Path to the downloaded CSV file
+        Each chunk keeps only the rows the collector reads - the header row (first chunk)
+        and the annual and monthly data rows - so metadata and quarterly rows never
+        accumulate in memory. The header row is parsed on its own first, and the rest of
+        the file is tokenized for the series columns it names only (via usecols). Frame
+        columns stay labelled by their position in the full CSV.
+        
+        A background thread keeps reading the response while chunks are tokenized and
+        filtered, so the download overlaps the parse instead of pausing for it.
         """
-        self.logger.info(f"Downloading MM23.csv from ONS: {self.ONS_MM23_URL}")
+        blocks = queue.Queue(maxsize=MM23_DOWNLOAD_QUEUE_BLOCKS)
+        stop = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mm23-download")
+        executor.submit(self._download_blocks, response, blocks, stop)
         
         try:
-            # Download with progress tracking
-            response = requests.get(self.ONS_MM23_URL, stream=True, timeout=300)
-            response.raise_for_status()
+            reader = io.BufferedReader(_QueueReader(blocks))
+            header = next(csv.reader([reader.readline().decode('utf-8-sig')]))
+            usecols = _mm23_usecols(header)
+            self.logger.info(f"Parsing {len(usecols):,} of {len(header):,} MM23 columns")
+            yield pd.DataFrame([[header[i] for i in usecols]], columns=usecols)
             
-            # Create temporary file
-            temp_file = tempfile.NamedTemporaryFile(mode='wb', suffix='.csv', delete=False)
-            
-            # Download with chunked reading for large files
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded_size = 0
-            
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    temp_file.write(chunk)
-                    downloaded_size += len(chunk)
-                    
-                    # Log progress for large files
-                    if total_size > 0 and downloaded_size % (1024 * 1024) == 0:  # Every MB
-                        progress = (downloaded_size / total_size) * 100
-                        self.logger.debug(f"Download progress: {progress:.1f}% ({downloaded_size:,} / {total_size:,} bytes)")
-            
-            temp_file.close()
+            rows_read = 1
+            for chunk in self._read_csv_chunks(reader, len(header), usecols, chunksize):
+                first_col = chunk.iloc[:, 0].str.strip()
+                keep = (first_col.str.match(_YEAR_ROW_PATTERN) |
+                        first_col.str.match(_MONTHLY_ROW_PATTERN, case=False))
+                keep = keep.fillna(False).to_numpy(dtype=bool, copy=True)
+                
+                rows_read += len(chunk)
+                yield chunk[keep]
             
-            # Verify file size
-            file_size = os.path.getsize(temp_file.name)
-            self.logger.info(f"MM23.csv downloaded successfully: {file_size:,} bytes to {temp_file.name}")
+            self.logger.info(f"MM23.csv streamed successfully: {rows_read:,} rows")
+        finally:
+            # Unblocks a download thread still waiting on a full queue; the caller closing
+            # the response ends one still waiting on the network
+            stop.set()
+            executor.shutdown(wait=False)
+    
+    def _read_csv_chunks(self, reader, n_columns: int, usecols: List[int], chunksize: int) -> Iterator[pd.DataFrame]:
+        """
+        Tokenize the rest of MM23 into string DataFrames of the usecols columns.
+        
+        pyarrow's streaming CSV reader, which parses each block on several threads, is used
+        when installed; otherwise pandas' C parser. Both give NaN for empty cells.
+        """
+        if pacsv is None:
+            yield from pd.read_csv(reader, header=None, dtype=str, usecols=usecols, chunksize=chunksize)
+            return
+        
+        names = [f"f{i}" for i in range(n_columns)]
+        batches = pacsv.open_csv(
+            reader,
+            read_options=pacsv.ReadOptions(column_names=names, block_size=MM23_ARROW_BLOCK_SIZE, use_threads=True),
+            convert_options=pacsv.ConvertOptions(
+                include_columns=[names[i] for i in usecols],
+                column_types={names[i]: pa.string() for i in usecols},
+                strings_can_be_null=True
+            )
+        )
+        for batch in batches:
+            chunk = batch.to_pandas().fillna(np.nan)  # Arrow nulls arrive as None
+            chunk.columns = usecols
+            yield chunk
+    
+    def _download_blocks(self, response, blocks: queue.Queue, stop: threading.Event):
+        """Put the response body on blocks as it arrives, then None (or the download error)."""
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    blocks.put(item, timeout=1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        try:
+            # iter_content also undoes gzip transfer encoding
+            for block in response.iter_content(MM23_DOWNLOAD_BLOCK_SIZE):
+                if not put(block):
+                    return
+            put(None)
+        except Exception as e:
+            put(e)
+    
+    def read_mm23_file(self, path: str) -> pd.DataFrame:
+        """
+        Read a local MM23 CSV file, every cell as a string.
+        
+        Like the streamed download, only the label column and the series columns the
+        collector reads are parsed (selected from the header row), and frame columns
+        stay labelled by their position in the full CSV. Uses pandas' pyarrow engine,
+        which parses on several threads, when pyarrow is installed, and the C engine
+        otherwise.
+        """
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            usecols = _mm23_usecols(next(csv.reader(f)))
+        
+        engine = 'pyarrow' if pacsv is not None else 'c'
+        df = pd.read_csv(path, header=None, dtype=str, usecols=usecols, engine=engine)
+        df.columns = usecols  # The pyarrow engine renumbers the selected columns from 0
+        return df
+    
+    def _cache_paths(self) -> Tuple[str, str]:
+        """Paths of the cached validators (JSON) and parsed frame (CSV)."""
+        return (os.path.join(self.cache_dir, "mm23.json"),
+                os.path.join(self.cache_dir, "mm23_frame.csv"))
+    
+    def _load_cached_frame(self) -> Tuple[Optional[Dict[str, Any]], Optional[pd.DataFrame]]:
+        """Load the ETag/Last-Modified validators and parsed frame of the last download, if any."""
+        if not self._private_cache_dir(self.cache_dir):
+            return None, None
+        
+        validators_path, frame_path = self._cache_paths()
+        try:
+            with open(validators_path, 'rb') as f:
+                validators = orjson.loads(f.read())
             
-            return temp_file.name
+            # Only empty cells were missing in the parsed frame; any text ("NA", "null") is data
+            df = pd.read_csv(frame_path, dtype=str, keep_default_na=False, na_values=[''])
+            df.columns = [int(column) for column in df.columns]  # Positions in the full CSV
+            return validators, df
+        except Exception:
+            # Missing, partial or unreadable entry: download as if uncached
+            return None, None
+    
+    def _save_cached_frame(self, response, df: pd.DataFrame):
+        """Cache the response's validators with the parsed frame; a failed write never fails collection."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not (etag or last_modified):
+            return
+        
+        if not self._private_cache_dir(self.cache_dir):
+            return
+        
+        validators_path, frame_path = self._cache_paths()
+        try:
+            # Frame first, validators last: validators only ever describe a complete frame
+            df.to_csv(f"{frame_path}.tmp", index=False)
+            os.replace(f"{frame_path}.tmp", frame_path)
+            with open(f"{validators_path}.tmp", 'wb') as f:
+                f.write(orjson.dumps({"etag": etag, "last_modified": last_modified}))
+            os.replace(f"{validators_path}.tmp", validators_path)
+        except (OSError, TypeError) as e:
+            self.logger.warning(f"Could not cache MM23.csv: {str(e)}")
+    
+    def load_mm23_frame(self, chunksize: int = MM23_CSV_CHUNKSIZE) -> pd.DataFrame:
+        """
+        Get the filtered MM23 frame, skipping the download and parse when ONS hasn't republished.
+        
+        The request carries the validators of the last download; on 304 the frame parsed
+        then is loaded from the local cache instead.
+        """
+        validators, cached_df = self._load_cached_frame()
+        headers = {}
+        if validators:
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
+        
+        self.logger.info(f"Downloading MM23.csv from ONS: {self.ONS_MM23_URL}")
+        
+        try:
+            with self.session.get(self.ONS_MM23_URL, headers=headers, stream=True, timeout=300) as response:
+                if validators and response.status_code == 304:
+                    self.logger.info("MM23.csv not modified, using cached frame")
+                    return cached_df
+                response.raise_for_status()
+                df = pd.concat(self._iter_csv_frames(response, chunksize), ignore_index=True)
             
         except requests.exceptions.RequestException as e:
             self.logger.error(f"Failed to download MM23.csv from ONS: {e}")
@@ -116,6 +423,29 @@ class UKInflationCollector(BaseCollector):
         except Exception as e:
             self.logger.error(f"Unexpected error downloading MM23.csv: {e}")
             raise
+        
+        self._save_cached_frame(response, df)
+        return df
+    
+    def _get_year_rows(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Years and raw cell values of the annual (weights) rows in df, found once per frame.
+        
+        The values are returned as one 2D NumPy array (rows x columns), so each weight
+        column is a plain array slice rather than a new iloc Series.
+        """
+        if self._year_rows_cache is not None and self._year_rows_cache[0] is df:
+            return self._year_rows_cache[1], self._year_rows_cache[2]
+        
+        first_col = df.iloc[:, 0].astype(str).str.strip()
+        is_year = first_col.str.match(_YEAR_ROW_PATTERN).to_numpy(dtype=bool)
+        years = first_col[is_year].astype(int).to_numpy()
+        in_range = (years >= 1990) & (years <= 2030)
+        
+        years = years[in_range]
+        values = df.iloc[np.flatnonzero(is_year)[in_range]].to_numpy()
+        self._year_rows_cache = (df, years, values)
+        return years, values
     
     def parse_weight_data(self, df: pd.DataFrame, weight_col: int, series_type: str) -> Dict[int, float]:
         """Parse annual weight data from yearly sections of the CSV."""
@@ -126,61 +456,38 @@ class UKInflationCollector(BaseCollector):
             
         self.logger.info(f"Extracting {series_type} weight data from column {weight_col + 1}...")
         
-        for i in range(len(df)):
-            first_col = str(df.iloc[i, 0]).strip()
-            
-            # Check if this row contains a year (weights are annual)
-            if first_col.isdigit() and len(first_col) == 4 and 1990 <= int(first_col) <= 2030:
-                year = int(first_col)
-                weight_val = pd.to_numeric(df.iloc[i, weight_col], errors='coerce')
-                
-                if pd.notna(weight_val) and 0 < weight_val <= 2000:  # Reasonable weight range
-                    weights[year] = float(weight_val)
+        # Weights are annual: read the column at every year row in one pass
+        years, year_values = self._get_year_rows(df)
+        values = pd.to_numeric(year_values[:, weight_col], errors='coerce').astype(float)
+        valid = (values > 0) & (values <= 2000)  # Reasonable weight range; NaN compares False
+        
+        weights = dict(zip(years[valid].tolist(), values[valid].tolist()))
                     
         self.logger.info(f"Found {len(weights)} {series_type} weight entries")
         return weights
     
-    def extract_monthly_data(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
+    def extract_monthly_data(self, df: pd.DataFrame) -> List[int]:
         """Extract monthly data rows from the CSV."""
-        monthly_rows = []
-        
-        for i in range(len(df)):
-            val = str(df.iloc[i, 0]).strip()
-            if len(val.split()) == 2:
-                parts = val.split()
-                if (len(parts[0]) == 4 and parts[0].isdigit() and 
-                    parts[1].upper() in ['JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN',
-                                       'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC']):
-                    monthly_rows.append(i)
+        first_col = df.iloc[:, 0].astype(str).str.strip()
+        is_monthly = first_col.str.match(_MONTHLY_ROW_PATTERN, case=False).to_numpy(dtype=bool)
+        monthly_rows = np.flatnonzero(is_monthly).tolist()
                     
         self.logger.info(f"Found {len(monthly_rows)} monthly data rows")
         return monthly_rows
     
     def extract_all_coicop_codes(self, df: pd.DataFrame) -> Dict[str, int]:
         """Extract all COICOP codes and their hierarchy levels from CPI INDEX columns."""
-        coicop_codes = {}
-        header_row = df.iloc[0]
+        headers, _ = self._get_header_index(df)
         
         # Pattern to match both CPI INDEX and CPIH INDEX columns and extract COICOP code precisely
         # Match the code followed by a delimiter (space, colon, etc.) to avoid partial matches
         # Include optional alphabetic suffixes like A, B for categories like 07.1.1A, 07.1.1B
-        index_pattern = re.compile(r'(?:CPI|CPIH) INDEX ([0-9]+(?:\.[0-9]+)*[A-Z]*)\s*[:=/\s]', re.IGNORECASE)
+        index_pattern = r'(?:CPI|CPIH) INDEX ([0-9]+(?:\.[0-9]+)*[A-Z]*)\s*[:=/\s]'
+        codes = pd.Series(headers, dtype=object).str.extract(index_pattern, flags=re.IGNORECASE, expand=False).dropna()
         
-        for i, header in enumerate(header_row):
-            header_str = str(header)
-            match = index_pattern.search(header_str)
-            if match:
-                coicop_code = match.group(1)
-                
-                # Determine level based on dot structure
-                # Remove alphabetic suffixes for level calculation
-                numeric_code = re.sub(r'[A-Z]+$', '', coicop_code)
-                if '.' not in numeric_code:
-                    level = 1
-                else:
-                    level = len(numeric_code.split('.'))
-                
-                coicop_codes[coicop_code] = level
+        # Level is the number of dot-separated parts (alphabetic suffixes contain no dots)
+        levels = codes.str.count(r'\.') + 1
+        coicop_codes = dict(zip(codes.tolist(), levels.tolist()))
         
         self.logger.info(f"Found {len(coicop_codes)} COICOP categories across {max(coicop_codes.values())} levels")
         
@@ -210,8 +517,20 @@ class UKInflationCollector(BaseCollector):
         
         return coicop_codes
 
-    def find_series_columns(self, df: pd.DataFrame) -> Dict[str, Dict[str, Optional[int]]]:
-        """Find column positions for all inflation series and weights."""
+    def _find_series_column(self, headers: List[str], candidates: Iterable[int], pattern: str) -> Optional[int]:
+        """First of the candidate columns whose header matches pattern."""
+        regex = _compile_header_pattern(pattern)
+        return next((i for i in candidates if regex.search(headers[i])), None)
+    
+    def find_series_columns(self, df: pd.DataFrame,
+                            coicop_codes: Dict[str, int] = None) -> Dict[str, Dict[str, Optional[int]]]:
+        """
+        Find column positions for all inflation series and weights.
+        
+        Each code's columns come from a dict of the series headers by exact code, so a
+        pattern is only checked against the one or two headers of that code. coicop_codes
+        are the codes already extracted from df, if the caller has them.
+        """
         columns = {
             'CPI': {'indices': {}, 'weights': {}},
             'CPIH': {'indices': {}, 'weights': {}}, 
@@ -221,7 +540,8 @@ class UKInflationCollector(BaseCollector):
         self.logger.info("Looking up column positions for all series...")
         
         # First, discover all COICOP codes available in the data
-        all_coicop_codes = self.extract_all_coicop_codes(df)
+        all_coicop_codes = coicop_codes if coicop_codes is not None else self.extract_all_coicop_codes(df)
+        headers, column_map = self._get_header_index(df)
         
         # Find all CPI columns (all COICOP levels)
         for coicop_code in all_coicop_codes.keys():
@@ -233,7 +553,7 @@ class UKInflationCollector(BaseCollector):
                 # Flexible pattern: CPI INDEX XX - allow for combined categories and alphabetic suffixes
                 pattern = rf"CPI INDEX {re.escape(coicop_code)}"
             
-            cpi_col = self.find_column_by_regex(df, pattern)
+            cpi_col = self._find_series_column(headers, column_map.get(('CPI', 'INDEX', coicop_code.upper()), []), pattern)
             
             if cpi_col is not None:
                 columns['CPI']['indices'][coicop_code] = cpi_col
@@ -246,7 +566,7 @@ class UKInflationCollector(BaseCollector):
             if coicop_code == '00':
                 # Special pattern for overall weights (HICP or Overall)
                 pattern = rf"CPI WEIGHTS {re.escape(coicop_code)}\s*[:=-]\s*(HICP|Overall)"
-                weight_col = self.find_column_by_regex(df, pattern)
+                weight_col = self._find_series_column(headers, column_map.get(('CPI', 'WEIGHTS', coicop_code.upper()), []), pattern)
                 if weight_col is not None:
                     columns['CPI']['weights'][coicop_code] = weight_col
                     self.logger.debug(f"✅ Found CPI WEIGHTS {coicop_code} at position {weight_col + 1}")
@@ -257,7 +577,7 @@ class UKInflationCollector(BaseCollector):
                 # Flexible pattern for all COICOP categories (Level 1, 2, 3, 4)
                 # Pattern handles: "CPI WEIGHTS XX:", "CPI WEIGHTS XX Description", "CPI WEIGHTS XX/YY Combined categories", and "CPI WEIGHTS XX. :"
                 pattern = rf"CPI WEIGHTS {re.escape(coicop_code)}\.?(?:/[0-9]+)*(?:\s*[:=-]|\s+[A-Za-z])"
-                weight_col = self.find_column_by_regex(df, pattern)
+                weight_col = self._find_series_column(headers, column_map.get(('CPI', 'WEIGHTS', coicop_code.upper()), []), pattern)
                 if weight_col is not None:
                     columns['CPI']['weights'][coicop_code] = weight_col
                     self.logger.debug(f"✅ Found CPI WEIGHTS {coicop_code} at position {weight_col + 1}")
@@ -277,7 +597,7 @@ class UKInflationCollector(BaseCollector):
                 # Avoids: "CPIH INDEX XX.Y.Z.W" (sub-categories)
                 pattern = rf"CPIH INDEX {re.escape(coicop_code)}(?:\s*:|(?=\s+[A-Z][a-z]))"
             
-            cpih_col = self.find_column_by_regex(df, pattern)
+            cpih_col = self._find_series_column(headers, column_map.get(('CPIH', 'INDEX', coicop_code.upper()), []), pattern)
             
             if cpih_col is not None:
                 columns['CPIH']['indices'][coicop_code] = cpih_col
@@ -288,7 +608,7 @@ class UKInflationCollector(BaseCollector):
             if coicop_code == '00':
                 # Special pattern for overall weights (Overall or HICP)
                 pattern = rf"CPIH WEIGHTS {re.escape(coicop_code)}\s*[:=-]\s*(Overall|HICP)"
-                weight_col = self.find_column_by_regex(df, pattern)
+                weight_col = self._find_series_column(headers, column_map.get(('CPIH', 'WEIGHTS', coicop_code.upper()), []), pattern)
                 if weight_col is not None:
                     columns['CPIH']['weights'][coicop_code] = weight_col
                     self.logger.debug(f"✅ Found CPIH WEIGHTS {coicop_code} at position {weight_col + 1}")
@@ -299,7 +619,7 @@ class UKInflationCollector(BaseCollector):
                 # Flexible pattern for all COICOP categories (Level 1, 2, 3, 4)
                 # Pattern handles: "CPIH WEIGHTS XX:", "CPIH WEIGHTS XX Description", "CPIH WEIGHTS XX/YY Combined categories", and "CPIH WEIGHTS XX. :"
                 pattern = rf"CPIH WEIGHTS {re.escape(coicop_code)}\.?(?:/[0-9]+)*(?:\s*[:=-]|\s+[A-Za-z])"
-                weight_col = self.find_column_by_regex(df, pattern)
+                weight_col = self._find_series_column(headers, column_map.get(('CPIH', 'WEIGHTS', coicop_code.upper()), []), pattern)
                 if weight_col is not None:
                     columns['CPIH']['weights'][coicop_code] = weight_col
                     self.logger.debug(f"✅ Found CPIH WEIGHTS {coicop_code} at position {weight_col + 1}")
@@ -319,41 +639,30 @@ class UKInflationCollector(BaseCollector):
     
     def extract_coicop_descriptions_from_headers(self, df: pd.DataFrame) -> Dict[str, str]:
         """Extract COICOP descriptions from column headers for all levels."""
-        descriptions = {}
-        header_row = df.iloc[0]
+        headers = pd.Series(self._get_header_index(df)[0], dtype=object)
         
         # Pattern to match CPI INDEX columns and extract COICOP code and description
         # Handles both formats: "CPI INDEX 01 : Description" and "CPI INDEX 01.1.1.1 Description"
-        cpi_pattern = re.compile(r'CPI INDEX ([0-9.]+)\s*[:=-]?\s*(.+?)\s+2015=100', re.IGNORECASE)
+        cpi_pattern = r'CPI INDEX ([0-9.]+)\s*[:=-]?\s*(.+?)\s+2015=100'
         
         # Also check CPIH INDEX headers for additional descriptions
-        cpih_pattern = re.compile(r'CPIH INDEX ([0-9.]+)\s*[:=-]?\s*(.+?)\s+2015=100', re.IGNORECASE)
+        cpih_pattern = r'CPIH INDEX ([0-9.]+)\s*[:=-]?\s*(.+?)\s+2015=100'
         
-        for i, header in enumerate(header_row):
-            header_str = str(header)
-            
-            # Try CPI INDEX first
-            match = cpi_pattern.search(header_str)
-            if match:
-                coicop_code = match.group(1)
-                description = match.group(2).strip()
-                
-                # Clean up description
-                description = description.replace('  ', ' ')  # Remove double spaces
-                descriptions[coicop_code] = description
-                continue
-            
-            # Try CPIH INDEX if CPI didn't match
-            match = cpih_pattern.search(header_str)
-            if match:
-                coicop_code = match.group(1)
-                description = match.group(2).strip()
-                
-                # Clean up description
-                description = description.replace('  ', ' ')  # Remove double spaces
-                # Only add if we don't already have this code from CPI
-                if coicop_code not in descriptions:
-                    descriptions[coicop_code] = description
+        cpi = headers.str.extract(cpi_pattern, flags=re.IGNORECASE)
+        is_cpi = cpi[0].notna()
+        
+        # CPIH INDEX only for headers without a CPI match; its first description is kept
+        cpih = headers[~is_cpi].str.extract(cpih_pattern, flags=re.IGNORECASE).dropna()
+        cpih = cpih.drop_duplicates(subset=0, keep='first')
+        
+        # Clean up descriptions: strip and remove double spaces
+        cpi = cpi[is_cpi]
+        cpi_descriptions = cpi[1].str.strip().str.replace('  ', ' ', regex=False)
+        cpih_descriptions = cpih[1].str.strip().str.replace('  ', ' ', regex=False)
+        
+        # CPI descriptions take precedence (the last one per code wins)
+        descriptions = dict(zip(cpih[0].tolist(), cpih_descriptions.tolist()))
+        descriptions.update(zip(cpi[0].tolist(), cpi_descriptions.tolist()))
         
         self.logger.info(f"Extracted descriptions for {len(descriptions)} COICOP categories")
         return descriptions
@@ -442,105 +751,88 @@ class UKInflationCollector(BaseCollector):
         return records
 
     def _identify_missing_parents(self, coicop_codes: Dict[str, int]) -> Dict[str, int]:
-        """Identify missing parent categories that need to be auto-generated (recursively)."""
-        missing_parents = {}
-        all_codes = coicop_codes.copy()
+        """
+        Identify missing parent categories that need to be auto-generated (recursively).
         
-        # Keep iterating until no new missing parents are found
-        found_new_missing = True
-        iteration = 0
+        Each pass only checks the parents found by the one before, so every code is
+        visited once and the walk ends when a pass adds nothing.
+        """
+        missing_parents = {}
+        all_codes = set(coicop_codes)
+        frontier = list(coicop_codes.items())
         
-        while found_new_missing and iteration < 10:  # Safety limit
-            found_new_missing = False
-            iteration += 1
-            new_missing_this_iteration = {}
-            
-            # Take a snapshot of codes to iterate over (avoid modification during iteration)
-            codes_to_check = all_codes.copy()
+        while frontier:
+            new_missing = {}
+            for coicop_code, level in frontier:
+                if not 2 <= level <= 4:
+                    continue
+                
+                # The parent drops the code's last segment: 01.1.1 -> 01.1
+                parent_id = '.'.join(coicop_code.split('.')[:level - 1])
+                if parent_id and parent_id not in all_codes and parent_id not in new_missing:
+                    new_missing[parent_id] = level - 1
+                    self.logger.debug(f"Identified missing parent: {parent_id} (Level {level - 1}) for child {coicop_code}")
             
-            for coicop_code, level in codes_to_check.items():
-                if level > 1:
-                    # Determine what the parent should be
-                    if level == 2:
-                        parent_id = coicop_code.split('.')[0]
-                    elif level == 3:
-                        parts = coicop_code.split('.')
-                        parent_id = '.'.join(parts[:2])
-                    elif level == 4:
-                        parts = coicop_code.split('.')
-                        parent_id = '.'.join(parts[:3])
-                    else:
-                        continue
-                    
-                    # Check if parent exists in current working set
-                    if parent_id and parent_id not in all_codes:
-                        # Calculate parent level
-                        parent_level = level - 1
-                        new_missing_this_iteration[parent_id] = parent_level
-                        self.logger.debug(f"Iteration {iteration}: Identified missing parent: {parent_id} (Level {parent_level}) for child {coicop_code}")
-            
-            # Add new missing parents to both tracking dicts
-            if new_missing_this_iteration:
-                missing_parents.update(new_missing_this_iteration)
-                all_codes.update(new_missing_this_iteration)
-                found_new_missing = True
-        
-        if iteration >= 10:
-            self.logger.warning("Missing parent detection reached maximum iterations - possible infinite loop in hierarchy")
+            missing_parents.update(new_missing)
+            all_codes.update(new_missing)
+            frontier = list(new_missing.items())
         
         return missing_parents
 
     def _calculate_parent_weights(self, weights_by_series: Dict[str, Dict[str, Dict[int, float]]], hierarchy_records: List[Dict[str, Any]]) -> Dict[str, Dict[str, Dict[int, float]]]:
-        """Calculate weights for auto-generated parent categories by summing children's weights."""
-        # Build parent-child mapping
+        """
+        Calculate weights for auto-generated parent categories by summing children's weights.
+        
+        Each series' weights are laid out as a dense (category x year) array, NaN where a
+        category has no weight for a year. Parents are filled from the deepest level up,
+        each with one NumPy sum over its children's rows, so a missing parent whose children
+        were themselves auto-generated picks up their calculated weights. A parent gets a
+        weight for the years in which at least one child has one.
+        """
         children_by_parent = {}
         for record in hierarchy_records:
-            parent_id = record.get('parent_id')
-            if parent_id:
-                if parent_id not in children_by_parent:
-                    children_by_parent[parent_id] = []
-                children_by_parent[parent_id].append(record['coicop_id'])
+            if record['parent_id'] is not None:
+                children_by_parent.setdefault(record['parent_id'], []).append(record['coicop_id'])
+        
+        # Parents in fill order: deepest level first, then by code
+        parents = sorted(
+            (record for record in hierarchy_records if record['coicop_id'] in children_by_parent),
+            key=lambda record: (-record['level'], record['coicop_id'])
+        )
         
         # Calculate weights for each series type
         for series_type in ['CPI', 'CPIH']:
             if series_type not in weights_by_series:
                 continue
+            series_weights = weights_by_series[series_type]
+            
+            years = np.array(sorted({year for yearly in series_weights.values() for year in yearly}), dtype=np.int64)
+            if len(years) == 0:
+                continue
+            year_index = {year: i for i, year in enumerate(years.tolist())}
+            code_index = {code: i for i, code in enumerate(
+                {**dict.fromkeys(record['coicop_id'] for record in hierarchy_records), **dict.fromkeys(series_weights)}
+            )}
+            
+            matrix = np.full((len(code_index), len(years)), np.nan)
+            for coicop_id, yearly in series_weights.items():
+                matrix[code_index[coicop_id], [year_index[year] for year in yearly]] = list(yearly.values())
+            
+            # Only auto-generated parents (no weights column of their own) are filled
+            for record in parents:
+                parent_id = record['coicop_id']
+                if parent_id in series_weights:
+                    continue
                 
-            # Find categories that need weight calculation (auto-generated parents)
-            existing_categories = set(weights_by_series[series_type].keys())
-            all_categories = {record['coicop_id'] for record in hierarchy_records}
-            missing_weight_categories = all_categories - existing_categories
-            
-            # Calculate weights for missing categories that have children
-            for parent_id in missing_weight_categories:
-                if parent_id in children_by_parent:
-                    children = children_by_parent[parent_id]
-                    parent_weights = {}
-                    
-                    # For each year, sum children's weights
-                    all_years = set()
-                    for child_id in children:
-                        if child_id in weights_by_series[series_type]:
-                            all_years.update(weights_by_series[series_type][child_id].keys())
-                    
-                    for year in all_years:
-                        total_weight = 0.0
-                        children_found = 0
-                        
-                        for child_id in children:
-                            if child_id in weights_by_series[series_type]:
-                                child_weights = weights_by_series[series_type][child_id]
-                                if year in child_weights:
-                                    total_weight += child_weights[year]
-                                    children_found += 1
-                        
-                        # Only set parent weight if we found weights for at least one child
-                        if children_found > 0:
-                            parent_weights[year] = total_weight
-                    
-                    if parent_weights:
-                        weights_by_series[series_type][parent_id] = parent_weights
-                        self.logger.info(f"Calculated {series_type} weights for auto-generated parent {parent_id}: {len(parent_weights)} years, max weight = {max(parent_weights.values()):.2f}")
+                child_rows = matrix[[code_index[child] for child in children_by_parent[parent_id]]]
+                has_weight = ~np.isnan(child_rows).all(axis=0)
+                if not has_weight.any():
+                    continue
+                
+                parent_row = np.where(has_weight, np.nansum(child_rows, axis=0), np.nan)
+                matrix[code_index[parent_id]] = parent_row
+                series_weights[parent_id] = dict(zip(years[has_weight].tolist(), parent_row[has_weight].tolist()))
+                self.logger.info(f"Calculated {series_type} weights for auto-generated parent {parent_id}: {int(has_weight.sum())} years, max weight = {parent_row[has_weight].max():.2f}")
         
         return weights_by_series
 
@@ -606,36 +898,27 @@ class UKInflationCollector(BaseCollector):
 
     def calculate_sort_order(self, coicop_id: str) -> int:
         """Calculate sort order for hierarchical sorting."""
-        parts = coicop_id.split('.')
-        
-        # Pad each part to 3 digits and join
-        padded_parts = []
-        for part in parts:
-            if part.isdigit():
-                padded_parts.append(f"{int(part):03d}")
-            else:
-                padded_parts.append("000")
-        
-        # Join and convert to int
-        sort_str = ''.join(padded_parts)
-        
-        # Ensure it fits in database integer limits
-        if len(sort_str) > 18:
-            sort_str = sort_str[:18]
-        
-        return int(sort_str) if sort_str else 0
+        return _coicop_sort_order(coicop_id)
 
-    def populate_coicop_hierarchy(self, conn, csv_file_path: str = None) -> int:
-        """Populate the COICOP hierarchy table with all levels."""
+    def populate_coicop_hierarchy(self, conn, df: pd.DataFrame = None,
+                                  hierarchy_records: List[Dict[str, Any]] = None,
+                                  commit: bool = True) -> int:
+        """Populate the COICOP hierarchy table with all levels.
+        
+        df is the MM23 frame already loaded by the caller; without it a local mm23.csv is read.
+        hierarchy_records, when the caller has already built them from df, are written as-is
+        instead of being extracted from the headers again. With commit=False the rows are
+        left in the caller's open transaction.
+        """
         if conn is None:
             # In safe mode, we need to discover the hierarchy from the data
-            file_path = csv_file_path if csv_file_path else 'mm23.csv'
-            df = pd.read_csv(file_path, header=None, low_memory=False) if hasattr(self, '_temp_df') else None
-            if df is not None:
+            if hierarchy_records is None and df is not None:
                 coicop_codes = self.extract_all_coicop_codes(df)
                 descriptions = self.extract_coicop_descriptions_from_headers(df)
                 hierarchy_records = self.build_coicop_hierarchy_records(coicop_codes, descriptions)
-                self.logger.info(f"Safe mode: Would populate COICOP hierarchy with {len(hierarchy_records)} categories across {max(coicop_codes.values())} levels")
+            if hierarchy_records is not None:
+                levels = max((record['level'] for record in hierarchy_records), default=0)
+                self.logger.info(f"Safe mode: Would populate COICOP hierarchy with {len(hierarchy_records)} categories across {levels} levels")
                 return len(hierarchy_records)
             else:
                 self.logger.info("Safe mode: Would populate COICOP hierarchy table")
@@ -644,39 +927,42 @@ class UKInflationCollector(BaseCollector):
         cursor = conn.cursor()
         
         try:
-            # We need to re-read the data to extract all codes and descriptions
-            # This is not ideal, but necessary for proper hierarchy building
-            file_path = csv_file_path if csv_file_path else 'mm23.csv'
-            df = pd.read_csv(file_path, header=None, low_memory=False)
-            coicop_codes = self.extract_all_coicop_codes(df)
-            descriptions = self.extract_coicop_descriptions_from_headers(df)
-            hierarchy_records = self.build_coicop_hierarchy_records(coicop_codes, descriptions)
+            if hierarchy_records is None:
+                if df is None:
+                    df = self.read_mm23_file('mm23.csv')
+                coicop_codes = self.extract_all_coicop_codes(df)
+                descriptions = self.extract_coicop_descriptions_from_headers(df)
+                hierarchy_records = self.build_coicop_hierarchy_records(coicop_codes, descriptions)
             
             # Sort hierarchy records by level to ensure parents are inserted before children
             hierarchy_records = sorted(hierarchy_records, key=lambda x: x['level'])
             
-            # Insert all hierarchy records
-            records_inserted = 0
-            for record in hierarchy_records:
-                cursor.execute("""
-                    INSERT INTO uk_inflation_coicop_hierarchy 
-                    (coicop_id, level, parent_id, description, sort_order)
-                    VALUES (%s, %s, %s, %s, %s)
-                    ON CONFLICT (coicop_id) DO UPDATE SET
-                        level = EXCLUDED.level,
-                        parent_id = EXCLUDED.parent_id,
-                        description = EXCLUDED.description,
-                        sort_order = EXCLUDED.sort_order
-                """, (
-                    record['coicop_id'],
-                    record['level'],
-                    record['parent_id'],
-                    record['description'],
-                    record['sort_order']
-                ))
-                records_inserted += 1
-            
-            conn.commit()
+            # Insert all hierarchy records in multi-row statements, one round-trip per page.
+            # The hierarchy rarely changes between releases, so only rows whose values
+            # differ are rewritten, sparing WAL and index churn on re-runs
+            rows = [
+                (record['coicop_id'], record['level'], record['parent_id'],
+                 record['description'], record['sort_order'])
+                for record in hierarchy_records
+            ]
+            execute_values(cursor, """
+                INSERT INTO uk_inflation_coicop_hierarchy 
+                (coicop_id, level, parent_id, description, sort_order)
+                VALUES %s
+                ON CONFLICT (coicop_id) DO UPDATE SET
+                    level = EXCLUDED.level,
+                    parent_id = EXCLUDED.parent_id,
+                    description = EXCLUDED.description,
+                    sort_order = EXCLUDED.sort_order
+                WHERE (uk_inflation_coicop_hierarchy.level, uk_inflation_coicop_hierarchy.parent_id,
+                       uk_inflation_coicop_hierarchy.description, uk_inflation_coicop_hierarchy.sort_order)
+                    IS DISTINCT FROM
+                      (EXCLUDED.level, EXCLUDED.parent_id, EXCLUDED.description, EXCLUDED.sort_order)
+            """, rows, page_size=1000)
+            records_inserted = len(rows)
+            
+            if commit:
+                conn.commit()
             self.logger.info(f"Populated COICOP hierarchy: {records_inserted} categories across all levels")
             return records_inserted
             
@@ -687,6 +973,72 @@ class UKInflationCollector(BaseCollector):
         finally:
             cursor.close()
     
+    def _build_price_data_records(self, df: pd.DataFrame, columns: Dict[str, Dict[str, Dict[str, int]]],
+                                  weights_by_series: Dict[str, Dict[str, Dict[int, float]]],
+                                  monthly_rows: List[int]) -> List[Tuple]:
+        """
+        Build one price record per month, series and category that has an index value.
+        
+        The monthly rows are sliced once per series and its index columns converted to a
+        float matrix in one bulk conversion. The non-NaN cells of every series are gathered
+        with NumPy, put in month order by one stable sort and zipped into tuples, so no
+        Python loop runs per record. Records come out month by month, then by series and
+        category, as tuples in PRICE_DATA_FIELDS order.
+        """
+        if not monthly_rows:
+            return []
+        
+        # Observation dates from the "2024 JAN" labels
+        parts = df.iloc[monthly_rows, 0].astype(str).str.strip().str.extract(_MONTHLY_ROW_RE)
+        years = parts[0].astype(int).tolist()
+        months = parts[1].str.upper().map(self._MONTH_NUMBERS).tolist()
+        obs_dates = np.empty(len(years), dtype=object)
+        obs_dates[:] = [date(year, month, 1) for year, month in zip(years, months)]
+        unique_years, year_pos = np.unique(years, return_inverse=True)
+        
+        series_rows, series_fields = [], []
+        for series_type in ['CPI', 'CPIH', 'RPI']:
+            indices = [(cat, col) for cat, col in columns[series_type]['indices'].items() if col is not None]
+            if not indices:
+                continue
+            
+            cells = df.iloc[monthly_rows, [col for _, col in indices]].to_numpy()
+            values = _to_float_matrix(cells)
+            
+            # Cells holding a value, row-major; only these become records
+            rows, cols = np.nonzero(~np.isnan(values))
+            
+            cats = np.empty(len(indices), dtype=object)
+            cats[:] = [cat for cat, _ in indices]
+            source_columns = np.array([int(df.columns[col]) + 1 for _, col in indices])  # 1-based in MM23.csv
+            
+            # Each column's weight per year. Weights may be missing for some years
+            # (e.g. pre-2015 data); those records store None
+            series_weights = weights_by_series.get(series_type, {})
+            weights = np.empty((len(unique_years), len(indices)), dtype=object)
+            weights[:] = [[series_weights.get(cat, {}).get(year) for cat, _ in indices]
+                          for year in unique_years.tolist()]
+            
+            series_rows.append(rows)
+            series_fields.append((
+                obs_dates[rows],
+                cats[cols],
+                np.full(len(rows), series_type, dtype=object),
+                values[rows, cols],
+                weights[year_pos[rows], cols],
+                source_columns[cols]
+            ))
+        
+        if not series_fields:
+            return []
+        
+        # Series were gathered one after another; a stable sort on the month row
+        # interleaves them back into month, series, category order
+        order = np.argsort(np.concatenate(series_rows), kind='stable')
+        return list(zip(*(
+            np.concatenate(field)[order].tolist() for field in zip(*series_fields)
+        )))
+    
     def collect_inflation_data(self) -> int:
         """
         Collect UK inflation data by downloading the latest MM23 CSV file from ONS website.
@@ -696,19 +1048,24 @@ class UKInflationCollector(BaseCollector):
         """
         self.logger.info("Starting UK inflation data collection...")
         
-        # Download latest MM23.csv from ONS
-        csv_file_path = self.download_mm23_csv()
+        # Header/year-row caches are per frame; start each run without the last one's
+        self._clear_frame_caches()
+        
+        # Open the database connection while MM23 downloads and parses, off the critical path
+        connect = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mm23-db-connect")
+        conn_future = connect.submit(self.get_db_connection)
+        connect.shutdown(wait=False)
         
         try:
-            # Read CSV file
-            self.logger.info(f"Reading downloaded CSV file: {csv_file_path}")
-            df = pd.read_csv(csv_file_path, header=None, low_memory=False)
+            # Stream latest MM23.csv from ONS, or reuse the cached frame if unchanged
+            df = self.load_mm23_frame()
+            
+            # Extract all COICOP codes once, for column lookup and the hierarchy
+            coicop_codes = self.extract_all_coicop_codes(df)
             
             # Find column positions
-            columns = self.find_series_columns(df)
+            columns = self.find_series_columns(df, coicop_codes)
             
-            # Extract all COICOP codes for validation
-            coicop_codes = self.extract_all_coicop_codes(df)
             descriptions = self.extract_coicop_descriptions_from_headers(df)
             hierarchy_records = self.build_coicop_hierarchy_records(coicop_codes, descriptions)
             
@@ -720,62 +1077,33 @@ class UKInflationCollector(BaseCollector):
             
             # weights_by_series is now calculated above in _calculate_missing_weights_from_children
             
-            # Get database connection
-            conn = self.get_db_connection()
+            # Process monthly data
+            price_data_records = self._build_price_data_records(df, columns, weights_by_series, monthly_rows)
+            records_collected = len(price_data_records)
             
-            # Populate COICOP hierarchy
-            hierarchy_records_count = self.populate_coicop_hierarchy(conn, csv_file_path)
+            # Everything needed from the wide MM23 frame has been extracted; release it (and
+            # the header caches that reference it) before the database writes
+            del df
+            self._clear_frame_caches()
             
-            # Process monthly data
-            records_collected = 0
-            month_map = {'JAN': 1, 'FEB': 2, 'MAR': 3, 'APR': 4, 'MAY': 5, 'JUN': 6,
-                         'JUL': 7, 'AUG': 8, 'SEP': 9, 'OCT': 10, 'NOV': 11, 'DEC': 12}
+            # Get the database connection opened at the start of the run
+            conn = conn_future.result()
             
-            price_data_records = []
+            if conn is not None:
+                # Hierarchy and price data are written in one transaction, committed once;
+                # deferrable constraints between them are checked at that commit
+                with conn.cursor() as cursor:
+                    cursor.execute("SET CONSTRAINTS ALL DEFERRED")
             
-            for row_idx in monthly_rows:
-                date_str = str(df.iloc[row_idx, 0]).strip()
-                try:
-                    year, month = date_str.split()
-                    year_int = int(year)
-                    month_int = month_map[month.upper()]
-                    obs_date = date(year_int, month_int, 1)
-                    
-                    # Process each series type
-                    for series_type in ['CPI', 'CPIH', 'RPI']:
-                        for cat, index_col in columns[series_type]['indices'].items():
-                            if index_col is not None:
-                                # Extract index value
-                                index_val = pd.to_numeric(df.iloc[row_idx, index_col], errors='coerce')
-                                
-                                if pd.notna(index_val):
-                                    # Get weight value - REQUIRED for CPI/CPIH categories
-                                    weight_val = None
-                                    if (series_type in weights_by_series and 
-                                        cat in weights_by_series[series_type] and
-                                        year_int in weights_by_series[series_type][cat]):
-                                        weight_val = weights_by_series[series_type][cat][year_int]
-                                    
-                                    # Note: weight_val may be None for some years (e.g., pre-2015 data)
-                                    # This is acceptable - we store records with available weights only
-                                    
-                                    price_data_records.append({
-                                        'date': obs_date,
-                                        'coicop_id': cat,
-                                        'series_type': series_type,
-                                        'index_value': float(index_val),
-                                        'weight_value': weight_val,
-                                        'source_column': index_col + 1  # 1-based column number
-                                    })
-                                    records_collected += 1
-                    
-                except Exception as e:
-                    self.logger.warning(f"Error processing row {row_idx} ({date_str}): {e}")
-                    continue
+            # Populate COICOP hierarchy from the records already built above
+            hierarchy_records_count = self.populate_coicop_hierarchy(
+                conn, hierarchy_records=hierarchy_records, commit=False
+            )
             
             # Bulk insert price data
             if conn is not None:
-                records_inserted = self.bulk_insert_price_data(conn, price_data_records)
+                records_inserted = self.bulk_insert_price_data(conn, price_data_records, commit=False)
+                conn.commit()
                 self.logger.info(f"Inserted {records_inserted} price data records")
             else:
                 self.logger.info(f"Safe mode: Would insert {len(price_data_records)} price data records")
@@ -783,17 +1111,23 @@ class UKInflationCollector(BaseCollector):
             self.logger.info(f"UK inflation data collection completed: {records_collected} records processed")
             
         finally:
-            # Cleanup downloaded file
+            # A run that failed before using the connection still has to return it
             try:
-                os.unlink(csv_file_path)
-                self.logger.debug(f"Cleaned up downloaded file: {csv_file_path}")
-            except Exception as e:
-                self.logger.warning(f"Failed to cleanup downloaded file {csv_file_path}: {e}")
+                conn = conn_future.result()
+            except Exception:
+                conn = None  # Connection failure already logged by get_db_connection
+            if conn:
+                conn.close()
+            self._clear_frame_caches()
         
         return records_collected
     
-    def bulk_insert_price_data(self, conn, price_data_records: List[Dict[str, Any]]) -> int:
-        """Bulk insert price data records into the database."""
+    def bulk_insert_price_data(self, conn, price_data_records: List[Tuple], commit: bool = True) -> int:
+        """
+        Bulk insert price data records (tuples in PRICE_DATA_FIELDS order) into the database.
+        
+        With commit=False the rows are left in the caller's open transaction.
+        """
         if not price_data_records:
             return 0
             
@@ -804,61 +1138,28 @@ class UKInflationCollector(BaseCollector):
         cursor = conn.cursor()
         
         try:
-            # Use COPY for efficient bulk insert
-            data_tuples = [
-                (
-                    record['date'],
-                    record['coicop_id'], 
-                    record['series_type'],
-                    record['index_value'],
-                    record['weight_value'],
-                    'ACTUAL',  # data_quality
-                    record['source_column']
-                )
-                for record in price_data_records
-            ]
-            
-            # Create CSV-like string for COPY
-            csv_data = io.StringIO()
-            for data_tuple in data_tuples:
-                csv_data.write('\t'.join([
-                    str(data_tuple[0]),  # date
-                    str(data_tuple[1]),  # coicop_id
-                    str(data_tuple[2]),  # series_type
-                    str(data_tuple[3]),  # index_value
-                    str(data_tuple[4]) if data_tuple[4] is not None else '\\N',  # weight_value
-                    str(data_tuple[5]),  # data_quality
-                    str(data_tuple[6])   # source_column
-                ]) + '\n')
-            csv_data.seek(0)
-            
-            # Use COPY for bulk insert with conflict resolution
-            cursor.execute("""
-                CREATE TEMP TABLE temp_price_data (LIKE uk_inflation_price_data INCLUDING ALL)
-            """)
-            
-            cursor.copy_from(
-                csv_data,
-                'temp_price_data',
-                columns=('date', 'coicop_id', 'series_type', 'index_value', 'weight_value', 'data_quality', 'source_column'),
-                null='\\N'
-            )
+            records_inserted = 0
+            for start in range(0, len(price_data_records), PRICE_DATA_BATCH_SIZE):
+                # One list per column, transposed from this batch's record tuples by zip,
+                # sent as typed arrays and expanded server-side with unnest. Transposing
+                # per batch keeps only one batch of column arrays alongside the records
+                batch = price_data_records[start:start + PRICE_DATA_BATCH_SIZE]
+                cursor.execute("""
+                    INSERT INTO uk_inflation_price_data 
+                    (date, coicop_id, series_type, index_value, weight_value, data_quality, source_column)
+                    SELECT date, coicop_id, series_type, index_value, weight_value, 'ACTUAL', source_column
+                    FROM unnest(%s::date[], %s::text[], %s::text[], %s::float8[], %s::float8[], %s::int[])
+                        AS t(date, coicop_id, series_type, index_value, weight_value, source_column)
+                    ON CONFLICT (date, coicop_id, series_type) DO UPDATE SET
+                        index_value = EXCLUDED.index_value,
+                        weight_value = EXCLUDED.weight_value,
+                        data_quality = EXCLUDED.data_quality,
+                        source_column = EXCLUDED.source_column
+                """, tuple(list(column) for column in zip(*batch)))
+                records_inserted += cursor.rowcount
             
-            # Insert with conflict resolution
-            cursor.execute("""
-                INSERT INTO uk_inflation_price_data 
-                (date, coicop_id, series_type, index_value, weight_value, data_quality, source_column)
-                SELECT date, coicop_id, series_type, index_value, weight_value, data_quality, source_column
-                FROM temp_price_data
-                ON CONFLICT (date, coicop_id, series_type) DO UPDATE SET
-                    index_value = EXCLUDED.index_value,
-                    weight_value = EXCLUDED.weight_value,
-                    data_quality = EXCLUDED.data_quality,
-                    source_column = EXCLUDED.source_column
-            """)
-            
-            records_inserted = cursor.rowcount
-            conn.commit()
+            if commit:
+                conn.commit()
             
             return records_inserted
             
@@ -19,6 +19,14 @@ except ImportError:
     search_assets = None
     historical_data = None
 
+# Swap maturity labels and their tenor in years
+SWAP_MATURITY_YEARS = {
+    '2Y': 2.0,
+    '5Y': 5.0,
+    '10Y': 10.0,
+    '30Y': 30.0
+}
+
 
 class UKSwapRatesCollector(BaseCollector):
     """
@@ -112,6 +120,7 @@ class UKSwapRatesCollector(BaseCollector):
             highs = historical['high'] 
             lows = historical['low']
             closes = historical['close']
+            maturity_years = self._maturity_to_years(maturity)  # Same for every row
             
             for i in range(len(dates)):
                 try:
@@ -121,7 +130,7 @@ class UKSwapRatesCollector(BaseCollector):
                     record = {
                         'date': obs_date,
                         'maturity': maturity,
-                        'maturity_years': self._maturity_to_years(maturity),
+                        'maturity_years': maturity_years,
                         'open_rate': float(opens[i]),
                         'high_rate': float(highs[i]),
                         'low_rate': float(lows[i]), 
@@ -144,13 +153,7 @@ class UKSwapRatesCollector(BaseCollector):
     
     def _maturity_to_years(self, maturity: str) -> float:
         """Convert maturity string to years."""
-        maturity_map = {
-            '2Y': 2.0,
-            '5Y': 5.0, 
-            '10Y': 10.0,
-            '30Y': 30.0
-        }
-        return maturity_map.get(maturity, 0.0)
+        return SWAP_MATURITY_YEARS.get(maturity, 0.0)
     
     def collect_all_swap_rates(self, start_date: Optional[datetime] = None) -> List[Dict[str, Any]]:
         """
@@ -199,14 +202,7 @@ def collect_uk_swap_rates(database_url=None):
         if database_url:
             try:
                 # Check for existing data to determine collection strategy
-                import psycopg2
-                conn = psycopg2.connect(database_url)
-                cursor = conn.cursor()
-                cursor.execute("SELECT MAX(date) FROM uk_swap_rates LIMIT 1")
-                result = cursor.fetchone()
-                latest_date = result[0] if result else None
-                cursor.close()
-                conn.close()
+                latest_date = collector.get_last_record_date("uk_swap_rates")
                 
                 if latest_date is not None:
                     # Incremental update - get data from day after latest date
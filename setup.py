@@ -8,6 +8,7 @@ setup(
     packages=find_packages(),
     install_requires=[
         "requests>=2.31.0",
+        "orjson>=3.0.0",
         "psycopg2-binary>=2.9.0",
         "beautifulsoup4>=4.12.0",
         "lxml>=4.9.0",
@@ -15,10 +16,15 @@ setup(
     ],
     extras_require={
         "selenium": [
-            "scipy>=1.11.0",
             "selenium>=4.15.0",
             "webdriver-manager>=4.0.0",
         ],
+        "numba": [
+            "numba>=0.58.0",
+        ],
+        "streaming": [
+            "ijson>=3.2.0",
+        ],
         "investiny": [
             "investiny @ git+https://github.com/cwilko/investiny.git@feature/curl-cffi-support",
         ],
@@ -160,6 +160,29 @@ class TestAJBellGiltCollection:
             assert "failed" in str(e).lower() or "error" in str(e).lower()
         
         print("Error handling validation passed")
+    
+    def test_ajbell_gilt_table_read_in_one_round_trip(self):
+        """Test the gilt table is fetched with a single execute_script call rather than per-row queries."""
+        from unittest import mock
+        
+        table = mock.MagicMock()
+        table.parent.execute_script.return_value = [
+            [["Name", "Price", "Coupon", "Maturity"], []],
+            [[], ["Treasury 4.25% 2032 | GB0004893086 | 0489308", "98.50", "4.25%", "07/06/2032"]],
+            [[], ["Short row", "99.00"]],
+        ]
+        
+        collector = AJBellGiltCollector(database_url=None)
+        gilt_data = collector._parse_gilt_table(table)
+        
+        table.parent.execute_script.assert_called_once()
+        table.find_elements.assert_not_called()
+        assert len(gilt_data) == 1
+        assert gilt_data[0]['bond_name'] == "Treasury 4.25% 2032"
+        assert gilt_data[0]['isin'] == "GB0004893086"
+        assert gilt_data[0]['clean_price'] == 98.50
+        
+        print("Gilt table parsed from a single WebDriver call")
 
 
 if __name__ == "__main__":
@@ -404,4 +404,181 @@ class TestDatabaseIntegration:
         
         fed_rate, treasury_rate = result
         assert float(fed_rate) == 4.33
-        assert float(treasury_rate) == 4.39
\ No newline at end of file
+        assert float(treasury_rate) == 4.39
+
+
+class TestCollectorDatabaseWrites:
+    """Tests for the BaseCollector database helpers, against mocked connections."""
+    
+    def test_upsert_skips_unchanged_rows(self, monkeypatch):
+        """Test the bulk upsert only rewrites conflicting rows whose values changed."""
+        from unittest import mock
+        from datetime import date
+        import data_collectors.base as base
+        from data_collectors.base import BaseCollector
+        
+        monkeypatch.setattr(base, "_COLUMN_TYPES", {})
+        rows = [{"date": date(2024, 1, 2), "sp500_pe": 28.4, "sp500_shiller_pe": 36.9}]
+        cursor = mock.MagicMock()
+        cursor.fetchall.return_value = [("date", "date"), ("sp500_pe", "numeric(8,2)"), ("sp500_shiller_pe", "numeric(8,2)")]
+        conn = mock.MagicMock()
+        conn.cursor.return_value.__enter__.return_value = cursor
+        collector = BaseCollector(database_url="postgresql://unused")
+        
+        with mock.patch.object(BaseCollector, 'get_db_connection', return_value=conn):
+            assert collector.bulk_upsert_data("pe_ratios", rows) == 1
+        
+        sql = " ".join(cursor.execute.call_args.args[0].split())
+        assert sql.endswith(
+            "WHERE (pe_ratios.sp500_pe, pe_ratios.sp500_shiller_pe) IS DISTINCT FROM "
+            "(EXCLUDED.sp500_pe, EXCLUDED.sp500_shiller_pe)"
+        )
+    
+    def test_bulk_upsert_sends_typed_column_arrays(self, monkeypatch):
+        """Test bulk upserts send one typed array per column through unnest, one statement per batch."""
+        from unittest import mock
+        from datetime import date
+        import data_collectors.base as base
+        from data_collectors.base import BaseCollector
+        
+        monkeypatch.setattr(base, "_COLUMN_TYPES", {})
+        rows = [
+            {"date": date(2024, 1, day), "series_id": "DGS10", "maturity": "10Y", "yield_rate": rate}
+            for day, rate in ((2, 4.1), (3, None), (4, 4.2))
+        ]
+        cursor = mock.MagicMock()
+        cursor.fetchall.return_value = [
+            ("id", "integer"), ("date", "date"), ("series_id", "character varying(20)"),
+            ("maturity", "character varying(10)"), ("yield_rate", "numeric(6,3)"),
+        ]
+        conn = mock.MagicMock()
+        conn.cursor.return_value.__enter__.return_value = cursor
+        collector = BaseCollector(database_url="postgresql://unused")
+        
+        with mock.patch.object(BaseCollector, 'get_db_connection', return_value=conn):
+            result = collector.bulk_upsert_data(
+                "fred_treasury_yields", rows, conflict_columns=["date", "series_id"], batch_size=2
+            )
+        
+        assert result == 3
+        type_query, *inserts = cursor.execute.call_args_list
+        assert type_query.args[1] == ("fred_treasury_yields",)
+        assert len(inserts) == 2
+        
+        sql, params = inserts[0].args
+        assert ("unnest(%s::date[], %s::character varying(20)[], "
+                "%s::character varying(10)[], %s::numeric(6,3)[])") in sql
+        assert params == [[date(2024, 1, 2), date(2024, 1, 3)], ["DGS10", "DGS10"], ["10Y", "10Y"], [4.1, None]]
+        assert inserts[1].args[1][3] == [4.2]
+        conn.commit.assert_called_once()
+    
+    def test_bulk_upsert_caches_column_types(self, monkeypatch):
+        """Test column types are read from the catalog once per table, and again only for an unseen column."""
+        from unittest import mock
+        from datetime import date
+        import data_collectors.base as base
+        from data_collectors.base import BaseCollector
+        
+        monkeypatch.setattr(base, "_COLUMN_TYPES", {})
+        cursor = mock.MagicMock()
+        cursor.fetchall.return_value = [("date", "date"), ("sp500_pe", "numeric(8,2)"), ("sp500_shiller_pe", "numeric(8,2)")]
+        conn = mock.MagicMock()
+        conn.cursor.return_value.__enter__.return_value = cursor
+        collector = BaseCollector(database_url="postgresql://unused")
+        
+        def type_queries():
+            return sum("pg_attribute" in call.args[0] for call in cursor.execute.call_args_list)
+        
+        with mock.patch.object(BaseCollector, 'get_db_connection', return_value=conn):
+            collector.bulk_upsert_data("pe_ratios", [{"date": date(2024, 1, 2), "sp500_pe": 28.4}])
+            collector.bulk_upsert_data("pe_ratios", [{"date": date(2024, 1, 3), "sp500_pe": 28.1}])
+            assert type_queries() == 1
+            
+            collector.bulk_upsert_data("pe_ratios", [{"date": date(2024, 1, 3), "sp500_shiller_pe": 36.9}])
+            assert type_queries() == 1
+            
+            cursor.fetchall.return_value.append(("forward_pe", "numeric(8,2)"))
+            collector.bulk_upsert_data("pe_ratios", [{"date": date(2024, 1, 4), "forward_pe": 21.5}])
+            assert type_queries() == 2
+    
+    def test_db_connections_come_from_shared_pool(self, monkeypatch):
+        """Test collectors borrow connections from one pool per database and hand them back on close."""
+        from unittest import mock
+        import data_collectors.base as base
+        from data_collectors.market_data import PERatioCollector
+        
+        monkeypatch.setattr(base, "_DB_POOLS", {})
+        with mock.patch.object(base, "ThreadedConnectionPool") as pool_class:
+            pool = pool_class.return_value
+            first = base.BaseCollector("postgresql://db").get_db_connection()
+            second = PERatioCollector("postgresql://db").get_db_connection()
+            
+            first.cursor()
+            first.close()
+            first.close()  # A second close must not return the connection twice
+        
+        pool_class.assert_called_once_with(base.DB_POOL_MIN_CONN, base.DB_POOL_MAX_CONN, "postgresql://db")
+        assert pool.getconn.call_count == 2
+        pool.getconn.return_value.cursor.assert_called_once()
+        pool.putconn.assert_called_once_with(pool.getconn.return_value)
+        second.close()
+        assert pool.putconn.call_count == 2
+    
+    def test_db_connection_waits_for_a_free_pool_slot(self, monkeypatch):
+        """Test a borrower beyond the pool size blocks until a connection is returned instead of failing."""
+        import threading
+        from unittest import mock
+        import data_collectors.base as base
+        
+        monkeypatch.setattr(base, "_DB_POOLS", {})
+        monkeypatch.setattr(base, "DB_POOL_MAX_CONN", 1)
+        with mock.patch.object(base, "ThreadedConnectionPool") as pool_class:
+            collector = base.BaseCollector("postgresql://db")
+            first = collector.get_db_connection()
+            
+            borrowed = threading.Event()
+            waiter = threading.Thread(target=lambda: (collector.get_db_connection(), borrowed.set()))
+            waiter.start()
+            assert not borrowed.wait(timeout=0.2)
+            
+            first.close()
+            assert borrowed.wait(timeout=5)
+            waiter.join()
+        
+        assert pool_class.return_value.getconn.call_count == 2
+    
+    def test_db_connection_wait_times_out(self, monkeypatch):
+        """Test a borrower gets PoolError if no connection is returned within the wait timeout."""
+        from unittest import mock
+        from psycopg2.pool import PoolError
+        import data_collectors.base as base
+        
+        monkeypatch.setattr(base, "_DB_POOLS", {})
+        monkeypatch.setattr(base, "DB_POOL_MAX_CONN", 1)
+        monkeypatch.setattr(base, "DB_POOL_WAIT_TIMEOUT", 0.05)
+        with mock.patch.object(base, "ThreadedConnectionPool"):
+            collector = base.BaseCollector("postgresql://db")
+            collector.get_db_connection()
+            with pytest.raises(PoolError):
+                collector.get_db_connection()
+    
+    def test_bulk_copy_writes_missing_values_as_null_fields(self):
+        """Test COPY rows follow the first record's column order, with None as an empty (NULL) field."""
+        from unittest import mock
+        from datetime import date
+        from data_collectors.base import BaseCollector
+        
+        cursor = mock.MagicMock()
+        conn = mock.MagicMock()
+        conn.cursor.return_value.__enter__.return_value = cursor
+        collector = BaseCollector(database_url="postgresql://unused")
+        
+        with mock.patch.object(BaseCollector, 'get_db_connection', return_value=conn):
+            assert collector.bulk_copy_data("gilt_yields", [
+                {"date": date(2024, 1, 2), "yield_10y": 4.1, "note": None},
+                {"date": date(2024, 1, 3), "yield_10y": None, "note": "a,b"},
+            ]) == 2
+        
+        sql, buffer = cursor.copy_expert.call_args.args
+        assert sql == "COPY gilt_yields (date, yield_10y, note) FROM STDIN WITH (FORMAT CSV)"
+        assert buffer.read().splitlines() == ["2024-01-02,4.1,", '2024-01-03,,"a,b"']
\ No newline at end of file
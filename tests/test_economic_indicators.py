@@ -95,6 +95,108 @@ class TestFREDCollector:
                     # Test that value can be converted to float
                     value = float(item["value"])
                     assert isinstance(value, float)
+    
+    def test_get_series_data_pages_past_api_limit(self, monkeypatch):
+        """Test FRED series longer than one response are fetched page by page."""
+        from unittest import mock
+        import data_collectors.economic_indicators as economic_indicators
+        
+        monkeypatch.setenv("FRED_API_KEY", "test-key")
+        monkeypatch.setattr(economic_indicators, "FRED_MAX_LIMIT", 2)
+        pages = [
+            {"count": 5, "observations": [{"date": "2024-01-01", "value": "1"}, {"date": "2024-01-02", "value": "2"}]},
+            {"count": 5, "observations": [{"date": "2024-01-03", "value": "3"}, {"date": "2024-01-04", "value": "4"}]},
+            {"count": 5, "observations": [{"date": "2024-01-05", "value": "5"}]},
+        ]
+        
+        collector = FREDCollector(database_url=None)
+        offsets = []
+        def fake_request(url, params):
+            offsets.append(params.get("offset", 0))
+            return pages[len(offsets) - 1]
+        
+        with mock.patch.object(collector, 'make_request', side_effect=fake_request):
+            data = collector.get_series_data("DGS10")
+        
+        assert [item["value"] for item in data] == ["1", "2", "3", "4", "5"]
+        assert offsets == [0, 2, 4]
+        
+        # An explicit small limit is a cap, not a page size
+        with mock.patch.object(collector, 'make_request', return_value=pages[0]) as request:
+            collector.get_series_data("DGS10", limit=1)
+        request.assert_called_once()
+    
+    def test_iter_series_data_streams_observations(self, monkeypatch):
+        """Test FRED observations are streamed incrementally, with a one-shot fallback."""
+        import io
+        from unittest import mock
+        import data_collectors.economic_indicators as economic_indicators
+        
+        monkeypatch.setenv("FRED_API_KEY", "test-key")
+        body = b'{"count": 2, "observations": [{"date": "2024-01-02", "value": "4.1"}, {"date": "2024-01-03", "value": "."}]}'
+        
+        collector = FREDCollector(database_url=None)
+        collector.session = mock.MagicMock()
+        response = collector.session.get.return_value.__enter__.return_value
+        response.raw = io.BufferedReader(io.BytesIO(body))
+        
+        with mock.patch.object(collector, 'get_series_data') as fallback:
+            stream = collector.iter_series_data("DGS10", observation_start="2024-01-01")
+            assert next(stream) == {"date": "2024-01-02", "value": "4.1"}
+            assert [item["value"] for item in stream] == ["."]
+        fallback.assert_not_called()
+        assert collector.session.get.call_args.kwargs["stream"] is True
+        assert collector.session.get.call_args.kwargs["params"]["observation_start"] == "2024-01-01"
+        
+        # A stream that fails before yielding anything is retried as a single request
+        collector.session.get.side_effect = Exception("connection reset")
+        with mock.patch.object(collector, 'get_series_data', return_value=[{"date": "2024-01-02", "value": "4.1"}]):
+            assert len(list(collector.iter_series_data("DGS10"))) == 1
+        
+        # A stream that fails after yielding observations raises rather than ending short
+        collector.session.get.side_effect = None
+        response.raw = io.BufferedReader(io.BytesIO(body[:70]))
+        with mock.patch.object(collector, 'get_series_data') as fallback:
+            stream = collector.iter_series_data("DGS10")
+            assert next(stream) == {"date": "2024-01-02", "value": "4.1"}
+            with pytest.raises(Exception):
+                list(stream)
+        fallback.assert_not_called()
+        
+        # Without ijson the whole response is fetched at once
+        monkeypatch.setattr(economic_indicators, "ijson", None)
+        with mock.patch.object(collector, 'get_series_data', return_value=[]) as fallback:
+            assert list(collector.iter_series_data("DGS10")) == []
+        fallback.assert_called_once_with("DGS10", observation_start=None, observation_end=None)
+    
+    def test_backfill_fetched_in_parallel_windows(self, monkeypatch):
+        """Test a long backfill is split into disjoint windows and recombined in date order."""
+        from unittest import mock
+        from datetime import date
+        
+        monkeypatch.setenv("FRED_API_KEY", "test-key")
+        collector = FREDCollector(database_url=None)
+        
+        def fake_request(url, params):
+            return {"observations": [
+                {"date": params["observation_start"], "value": "1"},
+                {"date": params["observation_end"], "value": "2"},
+            ]}
+        
+        with mock.patch.object(collector, 'make_request', side_effect=fake_request) as request:
+            observations = collector.get_series_data_windowed(
+                "SP500", date(2021, 1, 1), date(2023, 6, 30), window_days=365
+            )
+        
+        assert request.call_count == 3
+        assert [obs["date"] for obs in observations] == [
+            "2021-01-01", "2021-12-31", "2022-01-01", "2022-12-31", "2023-01-01", "2023-06-30"
+        ]
+        
+        # A window that keeps failing fails the backfill rather than leaving a gap
+        with mock.patch.object(collector, 'make_request', side_effect=ValueError("bad gateway")):
+            with pytest.raises(ValueError):
+                collector.get_series_data_windowed("SP500", date(2021, 1, 1), date(2023, 6, 30))
 
 
 class TestBLSCollector:
@@ -332,6 +434,34 @@ class TestFREDTreasuryYields:
         result = collect_fred_treasury_yields(database_url=None)
         assert isinstance(result, int)
         assert result >= 0  # Should process at least some records
+    
+    def test_fred_treasury_yields_single_bulk_upsert(self, monkeypatch):
+        """Test all Treasury series are written with one bulk upsert instead of one per series."""
+        from unittest import mock
+        from datetime import date
+        
+        monkeypatch.setenv("FRED_API_KEY", "test-key")
+        observations = [
+            {"date": "2024-01-02", "value": "4.10"},
+            {"date": "2024-01-03", "value": "."},
+        ]
+        
+        with mock.patch.object(FREDCollector, 'get_date_range_for_collection',
+                               return_value=(date(2024, 1, 1), date(2024, 1, 3))), \
+             mock.patch.object(FREDCollector, 'get_series_data', return_value=observations) as fetch, \
+             mock.patch.object(FREDCollector, 'bulk_upsert_data', side_effect=lambda table, rows, **kw: len(rows)) as upsert:
+            result = collect_fred_treasury_yields(database_url="postgresql://unused")
+        
+        assert fetch.call_count == len(FRED_TREASURY_SERIES)
+        assert all(call.kwargs["observation_start"] == "2024-01-01" for call in fetch.call_args_list)
+        upsert.assert_called_once()
+        table, rows = upsert.call_args.args
+        assert table == "fred_treasury_yields"
+        assert upsert.call_args.kwargs["conflict_columns"] == ["date", "series_id"]
+        assert result == len(rows) == len(FRED_TREASURY_SERIES)
+        assert {row["series_id"] for row in rows} == set(FRED_TREASURY_SERIES)
+        
+        print(f"✅ {result} Treasury yield records upserted in one batch")
 
 
 class TestGermanBundCollector:
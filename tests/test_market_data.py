@@ -96,6 +96,273 @@ class TestMarketDataFunctions:
         except Exception:
             # P/E ratios use web scraping which might be unreliable
             pytest.skip("P/E ratio collection failed (web scraping may be blocked)")
+    
+    def test_collectors_share_http_session(self):
+        """Test every collector reuses the module-level pooled HTTP session."""
+        from data_collectors._http import SESSION, POOL_SIZE
+        from data_collectors.market_data import PERatioCollector
+        from data_collectors.uk_market_data import MarketWatchFTSECollector
+        
+        first = PERatioCollector(database_url=None)
+        second = MarketWatchFTSECollector(database_url=None)
+        assert first.session is SESSION
+        assert second.session is SESSION
+        
+        adapter = SESSION.get_adapter("https://api.stlouisfed.org")
+        assert adapter._pool_maxsize == POOL_SIZE
+        assert adapter.max_retries.total == 3
+        assert 503 in adapter.max_retries.status_forcelist
+    
+    def test_pe_ratio_pages_scraped_concurrently(self):
+        """Test both multpl.com pages are scraped and combined into one P/E record."""
+        from unittest import mock
+        from data_collectors.market_data import PERatioCollector
+        
+        ratios = {
+            "https://www.multpl.com/s-p-500-pe-ratio": 28.4,
+            "https://www.multpl.com/shiller-pe": 36.9,
+        }
+        
+        with mock.patch.object(PERatioCollector, 'get_last_record_date', return_value=None), \
+             mock.patch.object(PERatioCollector, 'scrape_multpl_data', side_effect=lambda url: ratios[url]) as scrape, \
+             mock.patch.object(PERatioCollector, 'bulk_upsert_data', return_value=1) as upsert:
+            result = collect_pe_ratios(database_url=None)
+        
+        assert result == 1
+        assert sorted(call.args[0] for call in scrape.call_args_list) == sorted(ratios)
+        record = upsert.call_args.args[1][0]
+        assert record["sp500_pe"] == 28.4
+        assert record["sp500_shiller_pe"] == 36.9
+    
+    def test_multpl_current_value_parsing(self):
+        """Test the regex scrape of multpl.com matches a full BeautifulSoup parse."""
+        from unittest import mock
+        from bs4 import BeautifulSoup
+        from data_collectors.market_data import PERatioCollector, _NUMBER_RE
+        
+        pages = [
+            '<html><body><div class="nav">2024</div>'
+            '<div id="current">\n<b>Current Shiller PE Ratio:</b>\n36.92\n'
+            '<span class="neg">-0.11 (-0.30%)</span>\n<div id="timestamp">4:00 PM EDT</div>\n</div></body></html>',
+            "<div class='stat' id='current'>\n  28.41 <span>+0.05</span></div>",
+            '<div id="other">12.5</div>',
+        ]
+        
+        collector = PERatioCollector(database_url=None)
+        collector.session = mock.MagicMock()
+        for page in pages:
+            collector.session.get.return_value = mock.MagicMock(text=page)
+            
+            # Reference: the previous BeautifulSoup-based extraction
+            element = BeautifulSoup(page, 'html.parser').find('div', {'id': 'current'})
+            match = _NUMBER_RE.search(element.text.strip()) if element else None
+            expected = float(match.group(1)) if match else None
+            
+            assert collector.scrape_multpl_data("https://www.multpl.com/shiller-pe") == expected
+        
+        assert expected is None
+    
+    def test_multpl_unchanged_page_served_from_cache(self, monkeypatch, tmp_path):
+        """Test a 304 from multpl.com reuses the cached value instead of re-parsing the page."""
+        import os
+        from unittest import mock
+        from data_collectors.market_data import PERatioCollector
+        
+        monkeypatch.setenv("MULTPL_CACHE_DIR", str(tmp_path / "multpl"))
+        url = "https://www.multpl.com/shiller-pe"
+        collector = PERatioCollector(database_url=None)
+        collector.session = mock.MagicMock()
+        
+        collector.session.get.return_value = mock.MagicMock(
+            status_code=200,
+            text='<div id="current">36.92</div>',
+            headers={"ETag": '"abc"', "Last-Modified": "Tue, 02 Jan 2024 21:00:00 GMT"}
+        )
+        assert collector.scrape_multpl_data(url) == 36.92
+        assert collector.session.get.call_args.kwargs["headers"] == {}
+        
+        collector.session.get.return_value = mock.MagicMock(status_code=304, text='', headers={})
+        assert collector.scrape_multpl_data(url) == 36.92
+        assert collector.session.get.call_args.kwargs["headers"] == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Tue, 02 Jan 2024 21:00:00 GMT",
+        }
+        assert os.stat(tmp_path / "multpl").st_mode & 0o777 == 0o700
+    
+    def test_shared_multpl_cache_directory_not_used(self, monkeypatch, tmp_path):
+        """Test a multpl.com cache directory other users can write to is neither read nor written."""
+        import hashlib
+        from unittest import mock
+        from data_collectors.market_data import PERatioCollector
+        
+        url = "https://www.multpl.com/shiller-pe"
+        cache_dir = tmp_path / "multpl"
+        cache_dir.mkdir()
+        cache_dir.chmod(0o777)
+        planted = cache_dir / (hashlib.sha1(url.encode()).hexdigest() + ".json")
+        planted.write_bytes(b'{"etag": "planted", "last_modified": null, "value": 99.0}')
+        monkeypatch.setenv("MULTPL_CACHE_DIR", str(cache_dir))
+        
+        collector = PERatioCollector(database_url=None)
+        collector.session = mock.MagicMock()
+        collector.session.get.return_value = mock.MagicMock(
+            status_code=200, text='<div id="current">36.92</div>', headers={"ETag": '"abc"'}
+        )
+        
+        assert collector.scrape_multpl_data(url) == 36.92
+        assert collector.session.get.call_args.kwargs["headers"] == {}
+        assert planted.read_bytes() == b'{"etag": "planted", "last_modified": null, "value": 99.0}'
+    
+    def test_fred_observation_parsing(self):
+        """Test FRED observations are parsed to (date, value) with missing and bad items skipped."""
+        from unittest import mock
+        from datetime import date
+        from data_collectors.market_data import _iter_fred_values
+        
+        observations = [
+            {"date": "2024-01-02", "value": "4750.5"},
+            {"date": "2024-01-03", "value": "."},
+            {"date": "2024-01-04", "value": ""},
+            {"date": "2024-01-05", "value": "n/a"},
+            {"date": "2024-01-08", "value": "4763.54"},
+        ]
+        logger = mock.MagicMock()
+        
+        values = list(_iter_fred_values(observations, logger, "SP500"))
+        
+        assert values == [(date(2024, 1, 2), 4750.5), (date(2024, 1, 8), 4763.54)]
+        logger.error.assert_called_once()
+    
+    def test_make_request_parses_json_bytes(self):
+        """Test make_request decodes the raw response body and retries malformed JSON."""
+        from unittest import mock
+        from data_collectors.market_data import PERatioCollector
+        
+        collector = PERatioCollector(database_url=None)
+        collector.session = mock.MagicMock()
+        collector.session.get.return_value = mock.MagicMock(content=b'{"observations": [{"value": "4.1"}]}')
+        assert collector.make_request("https://api.stlouisfed.org/fred/series/observations") == {
+            "observations": [{"value": "4.1"}]
+        }
+        
+        collector.session.get.return_value = mock.MagicMock(content=b'<html>rate limited</html>')
+        with mock.patch('data_collectors.base.time.sleep'), pytest.raises(ValueError):
+            collector.make_request("https://api.stlouisfed.org/fred/series/observations", retries=2)
+        assert collector.session.get.call_count == 3
+    
+    def test_make_request_does_not_repeat_transport_retries(self):
+        """Test a status the session adapter already retried to exhaustion is not retried again."""
+        import requests
+        from unittest import mock
+        from data_collectors.market_data import PERatioCollector
+        
+        collector = PERatioCollector(database_url=None)
+        collector.session = mock.MagicMock()
+        collector.session.get.side_effect = requests.exceptions.RetryError("too many 503 error responses")
+        
+        with mock.patch('data_collectors.base.time.sleep') as sleep, \
+                pytest.raises(requests.exceptions.RetryError):
+            collector.make_request("https://api.stlouisfed.org/fred/series/observations")
+        assert collector.session.get.call_count == 1
+        sleep.assert_not_called()
+    
+    def test_last_dates_fetched_in_one_query(self, monkeypatch):
+        """Test the market data orchestrator reads every table watermark with a single query."""
+        from unittest import mock
+        from datetime import timedelta
+        import data_collectors.market_data as market_data
+        from data_collectors.base import BaseCollector
+        
+        monkeypatch.setenv("FRED_API_KEY", "test-key")
+        today = datetime.now().date()
+        watermarks = [
+            ("sp500_index", today),
+            ("vix_index", today),
+            ("fred_treasury_yields", today - timedelta(days=3)),
+            ("pe_ratios", None),
+        ]
+        
+        cursor = mock.MagicMock()
+        cursor.fetchall.return_value = watermarks
+        conn = mock.MagicMock()
+        conn.cursor.return_value.__enter__.return_value = cursor
+        
+        with mock.patch.object(BaseCollector, 'get_db_connection', return_value=conn), \
+             mock.patch.object(BaseCollector, 'get_last_record_date') as last_record_date, \
+             mock.patch.object(market_data.FREDCollector, 'get_series_data', return_value=[]) as fetch, \
+             mock.patch.object(market_data.PERatioCollector, 'scrape_multpl_data', return_value=None):
+            result = market_data.collect_all_market_data(database_url="postgresql://unused")
+        
+        assert result == 0
+        cursor.execute.assert_called_once()
+        sql, params = cursor.execute.call_args.args
+        assert sql.count("UNION ALL") == 3
+        assert params == tuple(table for table, _ in watermarks)
+        last_record_date.assert_not_called()
+        
+        # Only the stale Treasury table is fetched, from the day after its watermark
+        assert fetch.call_count == len(market_data.FRED_TREASURY_SERIES)
+        assert fetch.call_args.kwargs["observation_start"] == (today - timedelta(days=2)).strftime("%Y-%m-%d")
+    
+    def test_market_data_collectors_run_concurrently(self):
+        """Test the async orchestrator overlaps the collectors and sums their counts."""
+        import asyncio
+        import threading
+        from unittest import mock
+        import data_collectors.market_data as market_data
+        
+        barrier = threading.Barrier(len(market_data.MARKET_DATA_COLLECTORS), timeout=5)
+        
+        def make_collector(count):
+            def collect(database_url=None, last_dates=None):
+                barrier.wait()  # Only passes if every collector is running at once
+                return count
+            return collect
+        
+        collectors = tuple(
+            (table, make_collector(index + 1))
+            for index, (table, _) in enumerate(market_data.MARKET_DATA_COLLECTORS)
+        )
+        with mock.patch.object(market_data, 'MARKET_DATA_COLLECTORS', collectors):
+            result = asyncio.run(market_data.collect_all_market_data_async(database_url=None, last_dates={}))
+        
+        assert result == 1 + 2 + 3 + 4
+    
+    def test_cold_start_backfill_uses_copy(self, monkeypatch):
+        """Test an empty table is loaded with COPY while incremental runs still upsert."""
+        from unittest import mock
+        from datetime import timedelta
+        from data_collectors.base import BaseCollector
+        
+        monkeypatch.setenv("FRED_API_KEY", "test-key")
+        observations = [
+            {"date": "2024-01-02", "value": "13.2"},
+            {"date": "2024-01-03", "value": "."},
+            {"date": "2024-01-04", "value": "14.1"},
+        ]
+        cursor = mock.MagicMock()
+        conn = mock.MagicMock()
+        conn.cursor.return_value.__enter__.return_value = cursor
+        
+        with mock.patch.object(BaseCollector, 'get_db_connection', return_value=conn), \
+             mock.patch.object(FREDCollector, 'get_series_observation_start', return_value=None), \
+             mock.patch.object(FREDCollector, 'iter_series_data', return_value=observations), \
+             mock.patch.object(BaseCollector, 'bulk_upsert_data', return_value=2) as upsert:
+            assert collect_vix(database_url="postgresql://unused", last_dates={"vix_index": None}) == 2
+            upsert.assert_not_called()
+            
+            sql, buffer = cursor.copy_expert.call_args.args
+            assert sql == "COPY vix_index (date, close_price, open_price, high_price, low_price) FROM STDIN WITH (FORMAT CSV)"
+            assert buffer.read().splitlines() == [
+                "2024-01-02,13.2,13.2,13.2,13.2",
+                "2024-01-04,14.1,14.1,14.1,14.1",
+            ]
+            conn.commit.assert_called_once()
+            
+            last_date = datetime.now().date() - timedelta(days=5)
+            assert collect_vix(database_url="postgresql://unused", last_dates={"vix_index": last_date}) == 2
+            upsert.assert_called_once()
+            cursor.copy_expert.assert_called_once()
 
 
 @pytest.mark.integration
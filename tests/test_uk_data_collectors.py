@@ -8,7 +8,8 @@ from data_collectors.economic_indicators import ONSCollector, BankOfEnglandColle
 from data_collectors.gilt_market_data import (
     GiltMarketCollector, collect_gilt_market_prices,
     IndexLinkedGiltCollector, collect_index_linked_gilt_prices,
-    CorporateBondCollector, collect_corporate_bond_prices
+    CorporateBondCollector, collect_corporate_bond_prices,
+    _parse_hl_date
 )
 from data_collectors.uk_market_data import MarketWatchFTSECollector
 
@@ -323,6 +324,28 @@ class TestBoEYieldCurveCollector:
             except Exception as e:
                 print(f"⚠️ Data validation test skipped due to download/parse error: {str(e)}")
     
+    def test_boe_zip_copied_to_disk_in_large_blocks(self, tmp_path):
+        """Test the yield curve ZIP is copied straight from the raw stream and its workbooks extracted."""
+        from data_collectors.economic_indicators import BoEYieldCurveCollector
+        from unittest import mock
+        import io
+        import os
+        import zipfile
+        
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, 'w') as zip_file:
+            zip_file.writestr("GLC Nominal daily data.xlsx", b"workbook")
+            zip_file.writestr("readme.txt", b"notes")
+        
+        collector = BoEYieldCurveCollector(database_url=None)
+        response = mock.MagicMock()
+        response.raw = io.BytesIO(archive.getvalue())
+        with mock.patch('requests.get', return_value=response):
+            extracted = collector.download_and_extract_zip("glcnominalddata.zip", str(tmp_path))
+        
+        response.iter_content.assert_not_called()
+        assert [os.path.basename(path) for path in extracted] == ["GLC Nominal daily data.xlsx"]
+        assert not (tmp_path / "glcnominalddata.zip").exists()
     
     def test_boe_collector_cleanup(self):
         """Test that BoE collector properly cleans up temporary files."""
@@ -398,6 +421,66 @@ class TestGiltMarketCollector:
         
         logger.info(f"🎉 Test completed successfully! Total gilt records processed: {result}")
 
+    def test_gilt_table_parsing_from_page_source(self):
+        """Test nominal gilt rows are parsed from a single page_source snapshot."""
+        from unittest import mock
+        import data_collectors.gilt_market_data as gilt_market_data
+        
+        page_source = """<html><body><table>
+        <tr><th>Issuer</th><th>Coupon (%)</th><th>Maturity</th><th>Price</th><th>Actions</th></tr>
+        <tr><td><a href="/shares/shares-search-results/GB00BMF9">Treasury 4.25% 2034</a><br>GBP GB00BMF9LJ15</td>
+            <td>4.25</td><td>31 July 2034</td><td> 99.10 </td><td><a title="Deal">Deal</a></td></tr>
+        <tr><td><a href="/shares/shares-search-results/GB00B000">Treasury 2% 2035</a></td>
+            <td>2</td><td>7 September 2035</td><td>80.5</td><td><button title="Online dealing is not available">x</button></td></tr>
+        </table></body></html>"""
+        driver = mock.MagicMock(page_source=page_source)
+        
+        collector = GiltMarketCollector(database_url=None)
+        with mock.patch.object(gilt_market_data.webdriver, 'Chrome', return_value=driver), \
+             mock.patch.object(collector, '_get_chrome_service', return_value=None):
+            try:
+                bonds = collector.scrape_gilt_prices()
+            finally:
+                gilt_market_data.close_hl_driver_pools()
+        
+        assert len(bonds) == 1, "Non-tradeable gilt should be filtered out"
+        bond = bonds[0]
+        assert bond['bond_name'] == "Treasury 4.25% 2034"
+        assert bond['clean_price'] == 99.10
+        assert bond['coupon_rate'] == 0.0425
+        assert bond['maturity_date'] == datetime(2034, 7, 31)
+        assert bond['isin'] == "GB00BMF9LJ15"
+        assert bond['short_code'] == "GB00BMF9"
+        assert bond['ytm'] is not None and bond['after_tax_ytm'] is not None
+        assert bond['after_tax_ytm'] < bond['ytm']
+        driver.find_elements.assert_not_called()
+
+        print("✅ Gilt table parsed from page source")
+    
+    def test_price_gilts_vectorized_validation(self):
+        """Test batched gilt pricing filters invalid rows and accrues interest per bond."""
+        collector = GiltMarketCollector(database_url=None)
+        settlement_date = datetime(2025, 10, 16, 14, 30)
+        identifiers = {'currency_code': 'GBP', 'isin': None, 'short_code': None, 'combined_id': None}
+        parsed_rows = [
+            ("Treasury 4% 2030", identifiers, 0.04, datetime(2030, 1, 22), 98.5),
+            ("Treasury 1% 2024", identifiers, 0.01, datetime(2024, 1, 22), 99.0),    # Already matured
+            ("Treasury 5% 2031", identifiers, 0.05, datetime(2031, 6, 7), 250.0),    # Price out of range
+        ]
+        
+        bonds = collector._price_gilts(parsed_rows, settlement_date)
+        
+        assert [bond['bond_name'] for bond in bonds] == ["Treasury 4% 2030"]
+        bond = bonds[0]
+        last_coupon = collector.estimate_coupon_dates(bond['bond_name'], bond['maturity_date'], settlement_date)
+        expected_accrued = collector.calculate_accrued_interest(100.0, 0.04, last_coupon, settlement_date)
+        assert abs(bond['accrued_interest'] - expected_accrued) < 1e-12
+        assert bond['dirty_price'] == bond['clean_price'] + bond['accrued_interest']
+        assert bond['years_to_maturity'] == (datetime(2030, 1, 22) - settlement_date).days / 365.25
+        assert bond['ytm'] is not None and bond['after_tax_ytm'] is not None
+        
+        print("✅ Batched gilt pricing validated")
+
 
 class TestUKSwapRatesCollector:
     """Tests for UK GBP Interest Rate Swap data collection via investiny."""
@@ -418,6 +501,25 @@ class TestUKSwapRatesCollector:
         assert result >= 1000, f"Should have substantial historical data, got {result}"
         
         print(f"✅ UK swap rates: {result} total records processed (safe mode - matches DAG logic)")
+    
+    def test_swap_records_carry_maturity_years(self):
+        """Test swap rows get their tenor from the module-level maturity table."""
+        from unittest import mock
+        import data_collectors.uk_swap_rates as uk_swap_rates
+        
+        historical = {
+            'date': ['01/02/2024', '01/03/2024'],
+            'open': [4.1, 4.2], 'high': [4.3, 4.4], 'low': [4.0, 4.1], 'close': [4.2, 4.3]
+        }
+        collector = uk_swap_rates.UKSwapRatesCollector(database_url=None)
+        with mock.patch.object(uk_swap_rates, 'historical_data', return_value=historical), \
+             mock.patch.object(collector, '_check_dependencies'):
+            records = collector.get_swap_data('10Y', start_date=datetime(2024, 1, 1))
+        
+        assert [record['maturity_years'] for record in records] == [10.0, 10.0]
+        assert collector._maturity_to_years('7Y') == 0.0
+        
+        print("✅ Swap maturity years mapped")
 
 
 class TestIndexLinkedGiltCollector:
@@ -657,6 +759,141 @@ class TestCorporateBondCollector:
             assert company_name == expected_company, f"Expected {expected_company}, got {company_name}"
         
         print("✅ Company name extraction logic validated")
+    
+    def test_corporate_bond_table_parsing_from_page_source(self):
+        """Test corporate bond rows are parsed from a single page_source snapshot."""
+        from unittest import mock
+        import data_collectors.gilt_market_data as gilt_market_data
+        
+        page_source = """<html><body><table>
+        <tr><th>Issuer</th><th>Coupon (%)</th><th>Maturity</th><th>Price</th><th>Actions</th><th>Rating</th></tr>
+        <tr><td><a href="/shares/shares-search-results/B7654321">Vodafone 4.875% 2030</a> GB00B7654321</td>
+            <td>4.875</td><td>3 December 2030</td><td> 98.25 </td><td><a title="Deal">Deal</a></td><td>BBB</td></tr>
+        <tr><td><a href="/shares/shares-search-results/C1111111">Blocked Co 5% 2031</a></td>
+            <td>5</td><td>1 January 2031</td><td>99</td><td><button title="Online dealing is not available">x</button></td></tr>
+        </table></body></html>"""
+        driver = mock.MagicMock(page_source=page_source)
+        
+        collector = CorporateBondCollector(database_url=None)
+        with mock.patch.object(gilt_market_data.webdriver, 'Chrome', return_value=driver), \
+             mock.patch.object(collector, '_get_chrome_service', return_value=None), \
+             mock.patch.object(gilt_market_data.time, 'sleep'):
+            try:
+                bonds = collector.scrape_corporate_bond_prices()
+            finally:
+                gilt_market_data.close_hl_driver_pools()
+        
+        assert len(bonds) == 1, "Non-tradeable bond should be filtered out"
+        bond = bonds[0]
+        assert bond['bond_name'] == "Vodafone 4.875% 2030"
+        assert bond['clean_price'] == 98.25
+        assert bond['maturity_date'] == datetime(2030, 12, 3)
+        assert bond['credit_rating'] == "BBB"
+        assert bond['isin'] == "GB00B7654321"
+        assert bond['short_code'] == "B7654321"
+        assert bond['ytm'] is not None
+        
+        print("✅ Corporate bond table parsed from page source")
+    
+    def test_chrome_session_reused_between_scrapes(self):
+        """Test HL scrapes reuse one pooled Chrome session and recycle it after failures."""
+        from unittest import mock
+        import data_collectors.gilt_market_data as gilt_market_data
+        
+        driver = mock.MagicMock(page_source="<html><body><table><tr><th>Issuer</th></tr></table></body></html>")
+        
+        collector = CorporateBondCollector(database_url=None)
+        with mock.patch.object(gilt_market_data.webdriver, 'Chrome', return_value=driver) as chrome, \
+             mock.patch.object(collector, '_get_chrome_service', return_value=None), \
+             mock.patch.object(gilt_market_data.time, 'sleep'):
+            try:
+                collector.scrape_corporate_bond_prices()
+                collector.scrape_corporate_bond_prices()
+                assert chrome.call_count == 1, "Second scrape should reuse the pooled Chrome session"
+                driver.quit.assert_not_called()
+                
+                # A failed scrape quits the session instead of returning it to the pool
+                driver.get.side_effect = Exception("page load failed")
+                with pytest.raises(RuntimeError):
+                    collector.scrape_corporate_bond_prices()
+                driver.quit.assert_called_once()
+                assert gilt_market_data.CorporateBondCollector._driver_pool.empty()
+            finally:
+                gilt_market_data.close_hl_driver_pools()
+        
+        print("✅ Chrome session pooled across corporate bond scrapes")
+    
+    def test_table_wait_falls_back_on_timeout(self):
+        """Test the table wait returns as soon as cells exist and only sleeps briefly on timeout."""
+        from unittest import mock
+        from selenium.common.exceptions import NoSuchElementException
+        import data_collectors.gilt_market_data as gilt_market_data
+        
+        collector = CorporateBondCollector(database_url=None)
+        
+        with mock.patch.object(gilt_market_data.time, 'sleep') as sleep:
+            collector._wait_for_table(mock.MagicMock())
+            sleep.assert_not_called()
+            
+            driver = mock.MagicMock()
+            driver.find_element.side_effect = NoSuchElementException()
+            with mock.patch.object(gilt_market_data, 'TABLE_WAIT_TIMEOUT', 0):
+                collector._wait_for_table(driver)
+            sleep.assert_any_call(1)
+        
+        print("✅ Table wait replaces the fixed 7 second sleep")
+    
+    def test_chromedriver_resolved_once_per_process(self):
+        """Test ChromeDriver lookup is cached across collector instances and LD_LIBRARY_PATH is set once."""
+        from unittest import mock
+        import data_collectors.gilt_market_data as gilt_market_data
+        
+        shared = {'/shared/usr/bin/chromedriver', '/shared/usr/lib', '/shared/usr/bin/chromium'}
+        gilt_market_data._resolve_chromedriver.cache_clear()
+        try:
+            with mock.patch.object(gilt_market_data.os.path, 'exists', side_effect=lambda p: p in shared) as exists, \
+                 mock.patch.dict(gilt_market_data.os.environ, {'LD_LIBRARY_PATH': '/opt/lib'}), \
+                 mock.patch.object(gilt_market_data, 'Service', side_effect=lambda path: path):
+                for collector_class in (GiltMarketCollector, CorporateBondCollector, GiltMarketCollector):
+                    collector = collector_class(database_url=None)
+                    collector._arch, collector._system = 'aarch64', 'Linux'
+                    assert collector._get_chrome_service() == '/shared/usr/bin/chromedriver'
+                    assert collector.chrome_options.binary_location == '/shared/usr/bin/chromium'
+                probes = exists.call_count
+                
+                # Prepending is idempotent even if the resolver runs again
+                gilt_market_data._prepend_ld_library_path(['/shared/usr/lib'])
+                assert gilt_market_data.os.environ['LD_LIBRARY_PATH'] == '/shared/usr/lib:/opt/lib'
+            
+            assert gilt_market_data._resolve_chromedriver.cache_info().misses == 1
+            assert probes == 6, "Filesystem should only be probed by the first collector"
+        finally:
+            gilt_market_data._resolve_chromedriver.cache_clear()
+        
+        print("✅ ChromeDriver path cached across collectors")
+    
+    def test_hl_maturity_date_parsing(self):
+        """Test fast month-name parsing of HL maturity dates."""
+        assert _parse_hl_date("3 December 2032") == datetime(2032, 12, 3)
+        assert _parse_hl_date("30 september 2026") == datetime(2026, 9, 30)
+        assert _parse_hl_date("22 Mar 2026") == datetime(2026, 3, 22)
+        
+        # Anything else falls back to the caller's slower parsing
+        assert _parse_hl_date("31 February 2030") is None
+        assert _parse_hl_date("2030") is None
+        assert _parse_hl_date("n/a") is None
+        assert _parse_hl_date("22/03/2026") is None
+        assert _parse_hl_date("22 Mar 26") is None
+        
+        # Gilt collector's parser takes the fast paths first, then the strptime formats
+        collector = GiltMarketCollector(database_url=None)
+        assert collector.parse_maturity_date(" 22 Mar 2026 ") == datetime(2026, 3, 22)
+        assert collector.parse_maturity_date("Jul 2025") == datetime(2025, 7, 1)
+        assert collector.parse_maturity_date("22/03/2026") == datetime(2026, 3, 22)
+        assert collector.parse_maturity_date("2026-03-22") == datetime(2026, 3, 22)
+        assert collector.parse_maturity_date("Mar 26") is None
+        
+        print("✅ HL maturity date parsing validated")
 
 
 class TestBondMarketIntegration:
@@ -7,8 +7,11 @@ and populates the uk_inflation database tables with CPI, CPIH, and RPI data.
 
 import pytest
 import pandas as pd
+import numpy as np
+import requests
 import os
 
+from data_collectors import uk_inflation_data
 from data_collectors.uk_inflation_data import UKInflationCollector, collect_uk_inflation_data
 
 
@@ -28,7 +31,7 @@ class TestUKInflationDataIntegration:
         
         # For testing, we'll manually load the local file and test the parsing logic
         # Read the file and validate series detection
-        df = pd.read_csv(csv_path, header=None, low_memory=False)
+        df = collector.read_mm23_file(csv_path)
         columns = collector.find_series_columns(df)
         
         # Validate CPI series
@@ -129,5 +132,552 @@ class TestUKInflationDataIntegration:
         # validate the critical parsing logic for partial matches and Level 4 data
 
 
+
+def _synthetic_mm23_header():
+    """Header row in the MM23 layout: headline, 13 Level 1 categories, a few sub-categories."""
+    headers = ["Title", "RPI All Items Index: Jan 1987=100"]
+    headers += ["CPI WEIGHTS 00: Overall", "CPIH WEIGHTS 00: Overall"]
+    for series in ("CPI", "CPIH"):
+        headers.append(f"{series} INDEX 00: ALL ITEMS 2015=100")
+        for level1 in range(1, 13):
+            code = f"{level1:02d}"
+            headers.append(f"{series} INDEX {code} : Level one {code} 2015=100")
+            headers.append(f"{series} INDEX {code}.1.1.1 Sub category 2015=100")
+            headers.append(f"{series} WEIGHTS {code}.1.1.1 : Level four weight")
+            headers.append(f"{series} WEIGHTS {code} : Level one weight")
+    return headers
+
+
+class TestUKInflationColumnDiscovery:
+    """Tests for header column discovery on a synthetic MM23 frame."""
+    
+    def test_header_patterns_compiled_once_across_runs(self):
+        """Test a second column discovery reuses the compiled per-code patterns."""
+        headers = _synthetic_mm23_header()
+        df = pd.DataFrame([headers])
+        first = UKInflationCollector(database_url=None).find_series_columns(df)
+        
+        misses = uk_inflation_data._compile_header_pattern.cache_info().misses
+        second = UKInflationCollector(database_url=None).find_series_columns(pd.DataFrame([headers]))
+        
+        assert second == first
+        assert uk_inflation_data._compile_header_pattern.cache_info().misses == misses
+    
+    def test_header_text_search_maps_match_to_its_column(self):
+        """Test the joined-header search returns the same column as a per-column containment scan."""
+        headers = _synthetic_mm23_header() + ["", "RPI All Items Index: Jan 1987=100 (alt)"]
+        df = pd.DataFrame([headers])
+        collector = UKInflationCollector(database_url=None)
+        
+        for text in ("RPI All Items Index: Jan 1987=100", "Title", "CPIH WEIGHTS 12", "weight", "(alt)", "Missing header"):
+            expected = next((i for i, header in enumerate(headers) if text in header), None)
+            assert collector.find_column_by_header_text(df, text) == expected
+    
+    def test_series_columns_looked_up_by_exact_code(self):
+        """Test every series column is found by exact COICOP code, without sweeping the header row."""
+        from unittest import mock
+        
+        headers = _synthetic_mm23_header()
+        # A sub-category listed before its parent must not be taken for the parent
+        headers.insert(2, "CPI INDEX 05.1.1.1 Early sub category 2015=100")
+        df = pd.DataFrame([headers, [None] * len(headers)])
+        collector = UKInflationCollector(database_url=None)
+        
+        with mock.patch.object(collector, 'find_column_by_regex') as full_scan:
+            columns = collector.find_series_columns(df)
+        
+        full_scan.assert_not_called()
+        for series in ("CPI", "CPIH"):
+            assert columns[series]['indices']['00'] == headers.index(f"{series} INDEX 00: ALL ITEMS 2015=100")
+            assert columns[series]['weights']['00'] == headers.index(f"{series} WEIGHTS 00: Overall")
+            for level1 in range(1, 13):
+                code = f"{level1:02d}"
+                assert columns[series]['indices'][code] == headers.index(f"{series} INDEX {code} : Level one {code} 2015=100")
+                assert columns[series]['weights'][code] == headers.index(f"{series} WEIGHTS {code} : Level one weight")
+                assert columns[series]['weights'][f"{code}.1.1.1"] == headers.index(f"{series} WEIGHTS {code}.1.1.1 : Level four weight")
+        assert df.iloc[0, columns['CPI']['indices']['05.1.1.1']] == "CPI INDEX 05.1.1.1 Early sub category 2015=100"
+        assert columns['RPI']['indices']['00'] == 1
+    
+    def test_coicop_codes_and_descriptions_from_headers(self):
+        """Test COICOP codes, levels and descriptions are classified in one pass over the header row."""
+        headers = _synthetic_mm23_header() + [
+            "CPIH INDEX 04.2 : OWNER OCCUPIERS' HOUSING  COSTS 2015=100",
+            "CPIH INDEX 04.2 : Later duplicate 2015=100",
+            "CPI INDEX 07.1.1A NEW CARS 2015=100",
+            "CPIH INDEX 07.1.1A Cars (CPIH wording) 2015=100",
+            "CPI INDEX 07.1.1A New  cars 2015=100",
+            "CPI ANNUAL RATE 00: ALL ITEMS 2015=100",
+        ]
+        df = pd.DataFrame([headers])
+        collector = UKInflationCollector(database_url=None)
+        
+        codes = collector.extract_all_coicop_codes(df)
+        assert codes['00'] == 1
+        assert codes['04.2'] == 2
+        assert codes['07.1.1A'] == 3
+        assert codes['12.1.1.1'] == 4
+        assert all(type(level) is int for level in codes.values())
+        
+        descriptions = collector.extract_coicop_descriptions_from_headers(df)
+        assert descriptions['00'] == "ALL ITEMS"
+        assert descriptions['04.2'] == "OWNER OCCUPIERS' HOUSING COSTS"
+        assert descriptions['07.1.1'] == "A New cars"
+    
+    def test_header_cache_released_after_collection(self):
+        """Test the cached header row is reused within a run and released when the run ends."""
+        from unittest import mock
+        
+        df = pd.DataFrame([_synthetic_mm23_header() + [None]])
+        collector = UKInflationCollector(database_url=None)
+        headers, _ = collector._get_header_index(df)
+        assert collector._get_header_index(df)[0] is headers
+        assert headers[-1] == "None"
+        
+        with mock.patch.object(collector, 'load_mm23_frame', return_value=df), \
+             mock.patch.object(collector, 'find_series_columns', side_effect=ValueError("bad header")):
+            with pytest.raises(ValueError):
+                collector.collect_inflation_data()
+        
+        assert collector._header_cache is None
+        assert collector._year_rows_cache is None
+    
+    def test_sort_order_packs_three_digits_per_part(self):
+        """Test COICOP sort orders pack each part into three digits, non-numeric parts as zero, six parts at most."""
+        collector = UKInflationCollector(database_url=None)
+        
+        assert collector.calculate_sort_order('00') == 0
+        assert collector.calculate_sort_order('04.2') == 4002
+        assert collector.calculate_sort_order('07.1.1A') == 7001000
+        assert collector.calculate_sort_order('12.5.4.1') == 12005004001
+        assert collector.calculate_sort_order('1.2.3.4.5.6.7') == 1002003004005006
+        assert collector.calculate_sort_order('') == 0
+    
+    def test_missing_parents_found_through_every_level(self):
+        """Test each absent ancestor is generated once, with its level, however deep the gap."""
+        collector = UKInflationCollector(database_url=None)
+        coicop_codes = {'00': 0, '04': 1, '04.2.1.1': 4, '04.2.1.2': 4, '07.1.1': 3, '09.1': 2}
+        
+        missing = collector._identify_missing_parents(coicop_codes)
+        
+        assert missing == {'04.2.1': 3, '07.1': 2, '09': 1, '04.2': 2, '07': 1}
+    
+    def test_parent_weights_summed_from_deepest_level_up(self):
+        """Test auto-generated parents get their children's summed weights, including nested parents."""
+        hierarchy_records = [
+            {'coicop_id': '04', 'parent_id': None, 'level': 1},
+            {'coicop_id': '04.2', 'parent_id': '04', 'level': 2},
+            {'coicop_id': '04.2.1', 'parent_id': '04.2', 'level': 3},
+            {'coicop_id': '04.2.1.1', 'parent_id': '04.2.1', 'level': 4},
+            {'coicop_id': '04.2.1.2', 'parent_id': '04.2.1', 'level': 4},
+            {'coicop_id': '04.2.2', 'parent_id': '04.2', 'level': 3},
+            {'coicop_id': '04.9', 'parent_id': '04', 'level': 2},
+            {'coicop_id': '04.9.1', 'parent_id': '04.9', 'level': 3},
+        ]
+        weights_by_series = {
+            'CPI': {
+                '04': {2023: 150.0},
+                '04.2.1.1': {2023: 10.0, 2024: 11.0},
+                '04.2.1.2': {2023: 5.0},
+                '04.2.2': {2023: 2.5, 2024: 3.0},
+            },
+            'CPIH': {},
+        }
+        
+        collector = UKInflationCollector(database_url=None)
+        result = collector._calculate_parent_weights(weights_by_series, hierarchy_records)
+        
+        cpi = result['CPI']
+        assert cpi['04.2.1'] == {2023: 15.0, 2024: 11.0}
+        assert cpi['04.2'] == {2023: 17.5, 2024: 14.0}
+        assert cpi['04'] == {2023: 150.0}  # Categories with direct weights are left alone
+        assert '04.9' not in cpi  # No child has weights
+        assert result['CPIH'] == {}
+    
+    def test_monthly_and_weight_rows_parsed_vectorised(self):
+        """Test monthly and annual weight rows are picked out of the first column without row scans."""
+        rows = [
+            ["Title", "CPI WEIGHTS 00: Overall"],
+            ["1989", "900"],
+            ["2023", "1000"],
+            [" 2024 ", "2001"],
+            ["2025", "x"],
+            ["2026", None],
+            ["2024 Q1", "5"],
+            ["2024 JAN", "130.1"],
+            ["2024  feb", "130.5"],
+            ["2024 JANUARY", "131.0"],
+            ["2023", "999.5"],
+            [None, None],
+        ]
+        df = pd.DataFrame(rows)
+        collector = UKInflationCollector(database_url=None)
+        
+        assert collector.extract_monthly_data(df) == [7, 8]
+        
+        weights = collector.parse_weight_data(df, 1, "CPI 00")
+        assert weights == {2023: 999.5}
+        assert all(type(year) is int and type(weight) is float for year, weight in weights.items())
+        assert collector.parse_weight_data(df, None, "CPI 00") == {}
+    
+    def test_monthly_row_labels(self):
+        """Test only "YYYY MON" labels (any whitespace, any case) are taken as monthly rows."""
+        labels = [
+            "2024 JAN", "2024 jan", "2024  Feb", "2024\tDEC", "1988 SEP", "2024 Q1", "2024",
+            "2024 JANUARY", "2024JAN", "24 JAN", "2024 JA", "2024 XYZ", "2024 JAN 1",
+            "CDID", "nan", "", "Release Date", "2O24 JAN", "2024 J\u00c4N",
+        ]
+        df = pd.DataFrame({0: labels})
+        
+        collector = UKInflationCollector(database_url=None)
+        assert collector.extract_monthly_data(df) == [0, 1, 2, 3, 4]
+    
+    def test_mm23_streamed_without_temp_file(self, tmp_path, monkeypatch):
+        """Test MM23 is parsed straight from the response stream, keeping only header, annual and monthly rows."""
+        from unittest import mock
+        
+        monkeypatch.setenv("MM23_CACHE_DIR", str(tmp_path / "mm23"))
+        
+        csv_body = (
+            "Title,CPI INDEX 00: ALL ITEMS 2015=100,CPI WEIGHTS 00: Overall\n"
+            "CDID,D7BT,CHZQ\n"
+            "Release Date,15-01-2025,15-01-2025\n"
+            "2023,126.3,1000\n"
+            "2023 Q4,131.0,\n"
+            "2023 DEC,131.5,\n"
+            "2024,133.9,1000\n"
+            "2024 JAN,131.5,\n"
+        ).encode()
+        
+        collector = UKInflationCollector(database_url=None)
+        collector.session = mock.MagicMock()
+        response = collector.session.get.return_value.__enter__.return_value
+        # Blocks split mid-row, as network reads do
+        response.iter_content.return_value = iter([csv_body[:50], csv_body[50:120], csv_body[120:]])
+        
+        with mock.patch('tempfile.NamedTemporaryFile') as temp_file:
+            df = collector.load_mm23_frame(chunksize=3)
+        
+        temp_file.assert_not_called()
+        assert collector.session.get.call_args.kwargs["stream"] is True
+        assert df.iloc[:, 0].tolist() == ["Title", "2023", "2023 DEC", "2024", "2024 JAN"]
+        assert collector.extract_monthly_data(df) == [2, 4]
+        assert collector.parse_weight_data(df, 2, "CPI 00") == {2023: 1000.0, 2024: 1000.0}
+
+    
+    def test_mm23_parsed_for_series_columns_only(self, tmp_path, monkeypatch):
+        """Test columns the collector never reads are skipped, and kept ones retain their MM23 position."""
+        from unittest import mock
+        
+        monkeypatch.setenv("MM23_CACHE_DIR", str(tmp_path / "mm23"))
+        
+        csv_body = (
+            "Title,CPI ANNUAL RATE 00: ALL ITEMS,CPI INDEX 00: ALL ITEMS 2015=100,"
+            "PPI INPUT,RPI All Items Index: Jan 1987=100,CPI WEIGHTS 00: Overall\n"
+            "CDID,D7G7,D7BT,K646,CHAW,CHZQ\n"
+            "2024,2.5,133.9,101.2,370.1,1000\n"
+            "2024 JAN,4.0,131.5,100.8,364.7,\n"
+        ).encode()
+        
+        collector = UKInflationCollector(database_url=None)
+        collector.session = mock.MagicMock()
+        response = collector.session.get.return_value.__enter__.return_value
+        response.iter_content.return_value = iter([csv_body])
+        df = collector.load_mm23_frame()
+        
+        assert df.columns.tolist() == [0, 2, 4, 5]
+        assert df.iloc[:, 0].tolist() == ["Title", "2024", "2024 JAN"]
+        assert collector.find_column_by_header_text(df, "RPI All Items Index: Jan 1987=100") == 2
+        assert df.iloc[2, 1] == "131.5"
+        assert collector.parse_weight_data(df, 3, "CPI 00") == {2024: 1000.0}
+    
+    def test_price_records_built_from_non_empty_index_cells(self):
+        """Test price records cover every parsed index cell, in month/series/category order, with that year's weight."""
+        from datetime import date
+        
+        df = pd.DataFrame([
+            ["Title", "CPI INDEX 00: ALL ITEMS", "CPI INDEX 01 : Food", "RPI All Items Index: Jan 1987=100"],
+            ["2024", None, None, None],
+            ["2024 JAN", "131.5", "x", "364.7"],
+            ["2024  feb", " 132.1 ", "140.0", None],
+        ])
+        df.columns = [0, 4, 6, 9]  # Positions in the full CSV
+        columns = {
+            'CPI': {'indices': {'00': 1, '01': 2}, 'weights': {}},
+            'CPIH': {'indices': {'04.2': None}, 'weights': {}},
+            'RPI': {'indices': {'00': 3}, 'weights': {}},
+        }
+        weights_by_series = {'CPI': {'00': {2024: 1000.0}}, 'CPIH': {}}
+        
+        collector = UKInflationCollector(database_url=None)
+        records = collector._build_price_data_records(df, columns, weights_by_series, [2, 3])
+        
+        assert records == [
+            (date(2024, 1, 1), '00', 'CPI', 131.5, 1000.0, 5),
+            (date(2024, 1, 1), '00', 'RPI', 364.7, None, 10),
+            (date(2024, 2, 1), '00', 'CPI', 132.1, 1000.0, 5),
+            (date(2024, 2, 1), '01', 'CPI', 140.0, None, 7),
+        ]
+    
+    def test_float_matrix_conversion_with_and_without_text_cells(self):
+        """Test MM23 cells convert to floats in bulk, with non-numeric text becoming NaN."""
+        numeric = np.array([["131.5", None], [" 132.1 ", np.nan]], dtype=object)
+        with_text = np.array([["131.5", "x"], [None, "140.0"]], dtype=object)
+        
+        np.testing.assert_array_equal(
+            uk_inflation_data._to_float_matrix(numeric), [[131.5, np.nan], [132.1, np.nan]]
+        )
+        np.testing.assert_array_equal(
+            uk_inflation_data._to_float_matrix(with_text), [[131.5, np.nan], [np.nan, 140.0]]
+        )
+    
+    @pytest.mark.skipif(uk_inflation_data.pacsv is None, reason="pyarrow not installed")
+    def test_mm23_arrow_reader_matches_pandas_parser(self, tmp_path, monkeypatch):
+        """Test the pyarrow CSV path gives the same filtered frame as pandas' parser."""
+        from unittest import mock
+        
+        monkeypatch.setenv("MM23_CACHE_DIR", str(tmp_path / "mm23"))
+        
+        csv_body = (
+            "Title,CPI INDEX 00: ALL ITEMS 2015=100,PPI INPUT,CPI WEIGHTS 00: Overall\n"
+            "CDID,D7BT,K646,CHZQ\n"
+            "2024,133.9,101.2,1000\n"
+            "2024 Q1,132.0,101.0,\n"
+            "2024 JAN,131.5,100.8,\n"
+        ).encode()
+        
+        def parse():
+            collector = UKInflationCollector(database_url=None)
+            collector.session = mock.MagicMock()
+            response = collector.session.get.return_value.__enter__.return_value
+            response.iter_content.return_value = iter([csv_body])
+            return collector.load_mm23_frame()
+        
+        arrow = parse()
+        monkeypatch.setattr(uk_inflation_data, "pacsv", None)
+        pd.testing.assert_frame_equal(arrow, parse(), check_dtype=False)
+        assert arrow.columns.tolist() == [0, 1, 3]
+    
+    def test_local_mm23_file_read_as_strings(self, tmp_path, monkeypatch):
+        """Test a local MM23 file reads the same, all strings, with and without the pyarrow engine."""
+        csv_path = tmp_path / "mm23.csv"
+        csv_path.write_text("Title,CPI INDEX 00: ALL ITEMS 2015=100\nCDID,D7BT\n2024,133.9\n2024 JAN,\n")
+        collector = UKInflationCollector(database_url=None)
+        
+        df = collector.read_mm23_file(str(csv_path))
+        monkeypatch.setattr(uk_inflation_data, "pacsv", None)
+        fallback = collector.read_mm23_file(str(csv_path))
+        
+        pd.testing.assert_frame_equal(df, fallback, check_dtype=False)
+        assert df.iloc[:, 0].tolist() == ["Title", "CDID", "2024", "2024 JAN"]
+        assert df.iloc[2, 1] == "133.9"
+    
+    def test_local_mm23_file_parses_series_columns_only(self, tmp_path):
+        """Test a local MM23 file keeps only the label and series columns, labelled by CSV position."""
+        csv_path = tmp_path / "mm23.csv"
+        csv_path.write_text(
+            "Title,PPI INPUT,CPI INDEX 00: ALL ITEMS 2015=100,CPI WEIGHTS 00: Overall\n"
+            "CDID,K646,D7BT,CHZQ\n"
+            "2024,101.2,133.9,1000\n"
+        )
+        collector = UKInflationCollector(database_url=None)
+        
+        df = collector.read_mm23_file(str(csv_path))
+        
+        assert df.columns.tolist() == [0, 2, 3]
+        assert df.iloc[2].tolist() == ["2024", "133.9", "1000"]
+    
+    def test_mm23_download_error_raised_to_parser(self, tmp_path, monkeypatch):
+        """Test a connection dropped mid-download fails the streamed parse instead of truncating it."""
+        from unittest import mock
+        
+        monkeypatch.setenv("MM23_CACHE_DIR", str(tmp_path / "mm23"))
+        
+        def blocks(size):
+            yield b"Title,CPI INDEX 00: ALL ITEMS 2015=100\n2024,133.9\n"
+            raise requests.exceptions.ConnectionError("connection reset")
+        
+        collector = UKInflationCollector(database_url=None)
+        collector.session = mock.MagicMock()
+        response = collector.session.get.return_value.__enter__.return_value
+        response.iter_content.side_effect = blocks
+        
+        with pytest.raises(requests.exceptions.ConnectionError):
+            collector.load_mm23_frame()
+    
+    def test_unchanged_mm23_loaded_from_cache(self, tmp_path, monkeypatch):
+        """Test a 304 for MM23 reuses the frame parsed on the last download instead of re-parsing."""
+        from unittest import mock
+        
+        monkeypatch.setenv("MM23_CACHE_DIR", str(tmp_path / "mm23"))
+        csv_body = (
+            "Title,CPI INDEX 00: ALL ITEMS 2015=100\n"
+            "CDID,D7BT\n"
+            "2024,133.9\n"
+            "2024 JAN,131.5\n"
+        ).encode()
+        
+        collector = UKInflationCollector(database_url=None)
+        collector.session = mock.MagicMock()
+        response = collector.session.get.return_value.__enter__.return_value
+        response.status_code = 200
+        response.headers = {"ETag": '"mm23-v1"', "Last-Modified": "Wed, 15 Jan 2025 07:00:00 GMT"}
+        response.iter_content.return_value = iter([csv_body])
+        first = collector.load_mm23_frame()
+        
+        response.status_code = 304
+        with mock.patch.object(collector, '_iter_csv_frames') as parse:
+            second = collector.load_mm23_frame()
+        
+        parse.assert_not_called()
+        sent = collector.session.get.call_args.kwargs["headers"]
+        assert sent == {"If-None-Match": '"mm23-v1"', "If-Modified-Since": "Wed, 15 Jan 2025 07:00:00 GMT"}
+        pd.testing.assert_frame_equal(second, first)
+        assert second.iloc[:, 0].tolist() == ["Title", "2024", "2024 JAN"]
+        assert sorted(os.listdir(tmp_path / "mm23")) == ["mm23.json", "mm23_frame.csv"]
+        assert os.stat(tmp_path / "mm23").st_mode & 0o777 == 0o700
+    
+    def test_shared_mm23_cache_directory_not_used(self, tmp_path, monkeypatch):
+        """Test a cache directory other users can write to is neither read nor written."""
+        from unittest import mock
+        
+        cache_dir = tmp_path / "mm23"
+        cache_dir.mkdir()
+        cache_dir.chmod(0o777)
+        (cache_dir / "mm23.json").write_bytes(b'{"etag": "planted"}')
+        (cache_dir / "mm23_frame.csv").write_text("0\nplanted\n")
+        monkeypatch.setenv("MM23_CACHE_DIR", str(cache_dir))
+        
+        collector = UKInflationCollector(database_url=None)
+        response = mock.MagicMock(headers={"ETag": '"mm23-v1"'})
+        
+        assert collector._load_cached_frame() == (None, None)
+        collector._save_cached_frame(response, pd.DataFrame([["Title"]]))
+        assert (cache_dir / "mm23_frame.csv").read_text() == "0\nplanted\n"
+
+
+
+class TestUKInflationDatabaseWrites:
+    """Tests for the statements sent when writing MM23 data."""
+    
+    def test_hierarchy_written_in_one_batched_statement(self):
+        """Test the COICOP hierarchy is upserted with one execute_values call, parents first."""
+        from unittest import mock
+        
+        headers = _synthetic_mm23_header()
+        df = pd.DataFrame([headers])
+        collector = UKInflationCollector(database_url=None)
+        conn = mock.MagicMock()
+        
+        with mock.patch.object(uk_inflation_data, 'execute_values') as execute_values:
+            inserted = collector.populate_coicop_hierarchy(conn, df)
+        
+        execute_values.assert_called_once()
+        cursor, sql, rows = execute_values.call_args.args
+        assert cursor is conn.cursor.return_value
+        assert "VALUES %s" in sql and "ON CONFLICT (coicop_id)" in sql
+        assert "IS DISTINCT FROM" in sql
+        assert inserted == len(rows)
+        levels = [row[1] for row in rows]
+        assert levels == sorted(levels)
+        cursor.execute.assert_not_called()
+        conn.commit.assert_called_once()
+    
+    def test_collection_extracts_hierarchy_once(self):
+        """Test one collection run extracts COICOP codes and descriptions once and reuses them for the hierarchy."""
+        from unittest import mock
+        
+        headers = _synthetic_mm23_header()
+        df = pd.DataFrame([
+            headers,
+            ["2024"] + ["10.0"] * (len(headers) - 1),
+            ["2024 JAN"] + ["130.0"] * (len(headers) - 1),
+        ])
+        collector = UKInflationCollector(database_url=None)
+        
+        with mock.patch.object(collector, 'load_mm23_frame', return_value=df), \
+             mock.patch.object(collector, 'extract_all_coicop_codes', wraps=collector.extract_all_coicop_codes) as codes, \
+             mock.patch.object(collector, 'extract_coicop_descriptions_from_headers',
+                               wraps=collector.extract_coicop_descriptions_from_headers) as descriptions:
+            records = collector.collect_inflation_data()
+        
+        assert records == len(collector.find_series_columns(df)['CPI']['indices']) * 2 + 1
+        codes.assert_called_once()
+        descriptions.assert_called_once()
+    
+    def test_collection_writes_in_one_transaction(self):
+        """Test the hierarchy and price data of a run are committed together, once."""
+        from unittest import mock
+        
+        headers = _synthetic_mm23_header()
+        df = pd.DataFrame([
+            headers,
+            ["2024"] + ["10.0"] * (len(headers) - 1),
+            ["2024 JAN"] + ["130.0"] * (len(headers) - 1),
+        ])
+        conn = mock.MagicMock()
+        collector = UKInflationCollector(database_url="postgresql://unused")
+        
+        with mock.patch.object(collector, 'get_db_connection', return_value=conn), \
+             mock.patch.object(collector, 'load_mm23_frame', return_value=df), \
+             mock.patch.object(uk_inflation_data, 'execute_values'):
+            collector.collect_inflation_data()
+        
+        deferred = conn.cursor.return_value.__enter__.return_value
+        deferred.execute.assert_called_once_with("SET CONSTRAINTS ALL DEFERRED")
+        conn.commit.assert_called_once()
+        conn.close.assert_called_once()
+    
+    def test_db_connection_opened_during_download(self):
+        """Test the database connection is opened alongside the MM23 download and returned if the run fails."""
+        import threading
+        from unittest import mock
+        
+        connected = threading.Event()
+        conn = mock.MagicMock()
+        
+        def connect():
+            connected.set()
+            return conn
+        
+        def download():
+            # Only completes if the connection is being opened at the same time
+            assert connected.wait(timeout=5)
+            raise requests.exceptions.ConnectionError("connection reset")
+        
+        collector = UKInflationCollector(database_url="postgresql://unused")
+        with mock.patch.object(collector, 'get_db_connection', side_effect=connect), \
+             mock.patch.object(collector, 'load_mm23_frame', side_effect=download):
+            with pytest.raises(requests.exceptions.ConnectionError):
+                collector.collect_inflation_data()
+        
+        conn.close.assert_called_once()
+    
+    def test_price_data_sent_as_column_arrays_in_batches(self, monkeypatch):
+        """Test price records are upserted through unnest column arrays, no temp table, in fixed-size batches."""
+        from datetime import date
+        from unittest import mock
+        
+        monkeypatch.setattr(uk_inflation_data, "PRICE_DATA_BATCH_SIZE", 2)
+        records = [
+            (date(2024, month, 1), '00', 'CPI', 130.0 + month, 1000.0 if month < 3 else None, 3)
+            for month in range(1, 6)
+        ]
+        conn = mock.MagicMock()
+        cursor = conn.cursor.return_value
+        cursor.rowcount = 2
+        
+        UKInflationCollector(database_url=None).bulk_insert_price_data(conn, records)
+        
+        sql = [call.args[0] for call in cursor.execute.call_args_list]
+        assert len(sql) == 3
+        assert all("unnest(" in statement and "TEMP" not in statement for statement in sql)
+        params = [call.args[1] for call in cursor.execute.call_args_list]
+        assert [len(batch[0]) for batch in params] == [2, 2, 1]
+        assert params[1][4] == [None, None]
+        assert params[2][:4] == ([date(2024, 5, 1)], ['00'], ['CPI'], [135.0])
+        cursor.copy_from.assert_not_called()
+        conn.commit.assert_called_once()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file